@@ -0,0 +1,149 @@
+# helper functions to put street addresses in the standard form of USPS Publication 28 (upper case, no punctuation,
+# abbreviated street suffixes and directionals, unit numbers split off) so the same address written different ways, or
+# with different suites or apartments in the same building, is recognized as one address and only geocoded once
+
+import re
+
+# USPS street suffix abbreviations (Publication 28, appendix C1) for the suffixes and common spellings of them
+street_suffix_abbrevs = {'ALLEY': 'ALY', 'ALLEE': 'ALY', 'ALLY': 'ALY', 'ANNEX': 'ANX', 'ANNX': 'ANX', 'ARCADE': 'ARC',
+                         'AVENUE': 'AVE', 'AV': 'AVE', 'AVEN': 'AVE', 'AVENU': 'AVE', 'AVN': 'AVE', 'AVNUE': 'AVE',
+                         'BAYOU': 'BYU', 'BAYOO': 'BYU', 'BEND': 'BND', 'BLUFF': 'BLF', 'BOTTOM': 'BTM', 'BOT': 'BTM',
+                         'BOTTM': 'BTM', 'BOULEVARD': 'BLVD', 'BOUL': 'BLVD', 'BOULV': 'BLVD', 'BRANCH': 'BR',
+                         'BRNCH': 'BR', 'BRIDGE': 'BRG', 'BRDGE': 'BRG', 'BROOK': 'BRK', 'BYPASS': 'BYP', 'BYPA': 'BYP',
+                         'BYPAS': 'BYP', 'BYPS': 'BYP', 'CANYON': 'CYN', 'CANYN': 'CYN', 'CNYN': 'CYN', 'CAUSEWAY': 'CSWY',
+                         'CAUSWA': 'CSWY', 'CENTER': 'CTR', 'CEN': 'CTR', 'CENT': 'CTR', 'CENTR': 'CTR', 'CENTRE': 'CTR',
+                         'CNTER': 'CTR', 'CNTR': 'CTR', 'CIRCLE': 'CIR', 'CIRC': 'CIR', 'CIRCL': 'CIR', 'CRCL': 'CIR',
+                         'CRCLE': 'CIR', 'CLIFF': 'CLF', 'CLUB': 'CLB', 'COMMON': 'CMN', 'CORNER': 'COR', 'CORNERS': 'CORS',
+                         'COURSE': 'CRSE', 'COURT': 'CT', 'COURTS': 'CTS', 'COVE': 'CV', 'CREEK': 'CRK', 'CRESCENT': 'CRES',
+                         'CRSENT': 'CRES', 'CRSNT': 'CRES', 'CROSSING': 'XING', 'CRSSNG': 'XING', 'CROSSROAD': 'XRD',
+                         'CURVE': 'CURV', 'DALE': 'DL', 'DAM': 'DM', 'DIVIDE': 'DV', 'DIV': 'DV', 'DVD': 'DV',
+                         'DRIVE': 'DR', 'DRIV': 'DR', 'DRV': 'DR', 'ESTATE': 'EST', 'ESTATES': 'ESTS', 'EXPRESSWAY': 'EXPY',
+                         'EXP': 'EXPY', 'EXPR': 'EXPY', 'EXPRESS': 'EXPY', 'EXPW': 'EXPY', 'EXTENSION': 'EXT',
+                         'EXTN': 'EXT', 'EXTNSN': 'EXT', 'FALLS': 'FLS', 'FERRY': 'FRY', 'FRRY': 'FRY', 'FIELD': 'FLD',
+                         'FIELDS': 'FLDS', 'FLAT': 'FLT', 'FLATS': 'FLTS', 'FORD': 'FRD', 'FOREST': 'FRST',
+                         'FORESTS': 'FRST', 'FORGE': 'FRG', 'FORG': 'FRG', 'FORK': 'FRK', 'FORKS': 'FRKS', 'FORT': 'FT',
+                         'FRT': 'FT', 'FREEWAY': 'FWY', 'FREEWY': 'FWY', 'FRWAY': 'FWY', 'FRWY': 'FWY', 'GARDEN': 'GDN',
+                         'GARDN': 'GDN', 'GRDEN': 'GDN', 'GRDN': 'GDN', 'GARDENS': 'GDNS', 'GRDNS': 'GDNS',
+                         'GATEWAY': 'GTWY', 'GATEWY': 'GTWY', 'GATWAY': 'GTWY', 'GTWAY': 'GTWY', 'GLEN': 'GLN',
+                         'GREEN': 'GRN', 'GROVE': 'GRV', 'GROV': 'GRV', 'HARBOR': 'HBR', 'HARB': 'HBR', 'HARBR': 'HBR',
+                         'HRBOR': 'HBR', 'HAVEN': 'HVN', 'HEIGHTS': 'HTS', 'HT': 'HTS', 'HIGHWAY': 'HWY', 'HIGHWY': 'HWY',
+                         'HIWAY': 'HWY', 'HIWY': 'HWY', 'HWAY': 'HWY', 'HILL': 'HL', 'HILLS': 'HLS', 'HOLLOW': 'HOLW',
+                         'HLLW': 'HOLW', 'HOLLOWS': 'HOLW', 'HOLWS': 'HOLW', 'ISLAND': 'IS', 'ISLND': 'IS',
+                         'JUNCTION': 'JCT', 'JCTION': 'JCT', 'JCTN': 'JCT', 'JUNCTN': 'JCT', 'JUNCTON': 'JCT',
+                         'KNOLL': 'KNL', 'KNOL': 'KNL', 'LAKE': 'LK', 'LAKES': 'LKS', 'LANDING': 'LNDG', 'LNDNG': 'LNDG',
+                         'LANE': 'LN', 'LIGHT': 'LGT', 'LOOP': 'LOOP', 'LOOPS': 'LOOP', 'MANOR': 'MNR', 'MEADOW': 'MDW',
+                         'MEADOWS': 'MDWS', 'MEDOWS': 'MDWS', 'MILL': 'ML', 'MISSION': 'MSN', 'MISSN': 'MSN',
+                         'MSSN': 'MSN', 'MOTORWAY': 'MTWY', 'MOUNT': 'MT', 'MNT': 'MT', 'MOUNTAIN': 'MTN', 'MNTAIN': 'MTN',
+                         'MNTN': 'MTN', 'MOUNTIN': 'MTN', 'MTIN': 'MTN', 'ORCHARD': 'ORCH', 'ORCHRD': 'ORCH',
+                         'OVERPASS': 'OPAS', 'PARKWAY': 'PKWY', 'PARKWY': 'PKWY', 'PKWAY': 'PKWY', 'PKY': 'PKWY',
+                         'PARKWAYS': 'PKWY', 'PKWYS': 'PKWY', 'PASSAGE': 'PSGE', 'PIKES': 'PIKE', 'PINE': 'PNE',
+                         'PINES': 'PNES', 'PLACE': 'PL', 'PLAIN': 'PLN', 'PLAINS': 'PLNS', 'PLAZA': 'PLZ', 'PLZA': 'PLZ',
+                         'POINT': 'PT', 'POINTS': 'PTS', 'PORT': 'PRT', 'PRAIRIE': 'PR', 'PRR': 'PR', 'RANCH': 'RNCH',
+                         'RANCHES': 'RNCH', 'RNCHS': 'RNCH', 'RIDGE': 'RDG', 'RDGE': 'RDG', 'RIDGES': 'RDGS',
+                         'RIVER': 'RIV', 'RVR': 'RIV', 'RIVR': 'RIV', 'ROAD': 'RD', 'ROADS': 'RDS', 'ROUTE': 'RTE',
+                         'SHOAL': 'SHL', 'SHORE': 'SHR', 'SHOAR': 'SHR', 'SHORES': 'SHRS', 'SKYWAY': 'SKWY',
+                         'SPRING': 'SPG', 'SPNG': 'SPG', 'SPRNG': 'SPG', 'SPRINGS': 'SPGS', 'SQUARE': 'SQ', 'SQR': 'SQ',
+                         'SQRE': 'SQ', 'SQU': 'SQ', 'STATION': 'STA', 'STATN': 'STA', 'STN': 'STA', 'STRAVENUE': 'STRA',
+                         'STREAM': 'STRM', 'STREME': 'STRM', 'STREET': 'ST', 'STRT': 'ST', 'STR': 'ST', 'STREETS': 'STS',
+                         'SUMMIT': 'SMT', 'SUMIT': 'SMT', 'SUMITT': 'SMT', 'TERRACE': 'TER', 'TERR': 'TER',
+                         'THROUGHWAY': 'TRWY', 'TRACE': 'TRCE', 'TRACES': 'TRCE', 'TRACK': 'TRAK', 'TRACKS': 'TRAK',
+                         'TRK': 'TRAK', 'TRKS': 'TRAK', 'TRAIL': 'TRL', 'TRAILS': 'TRL', 'TRLS': 'TRL', 'TUNNEL': 'TUNL',
+                         'TUNEL': 'TUNL', 'TUNLS': 'TUNL', 'TUNNELS': 'TUNL', 'TUNNL': 'TUNL', 'TURNPIKE': 'TPKE',
+                         'TRNPK': 'TPKE', 'TURNPK': 'TPKE', 'UNDERPASS': 'UPAS', 'UNION': 'UN', 'VALLEY': 'VLY',
+                         'VALLY': 'VLY', 'VLLY': 'VLY', 'VIADUCT': 'VIA', 'VDCT': 'VIA', 'VIADCT': 'VIA', 'VIEW': 'VW',
+                         'VILLAGE': 'VLG', 'VILL': 'VLG', 'VILLAG': 'VLG', 'VILLG': 'VLG', 'VILLIAGE': 'VLG',
+                         'VILLE': 'VL', 'VISTA': 'VIS', 'VIST': 'VIS', 'VST': 'VIS', 'VSTA': 'VIS', 'WALKS': 'WALK',
+                         'WELL': 'WL', 'WELLS': 'WLS'}
+
+# USPS directional abbreviations
+directional_abbrevs = {'NORTH': 'N', 'SOUTH': 'S', 'EAST': 'E', 'WEST': 'W', 'NORTHEAST': 'NE', 'NORTHWEST': 'NW',
+                       'SOUTHEAST': 'SE', 'SOUTHWEST': 'SW'}
+
+# USPS secondary unit designators (Publication 28, appendix C2). The first set is followed by a unit number
+# (ex: 'SUITE 200'), the second is not (ex: 'REAR')
+unit_designator_abbrevs = {'APARTMENT': 'APT', 'APT': 'APT', 'BUILDING': 'BLDG', 'BLDG': 'BLDG', 'DEPARTMENT': 'DEPT',
+                           'DEPT': 'DEPT', 'FLOOR': 'FL', 'FL': 'FL', 'HANGAR': 'HNGR', 'HNGR': 'HNGR', 'KEY': 'KEY',
+                           'LOT': 'LOT', 'PIER': 'PIER', 'ROOM': 'RM', 'RM': 'RM', 'SLIP': 'SLIP', 'SPACE': 'SPC',
+                           'SPC': 'SPC', 'STOP': 'STOP', 'SUITE': 'STE', 'STE': 'STE', 'TRAILER': 'TRLR', 'TRLR': 'TRLR',
+                           'UNIT': 'UNIT', '#': '#'}
+unit_word_abbrevs = {'BASEMENT': 'BSMT', 'BSMT': 'BSMT', 'FRONT': 'FRNT', 'FRNT': 'FRNT', 'LOBBY': 'LBBY',
+                     'LBBY': 'LBBY', 'LOWER': 'LOWR', 'LOWR': 'LOWR', 'OFFICE': 'OFC', 'OFC': 'OFC', 'PENTHOUSE': 'PH',
+                     'PH': 'PH', 'REAR': 'REAR', 'SIDE': 'SIDE', 'UPPER': 'UPPR', 'UPPR': 'UPPR'}
+
+# unit numbers: digits with letters or dashes (ex: '200', '3B', '100-A') or a single letter
+_unit_number_pattern = re.compile(r'^(?=[A-Z0-9-]*\d)[A-Z0-9-]+$|^[A-Z]$')
+
+
+def normalize_address_text(text: str) -> str:
+    """Used to upper case a part of an address and take out its punctuation. Periods and apostrophes are dropped
+    (ex: 'St.' -> 'ST', "O'Connor" -> 'OCONNOR'), other punctuation becomes a space, and '#' is kept as a word of its
+    own.
+
+    Args:
+        text: part of an address. None and missing values are treated as blank.
+
+    Returns:
+        The normalized text, with single spaces between words.
+    """
+    text = '' if text is None or text != text else str(text)
+    text = re.sub(r"[.']", '', text.upper())
+    text = re.sub(r'[^\w\s#/-]', ' ', text).replace('#', ' # ')
+    return ' '.join(text.split())
+
+
+def split_street_unit(street: str) -> tuple[str, str]:
+    """Used to split the unit (suite, apartment, floor, ...) off the end of a street address and put both parts in the
+    USPS standard form: upper case without punctuation, directionals and the street suffix abbreviated
+    (ex: '1201 North Main Street, Suite 200' -> ('1201 N MAIN ST', 'STE 200')).
+
+    Args:
+        street: street address.
+
+    Returns:
+        The normalized street address without its unit and the normalized unit ('' if there was none).
+    """
+    words = normalize_address_text(street).split()
+    units = []
+    # units are taken off the end one at a time (ex: 'BLDG 2 STE 100'). At least one word of the street name has to be
+    # left in front of a unit so street names like 'KEY BLVD' or 'FRONT ST' are not taken for units
+    while len(words) > 2:
+        if words[-2] in unit_designator_abbrevs and _unit_number_pattern.match(words[-1]):
+            unit, rest = [unit_designator_abbrevs[words[-2]], words[-1]], words[:-2]
+        elif words[-1] in ('FLOOR', 'FL') and re.match(r'^\d+(ST|ND|RD|TH)?$', words[-2]):
+            # floors are often written number first (ex: '2ND FLOOR')
+            unit, rest = ['FL', words[-2]], words[:-2]
+        elif words[-1] in unit_word_abbrevs:
+            unit, rest = [unit_word_abbrevs[words[-1]]], words[:-1]
+        elif words[-1] == '#':
+            unit, rest = [], words[:-1]
+        else:
+            break
+        if all(word[0].isdigit() or word in directional_abbrevs or word in directional_abbrevs.values() for word in rest):
+            break
+        units = unit + units
+        words = rest
+
+    # directionals at the start or end of the street name and the street suffix (the last word, or the one before a
+    # directional at the end)
+    first_position = 1 if words and words[0][0].isdigit() else 0
+    if len(words) > first_position + 1 and words[first_position] in directional_abbrevs:
+        words[first_position] = directional_abbrevs[words[first_position]]
+    if len(words) > 2 and words[-1] in directional_abbrevs:
+        words[-1] = directional_abbrevs[words[-1]]
+    suffix_position = len(words) - 2 if len(words) > 3 and words[-1] in directional_abbrevs.values() else len(words) - 1
+    if suffix_position > 1 and words[suffix_position] in street_suffix_abbrevs:
+        words[suffix_position] = street_suffix_abbrevs[words[suffix_position]]
+    return ' '.join(words), ' '.join(units)
+
+
+def normalize_street_address(street: str) -> str:
+    """Used to put a street address in the USPS standard form without its unit (see split_street_unit), so every suite
+    or apartment in a building gets the same address.
+
+    Args:
+        street: street address.
+
+    Returns:
+        The normalized street address.
+    """
+    return split_street_unit(street)[0]
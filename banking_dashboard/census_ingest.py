@@ -0,0 +1,44 @@
+# helper function to read in the census tract (decennial redistricting) csv files
+
+import os
+import pandas as pd
+from geo_keys import format_census_tracts
+
+
+def census_data_ingester(census_file_common_string: str)-> pd.core.frame.DataFrame:
+    """"Takes in url and downloads csv from census tract website. The downloaded csv is then read in as a dataframe 
+    and transformed into a format that can be used for join on future tract years where 'tract','county',and 'state'
+    are the composite primary key.
+        
+    Args:
+        file_name: The name of the downloaded csv file from the census tract website.
+        
+    Returns:
+         A dataframe of the downloaded and transformed zip file
+    """
+    
+    # code to ingest from url to be added
+    #---
+    
+    # transform ingested data
+    census_files = [os.path.join('data', i) for i in os.listdir('data/') if census_file_common_string in i]
+    census_df_list = []
+    for file_name in census_files:
+        data = pd.read_csv(file_name)
+        data = data.T
+        data = data.reset_index()
+        data.columns = data.iloc[0]
+        data['test1'] = data['Label (Grouping)'].str.split(',').to_frame()
+        data[['tract','county','state']] = pd.DataFrame(data['test1'].to_list(), columns = ['tract','county','state'])[['tract','county','state']]
+        data = data.drop(data.index[0])
+        data = data.drop(columns = ['test1'])#, axis = 1)
+        data = data.drop(columns = ['Label (Grouping)'])#, axis = 1)
+        data['tract'] = format_census_tracts(data['tract'].str.replace('Census Tract', '').str.strip().apply(float))
+        data = data.set_index(['tract','county','state'])
+        data.columns = list(data.columns.str.replace(u'\xa0', u' ').str.replace(':','').str.lstrip(' ')) # remove \xa0 Latin1 characters and ":" in column names
+        data = data.replace('[^0-9.]', '', regex = True) # replace commas in entry values with nothing 
+        data = data.apply(pd.to_numeric,downcast = 'float') #convert all count values to floats for later calculations 
+        census_df_list.append(data)
+    census_df = pd.concat(census_df_list).reset_index()   
+    census_df = census_df.rename(columns = lambda x: x.strip()) 
+    return census_df
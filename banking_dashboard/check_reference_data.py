@@ -0,0 +1,37 @@
+# script to check that the reference tables bundled with the repo (reference_data/) agree with each other and are
+# written the way the downloaded tables are, since the ingest functions compare state names from both of them (ex: the
+# sba data is filtered on 'TEXAS') and an offline run uses the bundled copies
+#
+# usage: python check_reference_data.py
+
+import sys
+from reference_data import read_bundled_reference
+
+
+def check_bundled_state_names() -> list[str]:
+    """Used to check that the bundled state abbreviations and fips state names use the same state names.
+
+    Returns:
+        A list of the problems found, empty if the bundled tables agree.
+    """
+    state_names = read_bundled_reference('ssa_state_abbrevs')
+    fips_state_names = read_bundled_reference('fcc_fips')['fcc_states']
+    problems = []
+    if state_names.get('TX') != 'TEXAS' or fips_state_names.get('48') != 'TEXAS':
+        problems.append('texas is ' + repr(state_names.get('TX')) + ' in ssa_state_abbrevs and ' +
+                        repr(fips_state_names.get('48')) + " in fcc_fips, both should be 'TEXAS'")
+    not_upper = sorted(name for name in state_names.values() if name != name.upper())
+    if not_upper:
+        problems.append('state names in ssa_state_abbrevs are not upper case: ' + ', '.join(not_upper))
+    missing = sorted(set(fips_state_names.values()) - set(state_names.values()))
+    if missing:
+        problems.append('fcc_fips state names missing from ssa_state_abbrevs: ' + ', '.join(missing))
+    return problems
+
+
+if __name__ == '__main__':
+    problems = check_bundled_state_names()
+    for problem in problems:
+        print(problem)
+    print('bundled reference data ok' if not problems else str(len(problems)) + ' problem(s) found')
+    sys.exit(1 if problems else 0)
@@ -0,0 +1,972 @@
+# code tables used to replace the codes in the HMDA, CRA, FFIEC, FDIC and SBA datasets with their descriptions, along with
+# the decoder the ingesters use to apply them
+
+import pandas as pd
+import numpy as np
+
+
+# code tables keyed by table name. Each table maps a raw code to its description
+code_tables = {
+    # ffiec census flat file flags
+    'ffiec_principal_city_flag': {
+        0:"not principal city",
+        1:"principal city"
+    },
+    'ffiec_small_county_flag': {
+        "T":"tract record",
+        "S":"small county",
+        "I":"island area"
+    },
+    'ffiec_split_tract_flag': {
+        "N":"tract number occurs within one MA",
+        "S":"split between Mas"
+    },
+    'ffiec_demographic_data_flag': {
+        "X":"Total persons/population or median family income is 0",
+        "D":"total persons/population and median family income are not 0",
+        "I":"Island Area"
+    },
+    'ffiec_urban_rural_flag': {
+        "U":"urban",
+        "R":"rural",
+        "M":"mixed",
+        "I":"Island Area"
+    },
+    'ffiec_cra_criteria_flag': {
+        "X":"Yes"
+    },
+    # hmda transmittal sheet and reporter panel
+    'hmda_agency_code': {
+        1:"Office of the Comptroller of the Currency",
+        2:"Federal Reserve System",
+        3:"Federal Deposit Insurance Corporation",
+        5:"National Credit Union Administration",
+        7:"Department of Housing and Urban Development",
+        9:"Consumer Financial Protection Bureau"
+    },
+    'hmda_other_lender_code': {
+        0:"Depository Institution",
+        1:"MBS of state member bank",
+        2:"MBS of bank holding company",
+        3:"Independent mortgage banking subsidiary",
+        5:"Affiliate of a depository institution"
+    },
+    # cra aggregate and disclosure tables
+    'cra_transmittal_agency_code': {
+        1:"OCC",
+        2:"FRS",
+        3:"FDIC"
+    },
+    'cra_small_business_loan_type': {
+        4:"Small Business"
+    },
+    'cra_originations_action_taken_type': {
+        1:"Originations"
+    },
+    'cra_yes_no_uppercase': {
+        "Y":"YES",
+        "N":"NO"
+    },
+    'cra_aggregate_population_classification': {
+        "S":"counties with < or = to 500,000 in population",
+        "L":"counties with > 500,000 in population"
+    },
+    'cra_income_group': {
+        1:"< 10% of Median Family Income(MFI)",
+        2:"10% to 20% of MFI",
+        3:"20% to 30% of MFI",
+        4:"30% to 40% of MFI",
+        5:"40% to 50% of MFI",
+        6:"50% to 60% of MFI",
+        7:"60% to 70% of MFI",
+        8:"70% to 80% of MFI",
+        9:"80% to 90% of MFI",
+        10:"90% to 100% of MFI",
+        11:"100% to 110% of MFI",
+        12:"110% to 120% of MFI",
+        13:"> or = to 120% of MFI",
+        14:"MFI not known (income percentage = 0)",
+        15:"Tract not Known (reported as NA)",
+        101:"Low Income (< 50% of MFI - excluding 0)",
+        102:"Moderate Income (50% to 80% of MFI)",
+        103:"Middle Income (80% to 120% of MFI)",
+        104:"Upper Income (> or = to 120% of MFI)",
+        105:"Income Not Known (0)",
+        106:"Tract not Known (NA)"
+    },
+    'cra_aggregate_report_level': {
+        100:"Income Group Total",
+        200:"County Total",
+        210:"MSA/MD Total"
+    },
+    'cra_agency_code': {
+        1:"OCC",
+        2:"FRS",
+        3:"FDIC",
+        4:"OTS"
+    },
+    'cra_aggregate_lender_report_level': {
+        200:"County Total",
+        210:"MSA/MD Total"
+    },
+    'cra_purchases_action_taken_type': {
+        6:"Purchases"
+    },
+    'cra_yes_no': {
+        "Y":"Yes",
+        "N":"No"
+    },
+    'cra_aggregate_income_group': {
+        1:"<10% of Median Family Income(MFI)",
+        2:"10% to 20% of MFI",
+        3:"20% to 30% of MFI",
+        4:"30% to 40% of MFI",
+        5:"40% to 50% of MFI",
+        6:"50% to 60% of MFI",
+        7:"60% to 70% of MFI",
+        8:"70% to 80% of MFI",
+        9:"80% to 90% of MFI",
+        10:"90% to 100% of MFI",
+        11:"100% to 110% of MFI",
+        12:"110% to 120% of MFI",
+        13:"> or = to 120% of MFI",
+        14:"MFI not known (income percentage = 0)",
+        15:"Tract not Known (reported as NA)",
+        101:"Low Income (< 50% of MFI - excluding 0)",
+        102:"Moderate Income (50% to 80% of MFI)",
+        103:"Middle Income (80% to 120% of MFI)",
+        104:"Upper Income (> or = to 120% of MFI)",
+        105:"Income Not Known (0)",
+        106:"Tract not Known (NA)"
+    },
+    'cra_small_farm_loan_type': {
+        5:"Small Farm"
+    },
+    'cra_population_classification': {
+        "S":"counties with < or = to 500,000 in population",
+        "L":"counties with >500,000 in population"
+    },
+    'cra_disclosure_report_level': {
+        4:"Total Inside & Outside Assessment Area (AA) (across all states)",
+        6:"Total Inside AA (across all states)",
+        8:"Total Outside AA (across all states)",
+        10:"State Total",
+        20:"Total Inside AA in State",
+        30:"Total Outside AA in State",
+        40:"County Total",
+        50:"Total Inside AA in County",
+        60:"Total Outside AA in County"
+    },
+    'cra_assessment_area_report_level': {
+        5:"Assessment Area Total",
+        10:"County Total within Assessment Area",
+        15:"Activity Inside all Assessment Areas",
+        20:"Activity Outside Assessment Area(s)",
+        30:"Total Loans (Inside +Outside Assessment Area)"
+    },
+    'cra_community_development_loan_type': {
+        6:"Community Development",
+        7:"Consortium/Third-Party"
+    },
+    'cra_action_type': {
+        "O":"Originated",
+        "P":"Purchased",
+        "T":"Total (Originated + Purchased)"
+    },
+    'cra_assessment_area_income_group': {
+        1:"< 10% of Median Family Income(MFI)",
+        2:"10% to 20% of MFI",
+        3:"20% to 30% of MFI",
+        4:"30% to 40% of MFI",
+        5:"40% to 50% of MFI",
+        6:"50% to 60% of MFI",
+        7:"60% to 70% of MFI",
+        8:"70% to 80% of MFI",
+        9:"80% to 90% of MFI",
+        10:"90% to 100% of MFI",
+        11:"100% to 110% of MFI",
+        12:"110% to 120% of MFI",
+        13:"> 120% of MFI",
+        14:"MFI not known (income percentage = 0)",
+        15:"Tract not Known (Reported as NA)",
+        101:"Low Income (< 50% of MFI - excluding 0)",
+        102:"Moderate Income (50% to 80% of MFI)",
+        103:"Middle Income (80% to 120% of MFI)",
+        104:"Upper Income (> 120% of MFI)",
+        105:"Income Not Known (0)",
+        106:"Tract not Known (NA)"
+    },
+    # fdic institutions and locations
+    'fdic_institution_status': {
+        1:"Institutions that are currently open and insured by the FDIC",
+        0:"Institution closed or not insured by FDIC"
+    },
+    'fdic_institution_class': {
+        "NM":"Commercial bank, state charter, Fed non-member, and supervised by the Federal Deposit Insurance Corporation (FDIC)",
+        "SI":"State chartered stock savings banks, supervised by the FDIC",
+        "N":"Commercial bank, national (federal) charter, Fed member, and supervised by the Office of the Comptroller of the Currency (OCC)",
+        "NC":"Noninsured non-deposit commercial banks and/or trust companies regulated by the OCC, a state, or a territory",
+        "SM":"Commercial bank, state charter, Fed member, and supervised by the Federal Reserve Bank (FRB)",
+        "SB":"Federal savings banks, federal charter, supervised by the OCC or before July 21,2011 the Office of Thrift Supervision (OTS)",
+        "SL":"State chartered stock savings and loan associations, supervised by the FDIC or before July 21,2011 the OTS",
+        "NS":"Noninsured stock savings bank supervised by a state or territory",
+        "OI":"Insured U.S. branch of a foreign chartered institution (IBA) and supervised by the OCC or FDIC",
+        "CU":"state or federally chartered credit unions supervised by the National Credit Union Association (NCUA)"
+    },
+    'fdic_yes_no': {
+        1:"Yes",
+        0:"No"
+    },
+    'fdic_cfpb_flag': {
+        "0":"not supervised by CFPB",
+        "1":"secondarily supervised by CFPB"
+    },
+    'fdic_numeric_code': {
+        "03":"National bank, Federal Reserve System (FRS) member",
+        "13":"State commercial bank, FRS member",
+        "15":"State industrial bank, FRS member",
+        "21":"State commercial bank, not FRS member",
+        "23":"State industrial bank, not FRS member",
+        "25":"State nonmember mutual bank",
+        "33":"Federal chartered savings and co-operative bank - stock",
+        "34":"Federal chartered savings and co-operative bank - mutual",
+        "35":"State chartered thrift - stock",
+        "36":"State chartered thrift - mutual",
+        "37":"Federal chartered thrift - stock",
+        "38":"Federal chartered thrift - mutual",
+        "41":"State chartered stock savings and co-operative bank",
+        "42":"State chartered mutual savings and co-operative bank",
+        "43":"Federal chartered stock savings bank (historical)",
+        "44":"Federal chartered mutual savings bank (historical)",
+        "50":"Nondeposit trust company, OCC chartered",
+        "51":"Commercial bank",
+        "53":"Industrial bank",
+        "54":"Nondeposit trust company, state chartered, not FRS member",
+        "57":"New York investment company",
+        "58":"Nondeposit trust company, state chartered, FRS member",
+        "59":"Nondeposit trust company",
+        "61":"Noninsured private bank",
+        "62":"Noninsured loan workout bank, OCC chartered",
+        "63":"Noninsured loan workout bank, state chartered, FRS member",
+        "64":"Noninsured loan workout bank, state chartered, not FRS member",
+        "81":"Noninsured stock savings and co-operative bank",
+        "82":"Noninsured mutual savings and co-operative bank",
+        "85":"Noninsured stock savings and loan association",
+        "86":"Noninsured mutual savings and loan association",
+        "89":"Noninsured insurance company"
+    },
+    'fdic_federal_reserve_district': {
+        "1":"Boston",
+        "2":"New York",
+        "3":"Philadelphia",
+        "4":"Cleveland",
+        "5":"Richmond",
+        "6":"Atlanta",
+        "7":"Chicago",
+        "8":"St. Louis",
+        "9":"Minneapolis",
+        "10":"Kansas city",
+        "11":"Dallas",
+        "12":"San Francisco"
+    },
+    'fdic_primary_regulator': {
+        "OCC":"Office of the Comptroller of Currency",
+        "FDIC":"Federal Deposit Insurance Corporation",
+        "FRB":"Federal Reserve Board",
+        "NCUA":"National Credit Union Association",
+        "OTS":"Office of Thrift Supervision"
+    },
+    'fdic_supervisory_region': {
+        2:"New York",
+        5:"Atlanta",
+        9:"Chicago",
+        11:"Kansas City",
+        13:"Dallas",
+        14:"San Francisco",
+        16:"Office of Complex Financial Institutions (CFI)"
+    },
+    'fdic_trust_powers': {
+        0:"Trust Powers Not Known",
+        "10":"Full Trust Powers Granted",
+        "11":"Full Trust Powers Granted, Exercised",
+        "12":"Full Trust Powers Granted, Not Exercised",
+        "20":"Limited Trust Powers Granted",
+        "21":"Limited Trust Powers Granted, Exercised",
+        "30":"Trust Powers Not Granted",
+        "31":"Trust Powers Not Granted, But Exercised",
+        "40":"Trust Powers Grandfathered"
+    },
+    'fdic_yes_no_lowercase': {
+        1:"yes",
+        0:"no"
+    },
+    # sba foia 7(a) loans
+    'sba_delivery_method': {
+        "CA":"Community Advantage",
+        "CLP":"Certified Lenders Program",
+        "COMM EXPRS":"Community Express (inactive)",
+        "DFP":"Dealer Floor Plan (inactive)",
+        "DIRECT":"Direct Loan (inactive)",
+        "EWCP":"Export Working Capital Program",
+        "EXP CO GTY":"Co-guaranty with Export-Import Bank (inactive)",
+        "EXPRES EXP":"Export Express",
+        "GO LOANS":"Gulf Opportunity Loan (inactive)",
+        "INTER TRDE":"International Trade",
+        "OTH 7A":"Other 7(a) Loan",
+        "PATRIOT EX":"Patriot Express (inactive)",
+        "PLP":"Preferred Lender Program",
+        "RLA":"Rural Lender Advantage (inactive)",
+        "SBA EXPRES":"SBA Express",
+        "SLA":"Small Loan Advantage",
+        "USCAIP":"US Community Adjustment and Investment Program",
+        "Y2K":"Y2K Loan (inactive)"
+    },
+    'sba_loan_status': {
+        "COMMIT":"Undisbursed",
+        "PIF":"Paid In Full",
+        "CHGOFF":"Charged Off",
+        "CANCLD":"Cancelled",
+        "EXEMPT":"The status of loans that have been disbursed but have not been cancelled, paid in full, or charged off are exempt from disclosure under FOIA Exemption 4"
+    },
+    'sba_revolver_status': {
+        0:"Term",
+        1:"Revolver"
+    },
+    'sba_sold_secondary_market': {
+        "Y":"Sold on the secondary market",
+        "N":"Not sold on the secondary market"
+    }
+}
+
+# mapping values for columns in Loan/Application Records(LAR), keyed by the LAR column being mapped
+hmda_lar_value_maps = {
+    'conforming_loan_limit': {
+        "C (Conforming)":"Conforming",
+        "NC (Nonconforming)":"Nonconforming",
+        "U (Undetermined)":"Undetermined",
+        "NA (Not Applicable)":"Not Applicable"
+    },
+    'action_taken': {
+        1:"Loan originated",
+        2:"Application approved but not accepted",
+        3:"Application denied",
+        4:"Application withdrawn by applicant",
+        5:"File closed for incompleteness",
+        6:"Purchased loan",
+        7:"Preapproval request denied",
+        8:"Preapproval request approved but not accepted"
+    },
+    'purchaser_type': {
+        0:"Not applicable",
+        1:"Fannie Mae",
+        2:"Ginnie Mae",
+        3:"Freddie Mac",
+        4:"Farmer Mac",
+        5:"Private securitizer",
+        6:"Commercial bank, savings bank, or savings association",
+        71:"Credit union, mortgage company, or finance company",
+        72:"Life insurance company",
+        8:"Affiliate institution",
+        9:"Other type of purchase r"
+    },
+    'preapproval': {
+        1:"Preapproval requested",
+        2:"Preapproval not requested"
+    },
+    'loan_type': {
+        1:"Conventional (not insured or guaranteed by FHA, VA, RHS, or FSA)",
+        2:"Federal Housing Administration insured (FHA)",
+        3:"Veterans Affairs guaranteed (VA)",
+        4:"USDA Rural Housing Service or Farm Service Agency guaranteed (RHS or FSA)"
+    },
+    'loan_purpose': {
+        1:"Home purchase",
+        2:"Home improvement",
+        31:"Refinancing",
+        32:"Cash-out refinancing",
+        4:"Other purpose",
+        5:"Not applicable"
+    },
+    'lien_status': {
+        1:"Secured by a first lien",
+        2:"Secured by a subordinate lien"
+    },
+    'reverse_mortgage': {
+        1:"Reverse mortgage",
+        2:"Not a reverse mortgage",
+        1111:"Exempt"
+    },
+    'open_end_line_of_credit': {
+        1:"Open-end line of credit",
+        2:"Not an open-end line of credit",
+        1111:"Exempt"
+    },
+    'business_or_commercial_purpose': {
+        1:"Primarily for a business or commercial purpose",
+        2:"Not primarily for a business or commercial purpose",
+        1111:"Exempt"
+    },
+    'hoepa_status': {
+        1:"High-cost mortgage",
+        2:"Not a high-cost mortgage",
+        3:"Not applicable"
+    },
+    'negative_amortization': {
+        1:"Negative amortization",
+        2:"No negative amortization",
+        1111:"Exempt"
+    },
+    'interest_only_payment': {
+        1:"Interest-only payments",
+        2:"No interest-only payments",
+        1111:"Exempt"
+    },
+    'balloon_payment': {
+        1:"Balloon payment",
+        2:"No balloon payment",
+        1111:"Exempt"
+    },
+    'other_nonamortizing_features': {
+        1:"Other non-fully amortizing features",
+        2:"No other non-fully amortizing features",
+        1111:"Exempt"
+    },
+    'construction_method': {
+        1:"Site-built",
+        2:"Manufactured home"
+    },
+    'occupancy_type': {
+        1:"Principal residence",
+        2:"Second residence",
+        3:"Investment property"
+    },
+    'manufactured_home_secured_property_type': {
+        1:"Manufactured home and land",
+        2:"Manufactured home and not land",
+        3:"Not applicable",
+        1111:"Exempt"
+    },
+    'manufactured_home_land_property_interest': {
+        1:"Direct ownership",
+        2:"Indirect ownership",
+        3:"Paid leasehold",
+        4:"Unpaid leasehold",
+        5:"Not applicable",
+        1111:"Exempt"
+    },
+    'applicant_credit_score_type': {
+        1:"Equifax Beacon 5.0",
+        2:"Experian Fair Isaac",
+        3:"FICO Risk Score Classic 04",
+        4:"FICO Risk Score Classic 98",
+        5:"VantageScore 2.0",
+        6:"VantageScore 3.0",
+        7:"More than one credit scoring model",
+        8:"Other credit scoring model",
+        9:"Not applicable",
+        1111:"Exempt"
+    },
+    'co_applicant_credit_score_type': {
+        1:"Equifax Beacon 5.0",
+        2:"Experian Fair Isaac",
+        3:"FICO Risk Score Classic 04",
+        4:"FICO Risk Score Classic 98",
+        5:"VantageScore 2.0",
+        6:"VantageScore 3.0",
+        7:"More than one credit scoring model",
+        8:"Other credit scoring model",
+        9:"Not applicable",
+        10:"No co-applicant",
+        1111:"Exempt"
+    },
+    'applicant_ethnicity_1': {
+        1:"Hispanic or Latino",
+        11:"Mexican",
+        12:"Puerto Rican",
+        13:"Cuban",
+        14:"Other Hispanic or Latino",
+        2:"Not Hispanic or Latino",
+        3:"Information not provided by applicant in mail, internet, or telephone application",
+        4:"Not applicable"
+    },
+    'applicant_ethnicity_2': {
+        1:"Hispanic or Latino",
+        11:"Mexican",
+        12:"Puerto Rican",
+        13:"Cuban",
+        14:"Other Hispanic or Latino",
+        2:"Not Hispanic or Latino"
+    },
+    'applicant_ethnicity_3': {
+        1:"Hispanic or Latino",
+        11:"Mexican",
+        12:"Puerto Rican",
+        13:"Cuban",
+        14:"Other Hispanic or Latino",
+        2:"Not Hispanic or Latino"
+    },
+    'applicant_ethnicity_4': {
+        1:"Hispanic or Latino",
+        11:"Mexican",
+        12:"Puerto Rican",
+        13:"Cuban",
+        14:"Other Hispanic or Latino",
+        2:"Not Hispanic or Latino"
+    },
+    'applicant_ethnicity_5': {
+        1:"Hispanic or Latino",
+        11:"Mexican",
+        12:"Puerto Rican",
+        13:"Cuban",
+        14:"Other Hispanic or Latino",
+        2:"Not Hispanic or Latino"
+    },
+    'co_applicant_ethnicity_1': {
+        1:"Hispanic or Latino",
+        11:"Mexican",
+        12:"Puerto Rican",
+        13:"Cuban",
+        14:"Other Hispanic or Latino",
+        2:"Not Hispanic or Latino",
+        3:"Information not provided by applicant in mail, internet, or telephone application",
+        4:"Not applicable",
+        5:"No co-applicant"
+    },
+    'co_applicant_ethnicity_2': {
+        1:"Hispanic or Latino",
+        11:"Mexican",
+        12:"Puerto Rican",
+        13:"Cuban",
+        14:"Other Hispanic or Latino",
+        2:"Not Hispanic or Latino"
+    },
+    'co_applicant_ethnicity_3': {
+        1:"Hispanic or Latino",
+        11:"Mexican",
+        12:"Puerto Rican",
+        13:"Cuban",
+        14:"Other Hispanic or Latino",
+        2:"Not Hispanic or Latino"
+    },
+    'co_applicant_ethnicity_4': {
+        1:"Hispanic or Latino",
+        11:"Mexican",
+        12:"Puerto Rican",
+        13:"Cuban",
+        14:"Other Hispanic or Latino",
+        2:"Not Hispanic or Latino"
+    },
+    'co_applicant_ethnicity_5': {
+        1:"Hispanic or Latino",
+        11:"Mexican",
+        12:"Puerto Rican",
+        13:"Cuban",
+        14:"Other Hispanic or Latino",
+        2:"Not Hispanic or Latino"
+    },
+    'applicant_ethnicity_observed': {
+        1:"Collected on the basis of visual observation or surname",
+        2:"Not collected on the basis of visual observation or surname",
+        3:"Not applicable"
+    },
+    'co_applicant_ethnicity_observed': {
+        1:"Collected on the basis of visual observation or surname",
+        2:"Not collected on the basis of visual observation or surname",
+        3:"Not applicable",
+        4:"No co-applicant"
+    },
+    'applicant_race_1': {
+        1:"American Indian or Alaska Native",
+        2:"Asian",
+        21:"Asian Indian",
+        22:"Chinese",
+        23:"Filipino",
+        24:"Japanese",
+        25:"Korean",
+        26:"Vietnamese",
+        27:"Other Asian",
+        3:"Black or African American",
+        4:"Native Hawaiian or Other Pacific Islander",
+        41:"Native Hawaiian",
+        42:"Guamanian or Chamorro",
+        43:"Samoan",
+        44:"Other Pacific Islander",
+        5:"White",
+        6:"Information not provided by applicant in mail, internet, or telephone application",
+        7:"Not applicable"
+    },
+    'applicant_race_2': {
+        1:"American Indian or Alaska Native",
+        2:"Asian",
+        21:"Asian Indian",
+        22:"Chinese",
+        23:"Filipino",
+        24:"Japanese",
+        25:"Korean",
+        26:"Vietnamese",
+        27:"Other Asian",
+        3:"Black or African American",
+        4:"Native Hawaiian or Other Pacific Islander",
+        41:"Native Hawaiian",
+        42:"Guamanian or Chamorro",
+        43:"Samoan",
+        44:"Other Pacific Islander",
+        5:"White"
+    },
+    'applicant_race_3': {
+        1:"American Indian or Alaska Native",
+        2:"Asian",
+        21:"Asian Indian",
+        22:"Chinese",
+        23:"Filipino",
+        24:"Japanese",
+        25:"Korean",
+        26:"Vietnamese",
+        27:"Other Asian",
+        3:"Black or African American",
+        4:"Native Hawaiian or Other Pacific Islander",
+        41:"Native Hawaiian",
+        42:"Guamanian or Chamorro",
+        43:"Samoan",
+        44:"Other Pacific Islander",
+        5:"White"
+    },
+    'applicant_race_4': {
+        1:"American Indian or Alaska Native",
+        2:"Asian",
+        21:"Asian Indian",
+        22:"Chinese",
+        23:"Filipino",
+        24:"Japanese",
+        25:"Korean",
+        26:"Vietnamese",
+        27:"Other Asian",
+        3:"Black or African American",
+        4:"Native Hawaiian or Other Pacific Islander",
+        41:"Native Hawaiian",
+        42:"Guamanian or Chamorro",
+        43:"Samoan",
+        44:"Other Pacific Islander",
+        5:"White"
+    },
+    'applicant_race_5': {
+        1:"American Indian or Alaska Native",
+        2:"Asian",
+        21:"Asian Indian",
+        22:"Chinese",
+        23:"Filipino",
+        24:"Japanese",
+        25:"Korean",
+        26:"Vietnamese",
+        27:"Other Asian",
+        3:"Black or African American",
+        4:"Native Hawaiian or Other Pacific Islander",
+        41:"Native Hawaiian",
+        42:"Guamanian or Chamorro",
+        43:"Samoan",
+        44:"Other Pacific Islander",
+        5:"White"
+    },
+    'co_applicant_race_1': {
+        1:"American Indian or Alaska Native",
+        2:"Asian",
+        21:"Asian Indian",
+        22:"Chinese",
+        23:"Filipino",
+        24:"Japanese",
+        25:"Korean",
+        26:"Vietnamese",
+        27:"Other Asian",
+        3:"Black or African American",
+        4:"Native Hawaiian or Other Pacific Islander",
+        41:"Native Hawaiian",
+        42:"Guamanian or Chamorro",
+        43:"Samoan",
+        44:"Other Pacific Islander",
+        5:"White",
+        6:"Information not provided by applicant in mail, internet, or telephone application",
+        7:"Not applicable",
+        8:"No co-applicant"
+    },
+    'co_applicant_race_2': {
+        1:"American Indian or Alaska Native",
+        2:"Asian",
+        21:"Asian Indian",
+        22:"Chinese",
+        23:"Filipino",
+        24:"Japanese",
+        25:"Korean",
+        26:"Vietnamese",
+        27:"Other Asian",
+        3:"Black or African American",
+        4:"Native Hawaiian or Other Pacific Islander",
+        41:"Native Hawaiian",
+        42:"Guamanian or Chamorro",
+        43:"Samoan",
+        44:"Other Pacific Islander",
+        5:"White"
+    },
+    'co_applicant_race_3': {
+        1:"American Indian or Alaska Native",
+        2:"Asian",
+        21:"Asian Indian",
+        22:"Chinese",
+        23:"Filipino",
+        24:"Japanese",
+        25:"Korean",
+        26:"Vietnamese",
+        27:"Other Asian",
+        3:"Black or African American",
+        4:"Native Hawaiian or Other Pacific Islander",
+        41:"Native Hawaiian",
+        42:"Guamanian or Chamorro",
+        43:"Samoan",
+        44:"Other Pacific Islander",
+        5:"White"
+    },
+    'co_applicant_race_4': {
+        1:"American Indian or Alaska Native",
+        2:"Asian",
+        21:"Asian Indian",
+        22:"Chinese",
+        23:"Filipino",
+        24:"Japanese",
+        25:"Korean",
+        26:"Vietnamese",
+        27:"Other Asian",
+        3:"Black or African American",
+        4:"Native Hawaiian or Other Pacific Islander",
+        41:"Native Hawaiian",
+        42:"Guamanian or Chamorro",
+        43:"Samoan",
+        44:"Other Pacific Islander",
+        5:"White"
+    },
+    'co_applicant_race_5': {
+        1:"American Indian or Alaska Native",
+        2:"Asian",
+        21:"Asian Indian",
+        22:"Chinese",
+        23:"Filipino",
+        24:"Japanese",
+        25:"Korean",
+        26:"Vietnamese",
+        27:"Other Asian",
+        3:"Black or African American",
+        4:"Native Hawaiian or Other Pacific Islander",
+        41:"Native Hawaiian",
+        42:"Guamanian or Chamorro",
+        43:"Samoan",
+        44:"Other Pacific Islander",
+        5:"White"
+    },
+    'applicant_race_observed': {
+        1:"Collected on the basis of visual observation or surname",
+        2:"Not collected on the basis of visual observation or surname",
+        3:"Not applicable"
+    },
+    'co_applicant_race_observed': {
+        1:"Collected on the basis of visual observation or surname",
+        2:"Not collected on the basis of visual observation or surname",
+        3:"Not applicable",
+        4:"No co-applicant"
+    },
+    'applicant_sex': {
+        1:"Male",
+        2:"Female",
+        3:"Information not provided by applicant in mail, internet, or telephone application",
+        4:"Not applicable",
+        6:"Applicant selected both male and female"
+    },
+    'co_applicant_sex': {
+        1:"Male",
+        2:"Female",
+        3:"Information not provided by applicant in mail, internet, or telephone application",
+        4:"Not applicable",
+        5:"No co-applicant",
+        6:"Co-applicant selected both male and female"
+    },
+    'applicant_sex_observed': {
+        1:"Collected on the basis of visual observation or surname",
+        2:"Not collected on the basis of visual observation or surname",
+        3:"Not applicable"
+    },
+    'co_applicant_sex_observed': {
+        1:"Collected on the basis of visual observation or surname",
+        2:"Not collected on the basis of visual observation or surname",
+        3:"Not applicable",
+        4:"No co-applicant"
+    },
+    'submission_of_application': {
+        1:"Submitted directly to your institution",
+        2:"Not submitted directly to your institution",
+        3:"Not applicable",
+        1111:"Exempt"
+    },
+    'initially_payable_to_institution': {
+        1:"Initially payable to your institution",
+        2:"Not initially payable to your institution",
+        3:"Not applicable",
+        1111:"Exempt"
+    },
+    'aus_1': {
+        1:"Desktop Underwriter (DU)",
+        2:"Loan Prospector (LP) or Loan Product Advisor",
+        3:"Technology Open to Approved Lenders (TOTAL) Scorecard",
+        4:"Guaranteed Underwriting System (GUS)",
+        5:"Other",
+        6:"Not applicable",
+        7:"Internal Proprietary System",
+        1111:"Exempt"
+    },
+    'aus_2': {
+        1:"Desktop Underwriter (DU)",
+        2:"Loan Prospector (LP) or Loan Product Advisor",
+        3:"Technology Open to Approved Lenders (TOTAL) Scorecard",
+        4:"Guaranteed Underwriting System (GUS)",
+        5:"Other",
+        7:"Internal Proprietary System"
+    },
+    'aus_3': {
+        1:"Desktop Underwriter (DU)",
+        2:"Loan Prospector (LP) or Loan Product Advisor",
+        3:"Technology Open to Approved Lenders (TOTAL) Scorecard",
+        4:"Guaranteed Underwriting System (GUS)",
+        7:"Internal Proprietary System"
+    },
+    'aus_4': {
+        1:"Desktop Underwriter (DU)",
+        2:"Loan Prospector (LP) or Loan Product Advisor",
+        3:"Technology Open to Approved Lenders (TOTAL) Scorecard",
+        4:"Guaranteed Underwriting System (GUS)",
+        7:"Internal Proprietary System"
+    },
+    'aus_5': {
+        1:"Desktop Underwriter (DU)",
+        2:"Loan Prospector (LP) or Loan Product Advisor",
+        3:"Technology Open to Approved Lenders (TOTAL) Scorecard",
+        4:"Guaranteed Underwriting System (GUS)",
+        7:"Internal Proprietary System"
+    },
+    'denial_reason_1': {
+        1:"Debt-to-income ratio",
+        2:"Employment history",
+        3:"Credit history",
+        4:"Collateral",
+        5:"Insufficient cash (downpayment, closing costs)",
+        6:"Unverifiable information",
+        7:"Credit application incomplete",
+        8:"Mortgage insurance denied",
+        9:"Other",
+        10:"Not applicable"
+    },
+    'denial_reason_2': {
+        1:"Debt-to-income ratio",
+        2:"Employment history",
+        3:"Credit history",
+        4:"Collateral",
+        5:"Insufficient cash (downpayment, closing costs)",
+        6:"Unverifiable information",
+        7:"Credit application incomplete",
+        8:"Mortgage insurance denied",
+        9:"Other"
+    },
+    'denial_reason_3': {
+        1:"Debt-to-income ratio",
+        2:"Employment history",
+        3:"Credit history",
+        4:"Collateral",
+        5:"Insufficient cash (downpayment, closing costs)",
+        6:"Unverifiable information",
+        7:"Credit application incomplete",
+        8:"Mortgage insurance denied",
+        9:"Other"
+    },
+    'denial_reason_4': {
+        1:"Debt-to-income ratio",
+        2:"Employment history",
+        3:"Credit history",
+        4:"Collateral",
+        5:"Insufficient cash (downpayment, closing costs)",
+        6:"Unverifiable information",
+        7:"Credit application incomplete",
+        8:"Mortgage insurance denied",
+        9:"Other"
+    }
+}
+
+
+# LAR code tables are registered under 'hmda_lar_<column>'
+code_tables.update({'hmda_lar_' + column: value_map for column, value_map in hmda_lar_value_maps.items()})
+
+
+def code_table_categories(code_table, fill_value: str = None) -> list[str]:
+    """Used to get the descriptions of a code table in the order they are listed, without duplicates.
+
+    Args:
+        code_table: name of a table in code_tables or a dictionary of codes to descriptions.
+        fill_value: description used for codes that are missing or not in the table. Added as the last category.
+
+    Returns:
+        A list of descriptions.
+    """
+    table = code_tables[code_table] if isinstance(code_table, str) else code_table
+    categories = list(dict.fromkeys(table.values()))
+    if fill_value is not None and fill_value not in categories:
+        categories.append(fill_value)
+    return categories
+
+
+def decode_column(column: pd.Series, code_table, fill_value: str = None, categorical: bool = False) -> pd.Series:
+    """Used to replace the codes in a column with their descriptions. Works the same as column.map(table) (followed by
+    .fillna(fill_value) when a fill value is given) but looks up each distinct code once.
+
+    Args:
+        column: column of raw codes.
+        code_table: name of a table in code_tables or a dictionary of codes to descriptions.
+        fill_value: description used for codes that are missing or not in the table. Left missing if None.
+        categorical: True to return a pandas Categorical, which stores each description once, instead of an object
+            column. Group-bys on a Categorical should pass observed=True, or every category gets a row.
+
+    Returns:
+        The decoded column, with the same index and name as the column passed in.
+    """
+    table = code_tables[code_table] if isinstance(code_table, str) else code_table
+    categories = code_table_categories(table, fill_value)
+    category_positions = {label: position for position, label in enumerate(categories)}
+    missing_position = -1 if fill_value is None else category_positions[fill_value]
+
+    # decode each distinct code once, then take the decoded positions for every row. the last lookup entry is used for
+    # missing values since factorize marks them with -1
+    raw_positions, raw_codes = pd.factorize(column)
+    lookup = np.array([category_positions[table[code]] if code in table else missing_position for code in raw_codes]
+                      + [missing_position], dtype = np.int32)
+    decoded = pd.Series(pd.Categorical.from_codes(lookup[raw_positions], categories),
+                        index = column.index,
+                        name = column.name)
+    if not categorical:
+        decoded = decoded.astype(object)
+    return decoded
+
+
+def decode_columns(df: pd.core.frame.DataFrame,
+                   column_tables: dict[str: str],
+                   fill_values: dict[str: str] = None,
+                   categorical: bool = False) -> pd.core.frame.DataFrame:
+    """Used to decode several columns of a dataframe at once. Columns that are not in the dataframe are skipped.
+
+    Args:
+        df: dataframe with coded columns.
+        column_tables: the code table (name or dictionary) to use for each column.
+        fill_values: the fill value to use for each column. Columns not listed are left missing where no code matches.
+        categorical: True to return the descriptions as Categoricals instead of object columns (see decode_column).
+
+    Returns:
+        The dataframe with its coded columns decoded.
+    """
+    fill_values = {} if fill_values is None else fill_values
+    for column, code_table in column_tables.items():
+        if column not in df.columns:
+            continue
+        df[column] = decode_column(df[column], code_table, fill_values.get(column), categorical)
+    return df
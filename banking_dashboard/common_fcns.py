@@ -0,0 +1,164 @@
+# helper functions not specific to one data source: state and county reference tables, county zip codes and file
+# hashes. Shared by the ingester modules (ffiec_ingest, hmda_ingest, cra_ingest, fdic_ingest and sba_ingest). Packages
+# that are slow to import (requests, bs4, zipcodes) are imported inside the functions that use them
+
+import re
+import hashlib
+import pandas as pd
+from reference_data import cached_reference_data
+
+# Collin County = 48085, Dallas County = 48113, Tarrant County = 48439
+hmda_county_codes = ['48085', '48113', '48439']
+
+
+def file_content_hash(file_path: str, block_size: int = 2**24) -> str:
+    """Used to get the sha256 hash of a file's contents, read in blocks so large files are not loaded into memory.
+
+    Args:
+        file_path: path of the file to hash.
+        block_size: number of bytes read in at a time.
+
+    Returns:
+        The hex digest of the file's contents.
+    """
+    content_hash = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(block_size), b''):
+            content_hash.update(block)
+    return content_hash.hexdigest()
+
+def state_abrevs_getter(ssa_url: str)->dict[str: str]:
+    """Used to download and convert each state abbreviation and its full name into a dictionary which will be the output.
+    Args: 
+        url: social security administration website
+
+    Returns:
+        A dictionary containing the state abbreviation as the key and the full state name as the value
+    """
+    import requests
+    from bs4 import BeautifulSoup
+    ssa_html = requests.get(ssa_url)
+    ssa_soup = BeautifulSoup(ssa_html.content, 'html.parser')
+    state_abbrevs = {}
+    for state in ssa_soup.find_all('tr'):
+        state_abbrevs[state.text.strip().split()[-1]] = ' '.join(state.text.strip().split()[:-1])
+    return state_abbrevs
+
+def fcc_fips_mappings_getter(url: str)->dict[str: dict[str: str]]:
+    """Used to download and convert county and state codes from fcc website into a python dictionary.
+    
+    Args:
+        url: fcc state and county codes website.
+    
+    Returns: 
+        A dictionary containing fcc fips codes as keys and thier corresponding state or county name as values.     
+    """
+    import requests
+    fips_url = url
+    fips_html = requests.get(fips_url)
+    state_fips_dict = {}
+    counties_fips_dict = {} 
+    for row_num, area_and_fips in enumerate(str(fips_html.content).split('\\n')):
+        if row_num in range(16,67):        
+            state_fips_dict[''.join(re.findall(r'[0-9]+',area_and_fips))] = ' '.join(re.findall(r'[a-zA-Z]+',area_and_fips))
+        if row_num in range(72,3267):
+            counties_fips_dict[''.join(re.findall(r'[0-9]+',area_and_fips))] = ' '.join(re.findall(r'[a-zA-Z]+',area_and_fips))
+    return {'fcc_states':state_fips_dict,'fcc_counties':counties_fips_dict}
+
+# pages the state abbreviations and the state and county fips codes are downloaded from
+ssa_states_url = 'https://www.ssa.gov/international/coc-docs/states.html'
+fcc_fips_url = 'https://transition.fcc.gov/oet/info/maps/census/fips/fips.txt'
+
+def state_abbrevs(ssa_url: str = ssa_states_url, ttl_days: float = None, offline: bool = None, refresh: bool = False)->dict[str: str]:
+    """Used to get the state abbreviations and full state names from the local snapshot of the ssa page, downloading the
+    page (with state_abrevs_getter) only when the snapshot is missing or out of date. Falls back on the copy bundled with
+    the repo when the page can not be downloaded.
+
+    Args:
+        ssa_url: social security administration website.
+        ttl_days: number of days the snapshot is used before the page is downloaded again (see reference_data).
+        offline: True to never download the page. Defaults to the REFERENCE_DATA_OFFLINE environment variable.
+        refresh: True to download the page again even if the snapshot is current.
+
+    Returns:
+        A dictionary containing the state abbreviation as the key and the full state name as the value
+    """
+    return cached_reference_data('ssa_state_abbrevs', ssa_url, state_abrevs_getter, ttl_days = ttl_days,
+                                 offline = offline, refresh = refresh)
+
+def fcc_fips_mappings(url: str = fcc_fips_url, ttl_days: float = None, offline: bool = None, refresh: bool = False)->dict[str: dict[str: str]]:
+    """Used to get the state and county fips names from the local snapshot of the fcc page, downloading the page (with
+    fcc_fips_mappings_getter) only when the snapshot is missing or out of date. Falls back on the copy bundled with the
+    repo when the page can not be downloaded.
+
+    Args:
+        url: fcc state and county codes website.
+        ttl_days: number of days the snapshot is used before the page is downloaded again (see reference_data).
+        offline: True to never download the page. Defaults to the REFERENCE_DATA_OFFLINE environment variable.
+        refresh: True to download the page again even if the snapshot is current.
+
+    Returns:
+        A dictionary containing fcc fips codes as keys and thier corresponding state or county name as values.
+    """
+    return cached_reference_data('fcc_fips', url, fcc_fips_mappings_getter, ttl_days = ttl_days, offline = offline,
+                                 refresh = refresh)
+
+def get_zip_codes(county_name: str, abbrev_state: str = "TX")->list[str]:
+    """Used to find all unique zipcodes associates with a given county and state.
+
+    Args:
+        county_name: name of county you want to find the associated zip codes of. 
+        abbrev_state: name of county you want to find the associated zip codes of.
+    Returns: 
+        A list of zipcodes associates with th provided county and state.
+    """
+    import zipcodes
+    if " County" not in county_name:
+     county_name = county_name + " County"
+
+    try:
+        zip_list = zipcodes.filter_by(county = county_name, state = abbrev_state)
+
+        zips_raw = [i['zip_code'] for i in zip_list]
+        zips_unique = pd.Series(zips_raw).drop_duplicates().tolist()
+        zips_unique.sort()
+
+        #print(f"{len(zips_unique)} unique zip codes found in {county_name}")
+        return zips_unique
+    
+    except:
+        return None
+
+def county_to_countyzip_dict(county_to_search: list[str])->dict[str: set]:
+    """Used to create a dictionary of counties with zipcodes. This only has to be run once so the later mapping runs faster.
+
+    Args:
+        county_to_search: county that will be returned with zip codes
+    
+    Returns: 
+        A dictionary of counties associated with zip codes. 
+    """
+    county_zips_dct = {}
+    for county_i in county_to_search:
+        zips_for_county = set(get_zip_codes(county_name = county_i, abbrev_state = "TX"))
+        county_zips_dct[county_i] = zips_for_county
+    return county_zips_dct   
+
+def zip_to_county_name(zpcode: str, zips_dct: dict[str: set])->str:
+    """Used to return name of county associated with a given zip code.
+
+    Args:
+        zpcode: provided zipcode 
+        zips_dct: a dictionary that has county names as keys and the associated zip codes in a list as the value.
+    
+    Returns:
+        The name of the county associated with the zip code as a value.
+    """
+    if zpcode in zips_dct["Dallas"]:
+        return "Dallas County"
+    elif zpcode in zips_dct["Collin"]:
+        return "Collin County"
+    elif zpcode in zips_dct["Tarrant"]:
+        return "Tarrant County"
+    else: 
+        return "Other"
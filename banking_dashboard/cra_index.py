@@ -0,0 +1,184 @@
+# helper functions to pull the records of a few counties out of the national cra .dat files without reading the whole
+# file. A sidecar index (<file>.index.json, written next to the .dat file) maps each state and county code to the byte
+# ranges of its records, and queries read only those ranges through a memory-mapped file. The index is rebuilt when the
+# .dat file's size or modification time changes
+
+import io
+import os
+import json
+import mmap
+import numpy as np
+import pandas as pd
+from cra_layouts import cra_fwf_dimensions, cra_table_id, cra_field_position
+from fixed_width import read_fixed_width
+from source_files import find_source_file
+
+# bumped when the layout of the index files changes so old index files get rebuilt
+cra_index_version = 1
+
+
+def cra_index_path(dat_path: str) -> str:
+    """Used to get the path of the sidecar index of a cra .dat file.
+
+    Args:
+        dat_path: path of the cra .dat file.
+
+    Returns:
+        The path of the index file.
+    """
+    return dat_path + '.index.json'
+
+
+def _code_labels(field_values: np.ndarray, width: int) -> tuple[np.ndarray, list]:
+    """Used to turn the raw bytes of a code field into zero padded codes (ex: ' 85' and '085' are both '085'). Each
+    distinct value is converted once.
+
+    Args:
+        field_values: raw field of each record as bytes.
+        width: width of the field.
+
+    Returns:
+        The position of each record's code in the list of codes, and the list of codes ('' for blank fields).
+    """
+    distinct_values, positions = np.unique(field_values, return_inverse = True)
+    labels = []
+    for value in distinct_values:
+        value = value.decode('ascii', errors = 'replace').strip()
+        labels.append(value.zfill(width) if value.isdigit() else value)
+    return positions, labels
+
+
+def build_cra_index(dat_path: str, table: str = None) -> dict:
+    """Used to build the sidecar index of a cra .dat file and write it next to the file. Records of a county that sit
+    next to each other in the file are stored as one byte range.
+
+    Args:
+        dat_path: path of the cra .dat file.
+        table: name of the cra table in the file (see cra_table_ids). Found from the file name by default.
+
+    Returns:
+        The index, a dictionary with the file's size and modification time and the byte ranges of each five digit
+        state and county code ('ranges').
+
+    Raises:
+        ValueError: if the table does not have state and county fields.
+    """
+    table = table or cra_table_id(os.path.basename(dat_path))
+    if table not in cra_fwf_dimensions or 'County' not in cra_fwf_dimensions[table][1]:
+        raise ValueError('cra table ' + str(table) + ' does not have state and county fields to index')
+    file_stat = os.stat(dat_path)
+    ranges = {}
+    if file_stat.st_size > 0:
+        data = np.memmap(dat_path, dtype = np.uint8, mode = 'r')
+        # a last line with no line break ends at the end of the file
+        line_ends = np.flatnonzero(data == ord('\n'))
+        if len(line_ends) == 0 or line_ends[-1] != len(data) - 1:
+            line_ends = np.append(line_ends, len(data))
+        line_starts = np.concatenate([[0], line_ends[:-1] + 1])
+
+        # code of each record, read from its bytes. Records too short to hold a field get a blank code
+        code_positions = []
+        code_labels = []
+        for field in ['State', 'County']:
+            offset, width = cra_field_position(table, field)
+            indices = line_starts[:, None] + offset + np.arange(width)
+            in_line = indices < line_ends[:, None]
+            field_bytes = np.where(in_line, data[np.minimum(indices, len(data) - 1)], ord(' ')).astype(np.uint8)
+            positions, labels = _code_labels(field_bytes.view('S' + str(width)).ravel(), width)
+            code_positions.append(positions)
+            code_labels.append(labels)
+        record_codes = code_positions[0] * len(code_labels[1]) + code_positions[1]
+
+        # one byte range per run of records with the same code
+        run_starts = np.concatenate([[0], np.flatnonzero(record_codes[1:] != record_codes[:-1]) + 1])
+        run_ends = np.append(run_starts[1:], len(record_codes)) - 1
+        for run_start, run_end in zip(run_starts, run_ends):
+            code = record_codes[run_start]
+            key = code_labels[0][code // len(code_labels[1])] + code_labels[1][code % len(code_labels[1])]
+            ranges.setdefault(key, []).append([int(line_starts[run_start]), min(int(line_ends[run_end]) + 1, len(data))])
+        del data
+
+    cra_index = {'index_version': cra_index_version,
+                 'table': table,
+                 'file_size': file_stat.st_size,
+                 'file_mtime_ns': file_stat.st_mtime_ns,
+                 'ranges': ranges}
+    with open(cra_index_path(dat_path), 'w') as index_file:
+        json.dump(cra_index, index_file)
+    return cra_index
+
+
+def cra_index_is_current(cra_index: dict, dat_path: str) -> bool:
+    """Used to check whether an index still matches its .dat file.
+
+    Args:
+        cra_index: a cra index (output of build_cra_index).
+        dat_path: path of the cra .dat file.
+
+    Returns:
+        True if the index was built from the file as it is now.
+    """
+    file_stat = os.stat(dat_path)
+    return (cra_index.get('index_version') == cra_index_version and
+            cra_index.get('file_size') == file_stat.st_size and
+            cra_index.get('file_mtime_ns') == file_stat.st_mtime_ns)
+
+
+def load_cra_index(dat_path: str, table: str = None) -> dict:
+    """Used to load the sidecar index of a cra .dat file, building it first if it is missing or out of date.
+
+    Args:
+        dat_path: path of the cra .dat file.
+        table: name of the cra table in the file. Found from the file name by default.
+
+    Returns:
+        The index (see build_cra_index).
+    """
+    index_path = cra_index_path(dat_path)
+    if os.path.exists(index_path):
+        with open(index_path) as index_file:
+            try:
+                cra_index = json.load(index_file)
+            except json.JSONDecodeError:
+                cra_index = {}
+        if cra_index_is_current(cra_index, dat_path) and cra_index.get('table') == (table or cra_index.get('table')):
+            return cra_index
+    print('building cra index for ' + dat_path)
+    return build_cra_index(dat_path, table)
+
+
+def read_cra_counties(data_folder: str,
+                      file_name: str,
+                      county_codes: list,
+                      table: str = None) -> pd.core.frame.DataFrame:
+    """Used to read in the records of some counties from a cra .dat file through its sidecar index. Only the byte ranges
+    of the counties are read. Gives the same records, in file order, as reading in the whole file with
+    cra_data_ingester and keeping the counties' rows, with a new 0 to n-1 index and column types worked out from the
+    records read in.
+
+    Args:
+        data_folder: folder holding the cra file. The file has to be extracted from its zip archive, since archive
+            members can not be memory-mapped.
+        file_name: name of the cra file.
+        county_codes: five digit county fips codes to read in (ex: ['48113']). Two digit state codes read in the
+            state level rows that have no county.
+        table: name of the cra table in the file. Found from the file name by default.
+
+    Returns:
+        A dataframe of the counties' records with the table's fields as columns.
+
+    Raises:
+        ValueError: if the file is a member of a zip archive.
+    """
+    dat_path, member = find_source_file(data_folder, file_name)
+    if member is not None:
+        raise ValueError(file_name + ' is in the zip archive ' + dat_path + ', extract it to read it through an index')
+    cra_index = load_cra_index(dat_path, table)
+    widths, names = cra_fwf_dimensions[cra_index['table']]
+    byte_ranges = sorted(byte_range for county_code in county_codes for byte_range in cra_index['ranges'].get(county_code, []))
+    if len(byte_ranges) == 0:
+        return read_fixed_width(io.BytesIO(b''), widths = widths, names = names)
+    with open(dat_path, 'rb') as dat_file, mmap.mmap(dat_file.fileno(), 0, access = mmap.ACCESS_READ) as dat_map:
+        records = b''.join(dat_map[start:end] if dat_map[end - 1:end] == b'\n' else dat_map[start:end] + b'\n'
+                           for start, end in byte_ranges)
+    return read_fixed_width(io.BytesIO(records), widths = widths, names = names)
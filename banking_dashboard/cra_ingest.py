@@ -0,0 +1,605 @@
+# helper functions to read in the cra aggregate and disclosure flat files and decode their tables
+
+import os
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from fixed_width import read_fixed_width
+from lazy_tables import LazyTableDict, map_table
+from cra_layouts import cra_fwf_dimensions, cra_table_ids, cra_table_id
+from source_files import open_source_file, source_file_names, source_file_size
+from code_tables import decode_column
+from geo_keys import format_census_tracts, pad_county_codes, pad_state_codes, format_respondent_ids, remove_float_suffixes
+from common_fcns import hmda_county_codes
+
+# cra tables filtered down to the counties of focus by thousands_adder, so they can be prefiltered when read in
+cra_prefilter_table_ids = ['d11', 'd6']
+
+def cra_data_ingester(file: str,
+                      data_folder: str = 'data',
+                      file_lst: list = [],
+                      tables: list = None,
+                      prefilter: bool = False,
+                      county_codes: list = hmda_county_codes) -> LazyTableDict:
+    """Used to read in cra .dat fwf files from directory. The files can be plain files in data_folder or members of the
+    agg and discl zip archives, which are read without being extracted. Each file is only parsed when its table is first
+    looked up, so tables that are never used are never read in.
+    
+    Args:
+        file: not currently used
+        data_folder: folder holding the cra files or their zip archives.
+        file_lst: names of the cra files to read in.
+        tables: cra tables to read in (ex: ['transmittal', 'd11', 'd6'], see cra_table_ids). All tables by default.
+        prefilter: if True, the tables in cra_prefilter_table_ids only keep records in the states and counties of
+            county_codes. The state and county codes are compared on the raw lines, so other records are never parsed.
+        county_codes: five digit county fips codes to keep. Only used when prefilter is True.
+    
+    Returns: 
+        A LazyTableDict of dataframes where the .dat cra data file name is the key
+
+    Raises:
+        ValueError: if tables has a name that is not in cra_table_ids.
+    """
+    #url = 'https://www.ffiec.gov/cra/xls/21exp_aggr.zip'
+    #r = requests.get(url, allow_redirects = True)
+    #open('21exp_aggr.zip','wb').write(r.content)
+    #zip_ref = zipfile.ZipFile('21exp_aggr.zip', 'r') #zipfile not zip file error
+
+    # most_recent_year = max([re.findall(r'\d{4}',file)[0] for file in os.listdir('data') if 'cra' in file])
+    # lst_of_files = file_lst
+
+    tables = cra_selected_tables(tables)
+
+    # each selected file gets a loader, nothing is parsed yet
+    table_loaders = {}
+    for i, table in cra_table_files(data_folder, file_lst, tables).items():
+        record_filter = cra_county_record_filter(county_codes) if prefilter and table in cra_prefilter_table_ids else None
+        table_loaders[i] = partial(cra_table_reader, data_folder, i, *cra_fwf_dimensions[table], record_filter = record_filter)
+    return LazyTableDict(table_loaders)
+
+def cra_selected_tables(tables: list = None) -> list:
+    """Used to check a selection of cra tables.
+    
+    Args:
+        tables: cra table names (see cra_table_ids), or None for all tables.
+    
+    Returns: 
+        The selected table names
+
+    Raises:
+        ValueError: if tables has a name that is not in cra_table_ids.
+    """
+    if tables is None:
+        return cra_table_ids
+    unknown_tables = [table for table in tables if table not in cra_table_ids]
+    if unknown_tables:
+        raise ValueError('unknown cra tables ' + str(unknown_tables) + ', tables must be in ' + str(cra_table_ids))
+    return tables
+
+def cra_table_files(data_folder: str, file_lst: list, tables: list) -> dict[str: str]:
+    """Used to find the cra files to read in for a selection of tables.
+    
+    Args:
+        data_folder: folder holding the cra files or their zip archives.
+        file_lst: names of the cra files to read in.
+        tables: cra tables to read in (see cra_table_ids).
+    
+    Returns: 
+        A dictionary of file names and their table names, in the order the files are listed in data_folder. Only the
+        first file of each table is used
+    """
+    table_files = {}
+    for i in source_file_names(data_folder):
+        table = cra_table_id(i)
+        if i in file_lst and table in tables and table not in table_files.values():
+            table_files[i] = table
+    return table_files
+
+def cra_table_reader(data_folder: str,
+                     file_name: str,
+                     widths: list[int],
+                     names: list[str],
+                     record_filter: dict[str: list] = None) -> pd.core.frame.DataFrame:
+    """Used to read in one cra .dat fwf file (a loader of the LazyTableDict from cra_data_ingester).
+    
+    Args:
+        data_folder: folder holding the cra files or their zip archives.
+        file_name: name of the cra file.
+        widths: width of each field.
+        names: name of each field.
+        record_filter: fields mapped to the raw values to keep, passed to read_fixed_width.
+    
+    Returns: 
+        The cra table as a dataframe
+    """
+    with open_source_file(data_folder, file_name) as cra_file:
+        return read_fixed_width(cra_file, widths = widths, names = names, record_filter = record_filter)
+
+def cra_county_record_filter(county_codes: list = hmda_county_codes) -> dict[str: list]:
+    """Used to make the read_fixed_width record filter that keeps cra records in the states and counties of a list of
+    county fips codes. State and county are checked separately, so with counties from more than one state some other
+    counties can get through; thousands_adder's filter on the mapped names still applies afterwards.
+    
+    Args:
+        county_codes: five digit county fips codes to keep.
+    
+    Returns: 
+        A dictionary of the 'State' and 'County' codes to keep
+    """
+    return {'State': sorted({county_code[:2] for county_code in county_codes}),
+            'County': sorted({county_code[2:] for county_code in county_codes})}
+    
+def cra_table_decoder(table: str, df: pd.core.frame.DataFrame) -> pd.core.frame.DataFrame:
+    """Used to map full descriptions to data entires that use codes as place holders in one cra table.
+    
+    Args:
+        table: name of the cra table (see cra_table_ids).
+        df: the cra table resulting from the cra_data_ingester function.
+    
+    Returns: 
+        The cra table with its codes mapped to descriptions
+    """
+    if table == 'transmittal':
+        df['Agency Code'] = decode_column(df['Agency Code'], 'cra_transmittal_agency_code')
+
+    elif table == 'a11':
+        df['Loan Type'] = decode_column(df['Loan Type'], 'cra_small_business_loan_type')
+
+        df['Action Taken Type'] = decode_column(df['Action Taken Type'], 'cra_originations_action_taken_type')
+
+        df['MSA/MD'] = df['MSA/MD'].replace(np.nan, "area outside of an MSA/MD")
+
+        df['Census Tract'] = df['Census Tract'].replace(np.nan, "totals")
+
+        df['Split County Indicator'] = decode_column(df['Split County Indicator'], 'cra_yes_no_uppercase', fill_value = "total")
+
+        df['Population Classification'] = decode_column(df['Population Classification'], 'cra_aggregate_population_classification', fill_value = "total")
+
+        df['Income Group Total'] = decode_column(df['Income Group Total'], 'cra_income_group', fill_value = "total")
+
+        df['Report Level'] = decode_column(df['Report Level'], 'cra_aggregate_report_level', fill_value = "not a total")
+
+    elif table == 'a11a':
+        df['Loan Type'] = decode_column(df['Loan Type'], 'cra_small_business_loan_type')
+
+        df['Action Taken Type'] = decode_column(df['Action Taken Type'], 'cra_originations_action_taken_type')
+
+        df['MSA/MD'] = df['MSA/MD'].replace(np.nan, "area outside of an MSA/MD")
+
+        df['Respondent ID'] = df['Respondent ID'].replace(np.nan, "total")
+
+        df['Agency Code'] = decode_column(df['Agency Code'], 'cra_agency_code', fill_value = "total")
+
+        df['Number of Lenders'] = df['Number of Lenders'].replace(np.nan, "not a total")
+
+        df['Report Level'] = decode_column(df['Report Level'], 'cra_aggregate_lender_report_level', fill_value = "not a total")
+
+
+    elif table == 'a12':
+        df['Loan Type'] = decode_column(df['Loan Type'], 'cra_small_business_loan_type')
+
+        df['Action Taken Type'] = decode_column(df['Action Taken Type'], 'cra_purchases_action_taken_type')
+
+        df['MSA/MD'] = df['MSA/MD'].replace(np.nan, "area outside of an MSA/MD")
+
+        df['Census Tract'] = df['Census Tract'].replace(np.nan, "total")
+
+        df['Split County Indicator'] = decode_column(df['Split County Indicator'], 'cra_yes_no', fill_value = "total")
+
+        df['Population Classification'] = decode_column(df['Population Classification'], 'cra_aggregate_population_classification', fill_value = "total")
+
+        df['Income Group Total'] = decode_column(df['Income Group Total'], 'cra_aggregate_income_group', fill_value = "totals")
+
+        df['Report Level'] = decode_column(df['Report Level'], 'cra_aggregate_report_level', fill_value = "not a total")
+
+    elif table == 'a12a':
+        df['Loan Type'] = decode_column(df['Loan Type'], 'cra_small_business_loan_type')
+
+        df['Action Taken Type'] = decode_column(df['Action Taken Type'], 'cra_purchases_action_taken_type')
+
+        df['MSA/MD'] = df['MSA/MD'].replace(np.nan, "area outside of an MSA/MD")
+
+        df['Respondent ID'] = df['Respondent ID'].replace(np.nan, "total")
+
+        df['Agency Code'] = decode_column(df['Agency Code'], 'cra_agency_code', fill_value = "total")
+
+        df['Number of Lenders'] = df['Number of Lenders'].replace(np.nan, "total")
+
+        df['Report Level'] = decode_column(df['Report Level'], 'cra_aggregate_lender_report_level', fill_value = "not a total")
+
+    elif table == 'a21':
+        df['Loan Type'] = decode_column(df['Loan Type'], 'cra_small_farm_loan_type')
+
+        df['Action Taken Type'] = decode_column(df['Action Taken Type'], 'cra_originations_action_taken_type')
+
+        df['MSA/MD'] = df['MSA/MD'].replace(np.nan, "area outside of an MSA/MD")
+
+        df['Census Tract'] = df['Census Tract'].replace(np.nan, "total")
+
+        df['Split County Indicator'] = decode_column(df['Split County Indicator'], 'cra_yes_no', fill_value = "total")
+
+        df['Population Classification'] = decode_column(df['Population Classification'], 'cra_aggregate_population_classification', fill_value = "total")
+
+        df['Income Group Total'] = decode_column(df['Income Group Total'], 'cra_aggregate_income_group', fill_value = "total")
+
+        df['Report Level'] = decode_column(df['Report Level'], 'cra_aggregate_report_level', fill_value = "not a total")
+
+    elif table == 'a21a':
+        df['Loan Type'] = decode_column(df['Loan Type'], 'cra_small_farm_loan_type')
+
+        df['Action Taken Type'] = decode_column(df['Action Taken Type'], 'cra_originations_action_taken_type')
+
+        df['MSA/MD'] = df['MSA/MD'].replace(np.nan, "area outside of an MSA/MD")
+
+        df['Respondent ID'] = df['Respondent ID'].replace(np.nan, "total")
+
+        df['Agency Code'] = decode_column(df['Agency Code'], 'cra_agency_code', fill_value = "total")
+
+        df['Number of Lenders'] = df['Number of Lenders'].replace(np.nan, "total")
+
+        df['Report Level'] = decode_column(df['Report Level'], 'cra_aggregate_lender_report_level', fill_value = "not a total")
+
+    elif table == 'a22':
+        df['Loan Type'] = decode_column(df['Loan Type'], 'cra_small_farm_loan_type')
+
+        df['Action Taken Type'] = decode_column(df['Action Taken Type'], 'cra_purchases_action_taken_type')
+
+        df['MSA/MD'] = df['MSA/MD'].replace(np.nan, "area outside of an MSA/MD")
+
+        df['Census Tract'] = df['Census Tract'].replace(np.nan, "total")
+
+        df['Split County Indicator'] = decode_column(df['Split County Indicator'], 'cra_yes_no', fill_value = "total")
+
+        df['Population Classification'] = decode_column(df['Population Classification'], 'cra_aggregate_population_classification', fill_value = "total")
+
+        df['Income Group Total'] = decode_column(df['Income Group Total'], 'cra_income_group', fill_value = "total")
+
+        df['Report Level'] = decode_column(df['Report Level'], 'cra_aggregate_report_level', fill_value = "not a total")
+
+    elif table == 'a22a':
+        df['Loan Type'] = decode_column(df['Loan Type'], 'cra_small_farm_loan_type')
+
+        df['Action Taken Type'] = decode_column(df['Action Taken Type'], 'cra_purchases_action_taken_type')
+
+        df['MSA/MD'] = df['MSA/MD'].replace(np.nan, "area outside of an MSA/MD")
+
+        df['Respondent ID'] = df['Respondent ID'].replace(np.nan, "total")
+
+        df['Agency Code'] = decode_column(df['Agency Code'], 'cra_agency_code', fill_value = "total")
+
+        df['Number of Lenders'] = df['Number of Lenders'].replace(np.nan, "total")
+
+        df['Report Level'] = decode_column(df['Report Level'], 'cra_aggregate_lender_report_level', fill_value = "not a total")
+
+    elif table == 'd11':
+        df['Agency Code'] = decode_column(df['Agency Code'], 'cra_agency_code')
+
+        df['Loan Type'] = decode_column(df['Loan Type'], 'cra_small_business_loan_type')
+
+        df['Action Taken Type'] = decode_column(df['Action Taken Type'], 'cra_originations_action_taken_type')
+
+        df['MSA/MD'] =  df['MSA/MD'].replace(np.nan, "area outside of MSA/MD")
+
+        df['Assessment Area Number'] =  df['Assessment Area Number'].replace(\
+            np.nan, "area outside of an Assessment Area (including predominately military areas)")
+
+        df['Partial County Indicator'] = decode_column(df['Partial County Indicator'], 'cra_yes_no', fill_value = "total")
+
+        df['Split County Indicator'] = decode_column(df['Split County Indicator'], 'cra_yes_no', fill_value = "total")
+
+        df['Population Classification'] = decode_column(df['Population Classification'], 'cra_population_classification', fill_value = "total")
+
+        df['Income Group Total'] = decode_column(df['Income Group Total'], 'cra_income_group', fill_value = "total")
+
+        df['Report Level'] = decode_column(df['Report Level'], 'cra_disclosure_report_level', fill_value = "not a total")
+
+    elif table == 'd12':
+        df['Agency Code'] = decode_column(df['Agency Code'], 'cra_agency_code')
+
+        df['Loan Type'] = decode_column(df['Loan Type'], 'cra_small_business_loan_type')
+
+        df['Action Taken Type'] = decode_column(df['Action Taken Type'], 'cra_purchases_action_taken_type')
+
+        df['MSA/MD'] =  df['MSA/MD'].replace(np.nan, "area outside of MSA/MD")
+
+        df['Assessment Area Number'] =  df['Assessment Area Number'].replace(\
+            np.nan, "area outside of an Assessment Area (including predominately military areas)")
+
+        df['Partial County Indicator'] = decode_column(df['Partial County Indicator'], 'cra_yes_no', fill_value = "total")
+
+        df['Split County Indicator'] = decode_column(df['Split County Indicator'], 'cra_yes_no', fill_value = "total")
+
+        df['Population Classification'] = decode_column(df['Population Classification'], 'cra_population_classification', fill_value = "total")
+
+        df['Income Group Total'] = decode_column(df['Income Group Total'], 'cra_income_group', fill_value = "total")
+
+        df['Report Level'] = decode_column(df['Report Level'], 'cra_disclosure_report_level', fill_value = "not a total")
+
+    elif table == 'd21':
+        df['Agency Code'] = decode_column(df['Agency Code'], 'cra_agency_code')
+
+        df['Loan Type'] = decode_column(df['Loan Type'], 'cra_small_farm_loan_type')
+
+        df['Action Taken Type'] = decode_column(df['Action Taken Type'], 'cra_originations_action_taken_type')
+
+        df['MSA/MD'] =  df['MSA/MD'].replace(np.nan, "area outside of MSA/MD")
+
+        df['Assessment Area Number'] =  df['Assessment Area Number'].replace(\
+            np.nan, "area outside of an Assessment Area (including predominately military areas)")
+
+        df['Partial County Indicator'] = decode_column(df['Partial County Indicator'], 'cra_yes_no', fill_value = "total")
+
+        df['Split County Indicator'] = decode_column(df['Split County Indicator'], 'cra_yes_no', fill_value = "total")
+
+        df['Population Classification'] = decode_column(df['Population Classification'], 'cra_population_classification', fill_value = "total")
+
+        df['Income Group Total'] = decode_column(df['Income Group Total'], 'cra_income_group', fill_value = "total")
+
+        df['Report Level'] = decode_column(df['Report Level'], 'cra_disclosure_report_level', fill_value = "not a total")
+
+    elif table == 'd22':
+        df['Agency Code'] = decode_column(df['Agency Code'], 'cra_agency_code')
+
+        df['Loan Type'] = decode_column(df['Loan Type'], 'cra_small_farm_loan_type')
+
+        df['Action Taken Type'] = decode_column(df['Action Taken Type'], 'cra_purchases_action_taken_type')
+
+        df['MSA/MD'] =  df['MSA/MD'].replace(np.nan, "area outside of MSA/MD")
+
+        df['Assessment Area Number'] =  df['Assessment Area Number'].replace(\
+            np.nan, "area outside of an Assessment Area (including predominately military areas)")
+
+        df['Partial County Indicator'] = decode_column(df['Partial County Indicator'], 'cra_yes_no', fill_value = "total")
+
+        df['Split County Indicator'] = decode_column(df['Split County Indicator'], 'cra_yes_no', fill_value = "total")
+
+        df['Population Classification'] = decode_column(df['Population Classification'], 'cra_population_classification', fill_value = "total")
+
+        df['Income Group Total'] = decode_column(df['Income Group Total'], 'cra_income_group', fill_value = "total")
+
+        df['Report Level'] = decode_column(df['Report Level'], 'cra_disclosure_report_level', fill_value = "not a total")
+
+    elif table == 'd3':
+        df['Agency Code'] = decode_column(df['Agency Code'], 'cra_agency_code')
+
+        df['Loan Type'] = decode_column(df['Loan Type'], 'cra_small_business_loan_type')
+
+        df['MSA/MD'] = df['MSA/MD'].replace(np.nan, "area outside of MSA/MD")
+
+        df['Assessment Area Number'] =  df['Assessment Area Number'].replace(\
+            np.nan, "area outside of an Assessment Area (including predominately military areas)")
+
+        df['Partial County Indicator'] = decode_column(df['Partial County Indicator'], 'cra_yes_no', fill_value = "total")
+
+        df['Split County Indicator'] = decode_column(df['Split County Indicator'], 'cra_yes_no', fill_value = "total")
+
+        df['Report Level'] = decode_column(df['Report Level'], 'cra_assessment_area_report_level')
+
+    elif table == 'd4':
+        df['Agency Code'] = decode_column(df['Agency Code'], 'cra_agency_code')
+
+        df['Loan Type'] = decode_column(df['Loan Type'], 'cra_small_farm_loan_type')
+
+        df['MSA/MD'] = df['MSA/MD'].replace(np.nan, "area outside of MSA/MD")
+
+        df['Assessment Area Number'] =  df['Assessment Area Number'].replace(\
+            np.nan, "area outside of an Assessment Area (including predominately military areas)")
+
+        df['Partial County Indicator'] = decode_column(df['Partial County Indicator'], 'cra_yes_no', fill_value = "total")
+
+        df['Split County Indicator'] = decode_column(df['Split County Indicator'], 'cra_yes_no', fill_value = "total")
+
+        df['Report Level'] = decode_column(df['Report Level'], 'cra_assessment_area_report_level')
+
+    elif table == 'd5':
+        df['Agency Code'] = decode_column(df['Agency Code'], 'cra_agency_code')
+
+        df['Loan Type'] = decode_column(df['Loan Type'], 'cra_community_development_loan_type')
+
+        df['Action Type'] = decode_column(df['Action Type'], 'cra_action_type')
+
+    elif table == 'd6':
+        df['Agency Code'] = decode_column(df['Agency Code'], 'cra_agency_code', fill_value = "total")
+
+        df['MSA/MD'] = df['MSA/MD'].replace(np.nan, "area outside of MSA/MD")
+
+        df['Census Tract'] = format_census_tracts(df['Census Tract'])
+
+        df['Assessment Area Number'] =  df['Assessment Area Number'].replace(\
+            np.nan, "area outside of an Assessment Area(s) (including predominately military areas)")
+
+        df['Partial County Indicator'] = decode_column(df['Partial County Indicator'], 'cra_yes_no')
+
+        df['Split County Indicator'] = decode_column(df['Split County Indicator'], 'cra_yes_no')
+
+        df['Population Classification'] = decode_column(df['Population Classification'], 'cra_population_classification')
+
+        df['Income Group'] = decode_column(df['Income Group'], 'cra_assessment_area_income_group')
+
+        df['Loan Indicator'] = decode_column(df['Loan Indicator'], 'cra_yes_no')
+
+    return df
+
+def cra_mapping_function(df_dictionary: dict[str: pd.core.frame.DataFrame])->dict[str: pd.core.frame.DataFrame]:
+    """Used to map full descriptions to data entires that use codes as place holders in cra data. Tables of a
+    LazyTableDict are mapped when they are loaded.
+    
+    Args:
+        df_dictionary: a dictionary of dataframes reulting from the cra_data_ingester function.
+    
+    Returns: 
+        A dictionary of cra data dataframes where the .dat cra data file name is the key and the corresponding dataframe is the value.
+    """
+    for file_name in list(df_dictionary.keys()):
+        map_table(df_dictionary, file_name, partial(cra_table_decoder, cra_table_id(file_name)))
+    return df_dictionary
+
+def cra_table_fips_mapper(df: pd.core.frame.DataFrame,
+                          fcc_fips_dict: dict[str: dict[str: str]],
+                          file_name: str = None) -> pd.core.frame.DataFrame:
+    """Used to map state and county names to their corresponding fips codes in one cra table.
+    
+    Args:
+        df: a cra table resulting from the cra_mapping_function function.
+        fcc_fips_dict: a dictioanry of state and county fips codes resulting from the fcc_fips_mappings_getter function.
+        file_name: name of the cra file, printed when the table has state and county columns.
+    
+    Returns: 
+        The cra table with state and county names mapped in (unchanged if it has no state and county columns)
+    """
+    if 'State' and 'County' in df.columns:
+        print(file_name)
+        df['County'] = remove_float_suffixes(df['County'])
+        df['State'] = remove_float_suffixes(df['State'])
+        df['State'] = pad_state_codes(df['State'])
+        df['County'] = pad_county_codes(df['County'])
+        df['County'] = df['State'] + df['County']
+        df['State_Name'] = df['State'].map(fcc_fips_dict['fcc_states'])
+        df['County_Name'] = df['County'].map(fcc_fips_dict['fcc_counties'])
+        df['State'] = df['State_Name']
+        df['County'] = df['County_Name']
+        df = df.drop(columns = ['State_Name','County_Name'], axis = 1)
+    return df
+
+def state_county_fips_mapper(df_dict: dict[pd.core.frame.DataFrame],
+                             fcc_fips_dict: dict[str: dict[str: str]]) -> dict[str: pd.core.frame.DataFrame]:
+    """Used to map state and county names to their corresponding fips codes in cra data. Tables of a LazyTableDict are
+    mapped when they are loaded.
+    
+    Args:
+        df_dict: a dictionary of dataframes reulting from the cra_mapping_function function.
+        fcc_fips_dict: a dictioanry of state and county fips codes resulting from the fcc_fips_mappings_getter function.
+    
+    Returns: 
+        A dictionary of cra data dataframes with state and county names mapped in. The .dat cra data file name is the key and the corresponding dataframe is the value.
+    """
+    for i in list(df_dict.keys()):
+        map_table(df_dict, i, partial(cra_table_fips_mapper, fcc_fips_dict = fcc_fips_dict, file_name = i))
+    return df_dict
+
+def cra_table_worker(data_folder: str,
+                     file_name: str,
+                     table: str,
+                     fcc_fips_dict: dict[str: dict[str: str]],
+                     record_filter: dict[str: list] = None) -> pd.core.frame.DataFrame:
+    """Used to read in, decode and map the state and county names of one cra table (run in a worker process by
+    cra_parallel_ingester).
+    
+    Args:
+        data_folder: folder holding the cra files or their zip archives.
+        file_name: name of the cra file.
+        table: name of the cra table (see cra_table_ids).
+        fcc_fips_dict: a dictioanry of state and county fips codes resulting from the fcc_fips_mappings_getter function.
+        record_filter: fields mapped to the raw values to keep, passed to read_fixed_width.
+    
+    Returns: 
+        The cra table, the same as it comes out of state_county_fips_mapper
+    """
+    df = cra_table_reader(data_folder, file_name, *cra_fwf_dimensions[table], record_filter = record_filter)
+    df = cra_table_decoder(table, df)
+    return cra_table_fips_mapper(df, fcc_fips_dict, file_name)
+
+def cra_parallel_ingester(fcc_fips_dict: dict[str: dict[str: str]],
+                          data_folder: str = 'data',
+                          file_lst: list = [],
+                          tables: list = None,
+                          prefilter: bool = False,
+                          county_codes: list = hmda_county_codes,
+                          workers: int = None) -> dict[str: pd.core.frame.DataFrame]:
+    """Used to read in, decode and map the state and county names of the cra tables with a table per worker process.
+    Gives the same dictionary as running cra_data_ingester, cra_mapping_function and state_county_fips_mapper, with
+    every table loaded. The largest files are started first so the run takes about as long as the largest table.
+    
+    Args:
+        fcc_fips_dict: a dictioanry of state and county fips codes resulting from the fcc_fips_mappings_getter function.
+        data_folder: folder holding the cra files or their zip archives.
+        file_lst: names of the cra files to read in.
+        tables: cra tables to read in (see cra_table_ids). All tables by default.
+        prefilter: passed to cra_data_ingester.
+        county_codes: passed to cra_data_ingester.
+        workers: number of worker processes. Defaults to one per cpu; tables are read in this process if 1.
+    
+    Returns: 
+        A dictionary of cra data dataframes where the .dat cra data file name is the key and the corresponding dataframe is the value.
+
+    Raises:
+        ValueError: if tables has a name that is not in cra_table_ids.
+    """
+    table_files = cra_table_files(data_folder, file_lst, cra_selected_tables(tables))
+    workers = min(workers or os.cpu_count() or 1, max(len(table_files), 1))
+    table_args = {i: (data_folder, i, table, fcc_fips_dict,
+                      cra_county_record_filter(county_codes) if prefilter and table in cra_prefilter_table_ids else None)
+                  for i, table in table_files.items()}
+    if workers == 1:
+        return {i: cra_table_worker(*args) for i, args in table_args.items()}
+
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+        futures = {i: executor.submit(cra_table_worker, *table_args[i])
+                   for i in sorted(table_files, key = lambda i: source_file_size(data_folder, i), reverse = True)}
+        return {i: futures[i].result() for i in table_files}
+
+# cra tables kept by thousands_adder
+cra_final_table_ids = ['d11', 'd6', 'transmittal']
+
+def cra_table_finisher(table: str, df: pd.core.frame.DataFrame) -> pd.core.frame.DataFrame:
+    """Used to multiply the fields of one cra table that contain total loan amounts by 1000, and to subset the
+    disclosure 1-1 and disclosure 6 tables for entries in Texas and in counties of focus.
+    
+    Args:
+        table: name of the cra table (see cra_table_ids).
+        df: a cra table resulting from the state_county_fips_mapper function.
+    
+    Returns: 
+        The cra table with loan amount columns showing their full amount(e.g. 153 is now 153000)
+    """
+    # multiply all fields containing "total loan amount" by 1000
+    for column in df.columns:
+        if 'Total Loan Amount'in column:
+            df[column] = df[column]*1000 
+
+    # fill in leading zeroes for right justified Respondent IDs
+    if table in ['transmittal', 'd11', 'd6']:
+        df['Respondent ID'] = format_respondent_ids(df['Respondent ID'])
+
+    if table == 'transmittal':
+        # rename 'respondent' fields to 'institution' in transmittal sheet
+        return df.rename(columns = {
+            'Respondent Name':'Institution name',
+            'Respondent Address':'Institution address',
+            'Respondent City':'Institution city',
+            'Respondent State':'Institution state',
+            'Respondent Zip Code':'Institution zip code',
+            'Assets':'Institution assets'})
+
+    # filter Discl 11 and Discl 6 down to Texas and Tarrant, Collin, and Dallas counties
+    if table in ['d11', 'd6']:
+        df = df[df['State'] == 'TEXAS']
+        df = df[(df['County'] == 'Tarrant County') | (df['County'] == 'Collin County') | (df['County'] == 'Dallas County')]
+
+    # remove leading and trailing whitespace from column of all datasets
+    return df.rename(columns = lambda x: x.strip())
+
+def thousands_adder(df_dict: dict[str: pd.core.frame.DataFrame]) -> dict[str: pd.core.frame.DataFrame]:
+    """" Multiplies all fields in cra data that contain total loan amounts by 1000, subsets all files in dictionary for disclosure 1-1 and disclosure 6 datasets, then subsets those datasets for entires in Texas and in counties of focus.
+    Tables of a LazyTableDict are only finished (and read in) when they are looked up.
+        
+    Args:
+        df_dict: A dictionary of cra dataframes reulting from the state_county_fips_mapper function. 
+        
+    Returns:
+         A dictionary of cra dataframes with loan amount columns showing their full amount(e.g. 153 is not 153000)
+         """
+    final_tables = {}
+    for file_name in list(df_dict.keys()):
+        table = cra_table_id(file_name)
+        map_table(df_dict, file_name, partial(cra_table_finisher, table))
+        if table in cra_final_table_ids and table not in final_tables:
+            final_tables[table] = file_name
+
+    # Only keep D11 and D6 (to cut down on memory issues)
+    final_files = [final_tables[table] for table in cra_final_table_ids if table in final_tables]
+    if isinstance(df_dict, LazyTableDict):
+        return df_dict.subset(final_files)
+    final_cra_dict = {file_name: df_dict[file_name] for file_name in final_files}
+    return final_cra_dict
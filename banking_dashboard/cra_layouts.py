@@ -0,0 +1,258 @@
+# layouts of the cra aggregate and disclosure .dat fixed width files (field names and widths for each table), and
+# helpers to tell which table a file holds from its name
+
+transmittal_fields = ["Respondent ID", "Agency Code","Activity Year","Respondent Name","Respondent Address","Respondent City",
+                  "Respondent State","Respondent Zip Code", "Tax ID", "ID_RSSD", "Assets"]
+
+transmittal_widths = [10,1,4,30,40,25,2,10,10,10,10]
+
+
+
+a_1_1_fields  = ["Table ID","Activity Year", "Loan Type", "Action Taken Type", "State", "County", "MSA/MD", "Census Tract", 
+"Split County Indicator", "Population Classification", "Income Group Total", "Report Level",
+"Number of Small Business Loans Originated with Loan Amount at Origination < or = to $100,000", 
+"Total Loan Amount of Small Business Loans Originated with Loan Amount at Origination < or = to $100,000",
+"Number of Small Business Loans Originated with Loan Amount at Origination > 100,000 and < or = to $250,000",
+"Total Loan Amount of Small Business Loans Originated with Loan Amount at Origination > $100,000 and < or = to $250,000",
+"Number of Small Business Loans Originated with Loan Amount at Origination > $250,000 and < or = to $1,000,000", 
+"Total Loan Amount of Small Business Loans Originated with Loan Amount at Origination > $250,000 and < or = to $1,000,000" ,
+"Number of Loans Originated to Small Businesses with Gross Annual Revenues < or = to $1 million",
+"Total Loan Amount of Loans Originated to Small Businesses with Gross Annual Revenues < or = to $1 million", "Filler"]
+
+a_1_1_widths = [5,4,1,1,2,3,5,7,1,1,3,3,10,10,10,10,10,10,10,10,29]
+
+
+
+a_1_1a_fields = ["Table ID","Activity Year", "Loan Type", "Action Taken Type", "State", "County", "MSA/MD", "Respondent ID", "Agency Code",
+                 "Number of Lenders", "Report Level", "Number of Small Business Loans", "Total Loan Amount of Small Business Loans",
+                 "Number of loans to Small Businesses with Gross Annual Revenues < or = to $1 million",
+                 "Total Loan Amount of loans to Small Businesses with Gross Annual Revenues < or = to $1 million", "Filler"]
+
+a_1_1a_widths = [5,4,1,1,2,3,5,10,1,5,3,10,10,10,10,65]
+
+a_1_2_fields = ["Table ID","Activity Year", "Loan Type", "Action Taken Type", "State", "County", "MSA/MD", "Census Tract", "Split County Indicator", 
+"Population Classification", "Income Group Total", "Report Level", 
+"Number of Small Business Loans Purchased with Loan Amount at Origination < or = to $100,000",
+"Total Loan Amount of Small Business Loans Purchased with Loan Amount at Origination < or = to $100,000", 
+"Number of Small Business Loans Purchased with Loan Amount at Origination > 100,000 and < or = to $250,000", 
+"Total Loan Amount of Small Business Loans Purchased with Loan Amount at Origination > $100,000 and < or = to $250,000", 
+"Number of Small Business Loans Purchased with Loan Amount at Origination > $250,000 and < or = to $1,000,000", 
+"Total Loan Amount of Small Business Loans Purchased with Loan Amount at Origination > $250,000 and < or = to $1,000,000", 
+"Number of Small Business Loans Purchased with Gross Annual Revenues < or = to $1 million", 
+"Total Loan Amount of Small Business Loans Purchased with Gross Annual Revenues < or = to $1 million", "Filler"]
+
+
+a_1_2_widths = [5,4,1,1,2,3,5,7,1,1,3,3,10,10,10,10,10,10,10,10,29]
+
+
+a_1_2a_fields = ["Table ID","Activity Year", "Loan Type", "Action Taken Type", "State", "County", "MSA/MD", "Respondent ID",
+"Agency Code", "Number of Lenders", "Report Level", "Number of Small Business Loans", "Total Loan Amount of Small Business Loans", 
+"Number of loans to Small Businesses with Gross Annual Revenues < or = to $1 million",
+"Total Loan Amount of loans to Small Businesses with Gross Annual Revenues < or = to $1 million", "Filler"]
+
+a_1_2a_widths = [5,4,1,1,2,3,5,10,1,5,3,10,10,10,10,65]
+
+
+a_2_1_fields = ["Table ID","Activity Year", "Loan Type", "Action Taken Type", "State", "County", "MSA/MD", "Census Tract", "Split County Indicator", 
+"Population Classification", "Income Group Total", "Report Level", "Number of Small Farm Loans Originated with Loan Amount at Origination < $100,000", 
+"Total Loan Amount of Small Farm Loans Originated with Loan Amount at Origination < $100,000", 
+"Number of Small Farm Loans Originated with Loan Amount at Origination > 100,000 and < or = to $250,000",
+"Total Loan Amount of Small Farm Loans Originated with Loan Amount at Origination > $100,000 and < or = to $250,000", 
+"Number of Small Farm Loans Originated with Loan Amount at  Origination > $250,000 and < or = to $500,000", 
+"Total Loan Amount of Small Farm Loans Originated with Loan Amount at Origination > $250,000 and < or = to $500,000",
+"Number of Loans Originated to Small Farms with Gross Annual Revenues < or = to $1 million", 
+"Total Loan Amount of Loans Originated to Small Farms with Gross Annual Revenues < or = to $1 million", "Filler"]
+
+
+a_2_1_widths = [5,4,1,1,2,3,5,7,1,1,3,3,10,10,10,10,10,10,10,10,29]
+
+
+a_2_1a_fields = ["Table ID","Activity Year", "Loan Type", "Action Taken Type", "State", "County", "MSA/MD", "Respondent ID", "Agency Code", 
+"Number of Lenders", "Report Level", "Number of Small Farm Loans", "Total Loan Amount of Small Farm Loans",
+"Number of loans to Small Farms with Gross Annual Revenues < or = to $1 million",
+"Total Loan Amount of loans to Small Farms with Gross Annual Revenues < or = to $1 million", "Filler"]
+
+a_2_1a_widths = [5,4,1,1,2,3,5,10,1,5,3,10,10,10,10,65]
+
+a_2_2_fields = ["Table ID","Activity Year", "Loan Type", "Action Taken Type", "State", "County", "MSA/MD", "Census Tract", "Split County Indicator",
+"Population Classification", "Income Group Total", "Report Level",
+"Number of Small Farm Loans Purchased with Loan Amount at Origination < or = to $100,000",
+"Total Loan Amount of Small Farm Loans Purchased with Loan Amount at Origination < or = to $100,000", 
+"Number of Small Farm Loans Purchased with Loan Amount at Origination > 100,000 and < or = to $250,000", 
+"Total Loan Amount of Small Farm Loans Purchased with Loan Amount at Origination > $100,000 and < or = to $250,000", 
+"Number of Small Farm Loans Purchased with Loan Amount at Origination > $250,000 and < or = to $500,000", 
+"Total Loan Amount of Small Farm Loans Purchased with Loan Amount at Origination > $250,000 and < or = to $500,000", 
+"Number of Small Farm Loans Purchased with Gross Annual Revenues < or = to $1 million",
+"Total Loan Amount of Small Farm Loans Purchased with Gross Annual Revenues < or = to $1 million", "Filler"]
+
+a_2_2_widths = [5,4,1,1,2,3,5,7,1,1,3,3,10,10,10,10,10,10,10,10,29]
+
+a_2_2a_fields = ["Table ID","Activity Year", "Loan Type", "Action Taken Type", "State", "County", "MSA/MD", "Respondent ID", "Agency Code", 
+"Number of Lenders", "Report Level", "Number of Small Farm Loans", "Total Loan Amount of Small Farm Loans",
+"Number of loans to Small Farms with Gross Annual Revenues < or = to $1 million", 
+"Total Loan Amount of loans to Small Farms with Gross Annual Revenues < or = to $1 million", "Filler"]
+
+
+a_2_2a_widths = [5,4,1,1,2,3,5,10,1,5,3,10,10,10,10,65]
+
+
+d_1_1_fields = ["Table ID","Respondent ID", "Agency Code", "Activity Year", "Loan Type", "Action Taken Type", "State", "County", "MSA/MD", 
+                "Assessment Area Number", "Partial County Indicator", "Split County Indicator", "Population Classification", 
+                "Income Group Total", "Report Level",
+                "Number of Small Business Loans Originated with Loan Amount at Origination < or = to $100,000", 
+                "Total Loan Amount of Small Business Loans Originated with Loan Amount at Origination < or = to $100,000", 
+                "Number of Small Business Loans Originated with Loan Amount at Origination > 100,000 and < or = to $250,000",
+                "Total Loan Amount of Small Business Loans Originated with Loan Amount at Origination > $100,000 and < or = to $250,000", 
+                "Number of Small Business Loans Originated with Loan Amount at Origination > $250,000 and < or = to $1,000,000", 
+                "Total Loan Amount of Small Business Loans Originated with Loan Amount at Origination > $250,000 and < or = to $1,000,000",
+                "Number of Loans Originated to Small Businesses with Gross Annual Revenues < $1 million", 
+                "Total Loan Amount of Loans Originated to Small Businesses with Gross Annual Revenues < or = to $1 million", 
+                "Number of Small Business Loans Originated Reported as Affiliate Loans", 
+                "Total Loan Amount of Small Business Loans Originated Reported as Affiliate Loans"]
+
+d_1_1_widths = [5,10,1,4,1,1,2,3,5,4,1,1,1,3,3,10,10,10,10,10,10,10,10,10,10]
+
+
+d_1_2_fields = ["Table ID","Respondent ID", "Agency Code", "Activity Year", "Loan Type", "Action Taken Type", "State", "County", "MSA/MD", 
+                "Assessment Area Number", "Partial County Indicator", "Split County Indicator", "Population Classification", 
+                "Income Group Total", "Report Level",
+                "Number of Small Business Loans Purchased with Loan Amount at Origination < or = to $100,000",
+                "Total Loan Amount of Small Business Loans Purchased with Loan Amount at Origination < or = to $100,000", 
+                "Number of Small Business Loans Purchased with Loan Amount at Origination > 100,000 and < or = to $250,000",
+                "Total Loan Amount of Small Business Loans Purchased with Loan Amount at Origination > $100,000 and < or = to $250,000",
+                "Number of Small Business Loans Purchased with Loan Amount at Origination > $250,000 and <or = to $1,000,000", 
+                "Total Loan Amount of Small Business Loans Purchased with Loan Amount at Origination > $250,000 and < $1,000,000", 
+                "Number of Small Business Loans Purchased with Gross Annual Revenues < or = to $1 million", 
+                "Total Loan Amount Small Business Loans Purchased with Gross Annual Revenues < or = to $1 million", 
+                "Number of Small Business Loans Purchased Reported as Affiliate Loans",
+                "Total Loan Amount of Small Business Loans Purchased Reported as Affiliate Loans"]
+
+d_1_2_widths = [5,10,1,4,1,1,2,3,5,4,1,1,1,3,3,10,10,10,10,10,10,10,10,10,10]
+
+
+
+d_2_1_fields = ["Table ID","Respondent ID", "Agency Code", "Activity Year", "Loan Type", "Action Taken Type", "State", "County", "MSA/MD", 
+                "Assessment Area Number", "Partial County Indicator", "Split County Indicator", "Population Classification", 
+                "Income Group Total", "Report Level", 
+                "Number of Small Farm Loans Originated with Loan Amount at Origination < or = to $100,000", 
+                "Total Loan Amount of Small Farm Loans Originated with Loan Amount at Origination < or = to $100,000",
+                "Number of Small Farm Loans Originated with Loan Amount at Origination > 100,000 and < or = to $250,000",
+                "Total Loan Amount of Small Farm Loans Originated with Loan Amount at Origination > $100,000 and < $250,000", 
+                "Number of Small Farm Loans Originated with Loan Amount at Origination > $250,000 and < or = to $500,000", 
+                "Total Loan Amount of Small Farm Loans Originated with Loan Amount at Origination > $250,000 and < or = to $500,000",
+                "Number of Loans Originated to Small Farms with Gross Annual Revenues < or = to $1 million", 
+                "Total Loan Amount of Loans Originated to Small Farms with Gross Annual Revenues < $1 million",
+                "Number of Small Farm Loans Originated Reported as Affiliate Loans",
+                "Total Loan Amount of Small Farm Originated Loans Reported as Affiliate Loans"]
+
+d_2_1_widths = [5,10,1,4,1,1,2,3,5,4,1,1,1,3,3,10,10,10,10,10,10,10,10,10,10]
+
+
+
+d_2_2_fields = ["Table ID","Respondent ID", "Agency Code", "Activity Year", "Loan Type", "Action Taken Type", "State", "County", "MSA/MD", 
+                "Assessment Area Number", "Partial County Indicator", "Split County Indicator", "Population Classification", 
+                "Income Group Total", "Report Level",
+                "Number of Small Farm Loans Purchased with Loan Amount at Origination < or = to $100,000", 
+                "Total Loan Amount of Small Farm Loans Purchased with Loan Amount at Origination < or = to $100,000", 
+                "Number of Small Farm Loans Purchased with Loan Amount at Origination > 100,000 and < or = to $250,000",
+                "Total Loan Amount of Small Farm Loans Purchased with Loan Amount at Origination > $100,000 and < or = to $250,000", 
+                "Number of Small Farm Loans Purchased with Loan Amount at Origination > $250,000 and < $500,000", 
+                "Total Loan Amount of Small Farm Loans Purchased with Loan Amount at Origination > $250,000 and < $500,000", 
+                "Number of Small Farm Loans Purchased with Gross Annual Revenues < or = to $1 million",
+                "Total Loan Amount of Small Farm Loans Purchased with Gross Annual Revenues < $1 million", 
+                "Number of Small Farm Loans Purchased Reported as Affiliate Loans",
+                "Total Loan Amount of Small Farm Loans Purchased Reported as Affiliate Loans"]
+
+d_2_2_widths = [5,10,1,4,1,1,2,3,5,4,1,1,1,3,3,10,10,10,10,10,10,10,10,10,10]
+
+
+
+d3_fields = ["Table ID","Respondent ID", "Agency Code", "Activity Year", "Loan Type", "State", "County", "MSA/MD", 
+      "Assessment Area Number", "Partial County Indicator", "Split County Indicator", "Report Level", 
+      "Number of Small Business Loans Originated", "Total Loan Amount of Small Business Loans Originated", 
+      "Number of Loans Originated to Small Businesses with Gross Annual Revenues < or = to $1 million",
+      "Total Loan Amount of Loans Originated to Small Businesses with Gross Annual Revenues < or = to $1 million", 
+      "Number of Small Business Loans Purchased", "Total Loan Amount of Small Business Loans Purchased", "Filler"]
+
+d3_widths = [5,10,1,4,1,2,3,5,4,1,1,2,10,10,10,10,10,10,46]
+
+
+
+d4_fields = ["Table ID","Respondent ID", "Agency Code", "Activity Year", "Loan Type", "State", "County", "MSA/MD", 
+      "Assessment Area Number", "Partial County Indicator", "Split County Indicator", "Report Level",
+      "Number of Small Farm Loans Originated", "Total Loan Amount of Small Farm Loans Originated",
+      "Number of Loans Originated to Small Farms with Gross Annual Revenues < or = to $1 million", 
+      "Total Loan Amount of Loans Originated to Small Farms with Gross Annual Revenues < or = to $1 million",
+      "Number of Small Farm Loans Purchased", "Total Loan Amount of Small Farm Loans Purchased", "Filler"]
+
+
+d4_widths = [5,10,1,4,1,2,3,5,4,1,1,2,10,10,10,10,10,10,46]
+
+
+d5_fields = ["Table ID","Respondent ID", "Agency Code", "Activity Year", "Loan Type", "Number of Loans",
+            "Total Loan Amount of Loans", "Number of Loans Reported as Affiliate Loans",
+             "Total Loan Amount of Loans Reported as Affiliate Loans", "Action Type", "Filler"]
+
+
+d5_widths = [5,10,1,4,1,10,10,10,10,1,83]
+
+
+d6_fields = ["Table ID","Respondent ID", "Agency Code", "Activity Year","State", "County", "MSA/MD", "Census Tract",
+             "Assessment Area Number", "Partial County Indicator", "Split County Indicator", "Population Classification", 
+             "Income Group", "Loan Indicator", "Filler"]
+
+d6_widths = [5,10,1,4,2,3,5,7,4,1,1,1,3,1,96]
+
+# field widths and names of each cra table
+cra_fwf_dimensions = {
+    'transmittal':[transmittal_widths,transmittal_fields],
+    'a11':[a_1_1_widths,a_1_1_fields],
+    'a11a':[a_1_1a_widths,a_1_1a_fields],
+    'a12':[a_1_2_widths,a_1_2_fields],
+    'a12a':[a_1_2a_widths,a_1_2a_fields],
+    'a21':[a_2_1_widths,a_2_1_fields],
+    'a21a':[a_2_1a_widths,a_2_1a_fields],
+    'a22':[a_2_2_widths,a_2_2_fields],
+    'a22a':[a_2_2a_widths,a_2_2a_fields],
+    'd11':[d_1_1_widths,d_1_1_fields],
+    'd12':[d_1_2_widths,d_1_2_fields],
+    'd21':[d_2_1_widths,d_2_1_fields],
+    'd22':[d_2_2_widths,d_2_2_fields],
+    'd3':[d3_widths,d3_fields],
+    'd4':[d4_widths,d4_fields],
+    'd5':[d5_widths,d5_fields],
+    'd6':[d6_widths,d6_fields]}
+
+# cra tables, named by the part of the .dat file name that identifies them
+cra_table_ids = ['transmittal', 'a11', 'a11a', 'a12', 'a12a', 'a21', 'a21a', 'a22', 'a22a',
+                 'd11', 'd12', 'd21', 'd22', 'd3', 'd4', 'd5', 'd6']
+
+def cra_table_id(file_name: str) -> str:
+    """Used to find which cra table a .dat file holds from its name (ex: 'cra2022_Discl_D11.dat' is 'd11').
+
+    Args:
+        file_name: name of the cra file.
+    
+    Returns: 
+        The table's name in cra_table_ids, or None if the file is not a cra table
+    """
+    file_name = file_name.lower()
+    # 'a11a' is checked before 'a11' since the a11 name is part of the a11a name
+    for table in sorted(cra_table_ids, key = len, reverse = True):
+        if table in file_name:
+            return table
+    return None
+
+def cra_field_position(table: str, field: str) -> tuple[int, int]:
+    """Used to find where a field sits in the records of a cra table.
+    
+    Args:
+        table: name of the cra table (see cra_table_ids).
+        field: name of the field (ex: 'County').
+    
+    Returns: 
+        The field's offset from the start of the record and its width, in characters
+    """
+    widths, fields = cra_fwf_dimensions[table]
+    position = fields.index(field)
+    return sum(widths[:position]), widths[position]
@@ -0,0 +1,167 @@
+# helper functions to read in the fdic institutions and branch locations files. The geocoder and the tract assigner are
+# only imported by the function that uses them
+
+import os
+import time
+import pandas as pd
+from code_tables import decode_column
+from geo_keys import format_census_tracts
+from zip_counties import zip_county_names
+from common_fcns import fcc_fips_mappings
+
+def changec_label_adder(data_folder: str,file_name: str)->dict[str: str]:
+    """Used to create dictionary of old column names as the key and new column names as the value using the institutions definitions file.
+    
+    Args: 
+        file_name: Name of institutions definitions data file
+        
+    Returns:
+        a dictionary of old column names as the keys and new column names as the values
+        """
+    institutions_definitions_df = pd.read_csv(os.path.join(data_folder,file_name))
+    col_name_replace_map = dict(zip(institutions_definitions_df['Variable Name'],institutions_definitions_df['Variable Label']))  
+    # loop through the dictionary create between the variable name and variable label fields to add numbers to distinguish the CHANGEC
+    # values
+    for original_field in col_name_replace_map.keys():
+        if "CHANGEC" in original_field: 
+            col_name_replace_map[original_field] = col_name_replace_map[original_field] + " " + original_field.split('CHANGEC')[1]
+    col_name_replace_map['FED_RSSD'] = 'Federal Reserve ID Number 2'
+    col_name_replace_map['TRACT'] = 'Institutions with reportable fiduciary related service'
+    return col_name_replace_map  
+
+def fdic_institutions_ingester(data_folder: str,
+                               institutions_file_name: str, 
+                               col_replace_map: dict[str: str], 
+                               analysis_yr: str) -> pd.core.frame.DataFrame:
+    """Used to read in institution data for those created on or before 12/31/analysis_year and are in dallas, collins or tarrant county.
+    
+    Args: 
+        institutions_file_name: Name of institutions data file
+        col_replace_map: dictionary containing columns names returned from changec_label_adder() function.
+        
+    Returns:
+        A dataframe of the fdic institutions data
+        """
+    year_upper_bound = str(analysis_yr) + '-12-31'
+    institutions_df = pd.read_csv(os.path.join(data_folder,institutions_file_name))
+    institutions_df = institutions_df.rename(columns = col_replace_map)
+    # map in values for columns using numbers to represnet description
+    institutions_df['Institution Status'] = decode_column(institutions_df['Institution Status'], 'fdic_institution_status')  
+    institutions_df["Institution Class"] = decode_column(institutions_df["Institution Class"], 'fdic_institution_class')
+    institutions_df['Metropolitan Divisions Flag'] = decode_column(institutions_df['Metropolitan Divisions Flag'], 'fdic_yes_no')
+    institutions_df['Metropolitan Division Flag'] = decode_column(institutions_df['Metropolitan Division Flag'], 'fdic_yes_no')
+    institutions_df['Micropolitan Division Flag'] = decode_column(institutions_df['Micropolitan Division Flag'], 'fdic_yes_no')
+    institutions_df['CFPB Flag'] = decode_column(institutions_df['CFPB Flag'], 'fdic_cfpb_flag')
+    institutions_df['CSA Area Flag'] = decode_column(institutions_df['CSA Area Flag'], 'fdic_yes_no')
+    institutions_df['Numeric Code'] = decode_column(institutions_df['Numeric Code'], 'fdic_numeric_code')
+    institutions_df['Conservatorship'] = decode_column(institutions_df['Conservatorship'], 'fdic_yes_no')
+    institutions_df['CSA Area Flag'] = decode_column(institutions_df['CSA Area Flag'], 'fdic_yes_no')
+    institutions_df = institutions_df.astype({'Federal Reserve ID Number': str})
+    institutions_df['Federal Reserve ID Number'] = decode_column(institutions_df['Federal Reserve ID Number'], 'fdic_federal_reserve_district')
+    institutions_df['Primary Regulator'] = decode_column(institutions_df['Primary Regulator'], 'fdic_primary_regulator')
+    institutions_df['Supervisory Region Number'] = decode_column(institutions_df['Supervisory Region Number'], 'fdic_supervisory_region')
+    institutions_df['Trust Powers'] = decode_column(institutions_df['Trust Powers'], 'fdic_trust_powers')
+    institutions_df['State Charter'] = decode_column(institutions_df['State Charter'], 'fdic_yes_no_lowercase')
+    institutions_df['FFIEC Call Report 31 Filer'] = decode_column(institutions_df['FFIEC Call Report 31 Filer'], 'fdic_yes_no_lowercase')
+    institutions_df['Bank Holding Company Type'] = decode_column(institutions_df['Bank Holding Company Type'], 'fdic_yes_no_lowercase')
+    institutions_df['Deposit Insurance Fund member'] = decode_column(institutions_df['Deposit Insurance Fund member'], 'fdic_yes_no')
+    institutions_df['Law Sasser Flag'] = decode_column(institutions_df['Law Sasser Flag'], 'fdic_yes_no')
+    institutions_df = institutions_df.astype({'Credit Card Institutions':int}, errors = 'ignore')
+    # filter for established in 12/31/analysis_year or before
+    institutions_df['Established Date'] = pd.to_datetime(institutions_df['Established Date'])
+    institutions_df[institutions_df['Established Date'] <= year_upper_bound]
+    # filter for dallas, collins and tarrant counties in TX
+    institutions_df = institutions_df[institutions_df['State Alpha code'] == 'TX']
+    institutions_df = institutions_df[(institutions_df['County'] == 'Tarrant') | (institutions_df['County'] == 'Collin') | (institutions_df['County'] == 'Dallas')]
+    institutions_df = institutions_df.reset_index().set_index('FDIC Certificate #').reset_index()
+    institutions_df = institutions_df.rename(columns = lambda x: x.strip())
+    return institutions_df
+
+def fdic_locations_mapper(data_folder: str,locations_def_file: str, locations_file: str, analysis_yr: str, tract_file: str = None)->pd.core.frame.DataFrame:
+    """Used to read in locations data for those created on or before 12/31/analysis_year and are in dallas, collins or tarrant county.
+    
+    Args: 
+        locations_file: Name of locations data file
+        locations_def_file: Name of locations definitions file
+        tract_file: Name of a TIGER/Line tract shapefile in data_folder (ex: 'tl_2022_48_tract.shp'). If given, branches
+            are placed in census tracts from their latitude and longitude offline instead of geocoding their addresses
+        
+    Returns:
+        A dataframe of of the fdic locations data
+    """ 
+    year_upper_bound = str(analysis_yr) + '-12-31'
+    loc_fed_df = pd.read_csv(os.path.join(data_folder,locations_def_file))
+    bkclass_replace_map = dict(zip(loc_fed_df.iloc[2:8,:]['TITLE'].str.replace(' ','').str.strip('-'), loc_fed_df.iloc[2:8,:]['DEFINITION']))
+    serve_type_map = dict(zip(loc_fed_df.iloc[31:47,:]['TITLE'],loc_fed_df.iloc[31:47,:]['DEFINITION']))
+    inst_col_name_map = dict(zip(loc_fed_df[loc_fed_df['NAME'].notnull()]['NAME'], loc_fed_df[loc_fed_df['NAME'].notnull()]['TITLE']))
+    fdic_locations_df = pd.read_csv(os.path.join(data_folder,locations_file))
+    fdic_locations_df['BKCLASS'] = fdic_locations_df['BKCLASS'].map(bkclass_replace_map)
+    fdic_locations_df['SERVTYPE'] = fdic_locations_df['SERVTYPE'].map(serve_type_map)
+    fdic_locations_df.rename(columns = inst_col_name_map, inplace = True)
+    # map descriptions to columns using codes as place holders
+    fdic_locations_df['Metropolitan Divisions Flag (Branch)'] = decode_column(fdic_locations_df['Metropolitan Divisions Flag (Branch)'], 'fdic_yes_no')
+    fdic_locations_df['Metropolitan Division Flag (Branch)'] = decode_column(fdic_locations_df['Metropolitan Division Flag (Branch)'], 'fdic_yes_no')
+    fdic_locations_df['Micropolitan Division Flag (Branch)'] = decode_column(fdic_locations_df['Micropolitan Division Flag (Branch)'], 'fdic_yes_no')
+    fdic_locations_df['Combined Statistical Area Flag  (Branch)'] = decode_column(fdic_locations_df['Combined Statistical Area Flag  (Branch)'], 'fdic_yes_no')
+    fdic_locations_df['Branch Established Date'] = pd.to_datetime(fdic_locations_df['Branch Established Date'])
+    fdic_locations_df = fdic_locations_df[fdic_locations_df['Branch Established Date'] <= year_upper_bound]
+    # filter for location in texas and counties that are dallas, collins or tarrant
+    fdic_locations_df = fdic_locations_df[fdic_locations_df['Branch State   '] == 'Texas']
+    final_fdic_locations_df = fdic_locations_df[(fdic_locations_df['Branch County'] == 'Tarrant') | (fdic_locations_df['Branch County'] == 'Collin') | (fdic_locations_df['Branch County'] == 'Dallas')]
+    final_fdic_locations_df = final_fdic_locations_df.rename(columns = lambda x: x.strip())
+    # create county column based on zipcodes column
+    final_fdic_locations_df['County_from_Zipcode'] = zip_county_names(final_fdic_locations_df['Branch Zip Code'], counties = ["Dallas","Collin","Tarrant"])
+
+    # create columns for census tract and county  based on branch address
+    # final_fdic_locations_df['Full Branch Address'] = final_fdic_locations_df['Branch Address'] + ', ' + final_fdic_locations_df['Branch City'] + ', ' + final_fdic_locations_df['Branch State Abbreviation'] + ' ' + final_fdic_locations_df['Branch Zip Code'].apply(str)
+    # tqdm.pandas()
+    # final_fdic_locations_df['data_from_adr_geocode'] = final_fdic_locations_df['Full Branch Address'].progress_apply(lambda x: get_census_geocode(x))
+    # final_fdic_locations_df['county_from_address'] = final_fdic_locations_df['data_from_adr_geocode'].apply(lambda x: x['county'])
+    # final_fdic_locations_df['county_from_address'] = final_fdic_locations_df['county_from_address'] + ' County'
+    # final_fdic_locations_df['census_tract_from_address'] = final_fdic_locations_df['data_from_adr_geocode'].apply(lambda x: x['census_tract'])
+    # final_fdic_locations_df['census_tract_from_address'] = final_fdic_locations_df['census_tract_from_address'].fillna(value = np.nan).apply(float)/100
+    # final_fdic_locations_df['census_tract_from_address'] = final_fdic_locations_df['census_tract_from_address'].apply(format_census_tract)
+    # final_fdic_locations_df = final_fdic_locations_df.drop(columns = ['Full Branch Address'])
+
+    if tract_file is not None:
+        # place branches in census tracts from their coordinates
+        from tract_assigner import assign_tracts
+        coordinate_columns = {column.lower(): column for column in final_fdic_locations_df.columns}
+        final_fdic_locations_df = final_fdic_locations_df.reset_index(drop = True)
+        start = time.time()
+        tract_df = assign_tracts(final_fdic_locations_df[coordinate_columns['longitude']], final_fdic_locations_df[coordinate_columns['latitude']], data_folder, tract_file)
+        end = time.time()
+        print('process completed in',end - start, 'seconds')
+        final_fdic_locations_df = pd.concat([final_fdic_locations_df, tract_df], axis = 1)
+    else:
+        # create a subset dataset of the fdic locations data that will be used to batch search for census and related geographic information
+        final_fdic_locations_df = final_fdic_locations_df.reset_index()
+        final_fdic_locations_df['index'] = final_fdic_locations_df['index'].apply(str)
+        final_fdic_locations_df['idx_branch_number'] = '(' + final_fdic_locations_df['index'] +') '+  final_fdic_locations_df['Branch Number'].apply(str)
+        final_fdic_locations_df[['idx_branch_number','Branch Address','Branch City', 'Branch State Abbreviation','Branch Zip Code']].set_index('idx_branch_number').to_csv(os.path.join(data_folder,'fdic_locations_sample.csv'))
+
+        # lookup census codes for batch (co-located branches share an address and are geocoded once)
+        from geocoding import census_batch_lookup
+        start = time.time()
+        b = census_batch_lookup(os.path.join(data_folder,'fdic_locations_sample.csv'), 'Branch')
+        end = time.time()
+        print('process completed in',end - start, 'seconds')
+
+        # merge in new census codes to original dataset
+        b = b.reset_index()
+        b['index'] = b['Branch identifier'].str.split(')').replace('(','').apply(lambda x: x[0].replace('(',''))
+        final_fdic_locations_df = pd.merge(final_fdic_locations_df,b, left_on = ['index'], right_on = ['index'], how = 'left')
+
+    # reformat census tract column
+    final_fdic_locations_df['_tract'] = final_fdic_locations_df['_tract'].apply(float)/100
+    final_fdic_locations_df['_tract'] = format_census_tracts(final_fdic_locations_df['_tract'])
+
+    # map in state and county names 
+    fips_dict = fcc_fips_mappings()
+    final_fdic_locations_df['_county_fips_code'] = final_fdic_locations_df['_state_fips_code'].apply(str) + final_fdic_locations_df['_county_fips_code'].apply(str)
+    final_fdic_locations_df['_county_fips_code'] = final_fdic_locations_df['_county_fips_code'].map(fips_dict['fcc_counties'])
+    final_fdic_locations_df['_state_fips_code'] = final_fdic_locations_df['_state_fips_code'].map(fips_dict['fcc_states'])
+    final_fdic_locations_df = final_fdic_locations_df.rename(columns = {'_county_fips_code':'_fips_county_name', '_state_fips_code':'_fips_state_name'})
+    final_fdic_locations_df['Branch County'] = final_fdic_locations_df['Branch County'] + ' County'
+    
+    return final_fdic_locations_df
@@ -0,0 +1,218 @@
+# helper functions to read in the ffiec census flat file and its data dictionary
+
+import io
+import os
+import hashlib
+import pandas as pd
+from source_files import open_source_file
+from code_tables import decode_column
+from geo_keys import format_census_tracts, pad_county_codes, pad_state_codes
+from common_fcns import hmda_county_codes, fcc_fips_mappings
+
+# census flat file key fields, always read in since the records are subset and reformatted on them
+ffiec_key_columns = ["Key field. HMDA/CRA collection year",
+                     "Key field. MSA/MD Code",
+                     "Key field. FIPS state code",
+                     "Key field. FIPS county code",
+                     "Key field. Census tract. Implied decimal point."]
+
+# census flat file flag columns mapped to the code table their values are decoded with and the description used for
+# missing values
+ffiec_flag_columns = {
+    "Principal city flag. 0=not principal city, 1=principal city": ('ffiec_principal_city_flag', None),
+    "Small county flag. T=tract record, S=small county, I=island area": ('ffiec_small_county_flag', None),
+    "Split tract flag. N=tract number occurs within one MA, S=split between Mas": ('ffiec_split_tract_flag', None),
+    "Demographic data flag. X=Total persons/population or median family income is 0, D=total persons/population and median family income are not 0, I=Island Area": ('ffiec_demographic_data_flag', None),
+    "Urban/rural flag. U=urban, R=rural, M=mixed, I=Island Area": ('ffiec_urban_rural_flag', None),
+    "CRA poverty criteria. 'X' - Yes , ' ' (blank space) - No": ('ffiec_cra_criteria_flag', "No"),
+    "CRA unemployment criteria. 'X' - Yes , ' ' (blank space) - No": ('ffiec_cra_criteria_flag', "No"),
+    "CRA distressed criteria. 'X' - Yes , ' ' (blank space) - No": ('ffiec_cra_criteria_flag', "No"),
+    "CRA remote rural (low density) criteria. 'X' -Yes, ' ' (blank space) - No": ('ffiec_cra_criteria_flag', "No"),
+    "Previous year CRA distressed criteria. 'X' - Yes , ' ' (blank space) - No": ('ffiec_cra_criteria_flag', "No"),
+    "Previous year CRA underserved criterion. 'X' - Yes , ' ' (blank space) - No": ('ffiec_cra_criteria_flag', "No"),
+    "Meets at least one of current or previous year's CRA distressed/underserved tract criteria? 'X' - Yes, ' ' (blank space) - No": ('ffiec_cra_criteria_flag', "No")}
+
+# rows of the census flat file read in at a time
+ffiec_chunk_rows = 10000
+
+def ffiec_data_dictionary_cache_path(data_folder: str, data_dict: str) -> str:
+    """Used to get the path of the parsed data dictionary cached next to the census flat file definitions workbook.
+    
+    Args:
+        data_folder: folder holding the workbook or the zip archive it was downloaded in.
+        data_dict: name of the census flat file definitions workbook.
+    
+    Returns: 
+        The path of the cache file
+    """
+    return os.path.join(data_folder, os.path.basename(data_dict) + '.dictionary.pkl')
+
+def ffiec_data_dictionary(data_folder: str, data_dict: str, use_cache: bool = True) -> pd.core.frame.DataFrame:
+    """Used to get the census flat file data dictionary (a row per flat file column, in column order). The parsed
+    dictionary is pickled next to the workbook along with the workbook's sha256 hash, and later calls load the pickle
+    instead of parsing the workbook again until the workbook changes.
+    
+    Args:
+        data_folder: folder holding the workbook or the zip archive it was downloaded in.
+        data_dict: name of the census flat file definitions workbook.
+        use_cache: if False the workbook is always parsed and no cache is written.
+    
+    Returns: 
+        The 'Data Dictionary' sheet of the workbook with its 'Index', 'Description' and other columns, without the rows
+        that do not describe a flat file column
+        
+    Raises: 
+        FileNotFoundError: if the workbook is not in data_folder or any of its zip archives.
+    """
+    # the workbook is small so it is read into memory first since excel files need to be seekable
+    with open_source_file(data_folder, data_dict) as data_dict_file:
+        workbook = data_dict_file.read()
+    workbook_hash = hashlib.sha256(workbook).hexdigest()
+    cache_path = ffiec_data_dictionary_cache_path(data_folder, data_dict)
+    if use_cache and os.path.exists(cache_path):
+        cached_dictionary = pd.read_pickle(cache_path)
+        if cached_dictionary.get('workbook_hash') == workbook_hash:
+            return cached_dictionary['data_dictionary']
+    data_dictionary = pd.read_excel(io.BytesIO(workbook), sheet_name = 'Data Dictionary')
+    data_dictionary = data_dictionary[data_dictionary['Index']>=0]
+    if use_cache:
+        pd.to_pickle({'workbook_hash': workbook_hash, 'data_dictionary': data_dictionary}, cache_path)
+    return data_dictionary
+
+def ffiec_read_options(data_dictionary: pd.core.frame.DataFrame, columns: list = None, dtype: dict = None) -> tuple[list, dict]:
+    """Used to turn a census flat file column selection into pd.read_csv options. The flat file has no header, so
+    columns are picked by their position in the data dictionary.
+    
+    Args:
+        data_dictionary: output of ffiec_data_dictionary.
+        columns: data dictionary descriptions of the columns to read in (the key fields in ffiec_key_columns are always
+            read in). All columns if None.
+        dtype: data dictionary descriptions mapped to the type to read a column in as.
+    
+    Returns: 
+        The positions of the columns to read in (usecols) and their types by position (dtype)
+        
+    Raises: 
+        ValueError: if columns or dtype name a description that is not in the data dictionary.
+    """
+    descriptions = list(data_dictionary['Description'])
+    unknown_columns = [column for column in list(columns or []) + list(dtype or {}) if column not in descriptions]
+    if unknown_columns:
+        raise ValueError('columns not in the census flat file data dictionary: ' + str(unknown_columns))
+    read_columns = set(descriptions) if columns is None else set(ffiec_key_columns) | set(columns)
+    read_positions = [position for position, column in enumerate(descriptions) if column in read_columns]
+    read_dtypes = {descriptions.index(column): column_dtype for column, column_dtype in (dtype or {}).items()}
+    return read_positions, read_dtypes
+
+def ffiec_flat_file_extractor(data_folder: str,
+                              file: str,
+                              data_dict: str,
+                              ingest_all = False,
+                              columns: list = None,
+                              county_codes: list = None,
+                              dtype: dict = None,
+                              fcc_fips_dict: dict = None)->pd.core.frame.DataFrame:
+    """Used to extract csv files from ffiec website and convert into pandas dataframe. The flat file is read in by
+    chunks and each chunk is subset on its raw state and county fips codes as it is read, so only the tracts of the
+    counties of focus are kept in memory.
+    
+    Args:
+        data_folder: folder holding the flat file and data dictionary, or the zip archives they were downloaded in.
+        file: name of the census flat file csv (ex: 'CensusFlatFile2022.csv').
+        data_dict: name of the census flat file definitions workbook.
+        columns: data dictionary descriptions of the columns to read in (the key fields in ffiec_key_columns are always
+            read in). All columns by default.
+        county_codes: five digit county fips codes to keep (any state). Defaults to hmda_county_codes (Collin, Dallas
+            and Tarrant).
+        dtype: data dictionary descriptions mapped to the type to read a column in as (ex: {'Total persons': 'float32'}).
+            Numeric columns without a type are cast to float.
+        fcc_fips_dict: state and county names from fcc_fips_mappings. Loaded from the local snapshot if not given.
+    
+    Returns: 
+        A dataframe of the downloaded and transformed zip file
+        
+    Raises: 
+        FileNotFoundError: if either file is not in data_folder or any of its zip archives.
+        ValueError: if columns or dtype name a description that is not in the data dictionary.
+    """
+    # filename = wget.download(file_url)
+    # zip_ref = zipfile.ZipFile(filename, 'r')
+    # current_dir = os.getcwd()
+    # unzipped = zip_ref.extractall(current_dir)
+    # both files can be plain files or members of a zip archive in data_folder
+    data_dictionary = ffiec_data_dictionary(data_folder, data_dict)
+    new_ffiec_cols = list(data_dictionary['Description'])
+    read_positions, read_dtypes = ffiec_read_options(data_dictionary, columns, dtype)
+    state_position = new_ffiec_cols.index("Key field. FIPS state code")
+    county_position = new_ffiec_cols.index("Key field. FIPS county code")
+    keep_codes = [int(county_code) for county_code in (hmda_county_codes if county_codes is None else county_codes)]
+
+    # keep the chunks' rows in the counties of focus (state code * 1000 + county code is the five digit fips code)
+    data_chunks = []
+    with open_source_file(data_folder, file) as data_file:
+        for data_chunk in pd.read_csv(data_file, header = None, usecols = read_positions, dtype = read_dtypes,
+                                      chunksize = ffiec_chunk_rows):
+            fips_codes = pd.to_numeric(data_chunk[state_position], errors = 'coerce') * 1000 +\
+                         pd.to_numeric(data_chunk[county_position], errors = 'coerce')
+            data_chunks.append(data_chunk[fips_codes.isin(keep_codes)])
+    data = pd.concat(data_chunks)
+    replacement_map = dict(zip(range(len(new_ffiec_cols)), new_ffiec_cols))
+    data.rename(columns = replacement_map, inplace=True)
+    # replace values in columns with their definitions. Ex: 1 replaced with "principal city" in Principal city flag column
+    for flag_column, (code_table, fill_value) in ffiec_flag_columns.items():
+        if flag_column in data.columns:
+            data[flag_column] = decode_column(data[flag_column], code_table, fill_value = fill_value)
+    # rename columns
+    data.rename(columns = {"Key field. HMDA/CRA collection year":"HMDA/CRA collection year",
+                       "Principal city flag. 0=not principal city, 1=principal city":"Principal city flag",
+                      "Small county flag. T=tract record, S=small county, I=island area":"Small county flag",
+                      "Split tract flag. N=tract number occurs within one MA, S=split between Mas":"Split tract flag",
+                      "Demographic data flag. X=Total persons/population or median family income is 0, D=total persons/population and median family income are not 0, I=Island Area":"Demographic data flag",
+                      "Urban/rural flag. U=urban, R=rural, M=mixed, I=Island Area":"Urban/rural flag",
+                      "CRA poverty criteria. 'X' - Yes , ' ' (blank space) - No":"CRA poverty criteria",
+                      "CRA unemployment criteria. 'X' - Yes , ' ' (blank space) - No":"CRA unemployment criteria",
+                      "CRA distressed criteria. 'X' - Yes , ' ' (blank space) - No":"CRA distressed criteria",
+                      "CRA remote rural (low density) criteria. 'X' -Yes, ' ' (blank space) - No":"CRA remote rural (low density) criteria",
+                      "Previous year CRA distressed criteria. 'X' - Yes , ' ' (blank space) - No":"Previous year CRA distressed criteria",
+                      "Previous year CRA underserved criterion. 'X' - Yes , ' ' (blank space) - No":"Previous year CRA underserved criterion",
+                      "Meets at least one of current or previous year's CRA distressed/underserved tract criteria? 'X' - Yes, ' ' (blank space) - No":"Meets at least one of current or previous year's CRA distressed/underserved tract criteria?",
+                      "Key field. MSA/MD Code":"MSA/MD Code",
+                      "Key field. FIPS state code":"FIPS state code",
+                      "Key field. FIPS county code":"FIPS county code",
+                      "Key field. Census tract. Implied decimal point.":"Census tract. Implied decimal point"}, inplace = True)
+    # cast alphanumeric values to stings and numeric only values to floats
+    alphanumeric_field_list = ["HMDA/CRA collection year",
+                "MSA/MD Code",
+                "FIPS state code",
+                "FIPS county code",
+                "Census tract. Implied decimal point",
+                "Principal city flag",
+                "Small county flag",
+                "Split tract flag",
+                "Demographic data flag",
+                "Urban/rural flag",
+                "CRA poverty criteria",
+                "CRA unemployment criteria",
+                "CRA distressed criteria",
+                "CRA remote rural (low density) criteria",
+                "Previous year CRA distressed criteria",
+                "Previous year CRA underserved criterion",
+                "Meets at least one of current or previous year's CRA distressed/underserved tract criteria?"]
+    alphanum_to_str_dict = {an_field: str for an_field in alphanumeric_field_list if an_field in data.columns} 
+    data = data.astype(alphanum_to_str_dict) # casting aplhanumeric fields to strings
+    # columns read in with a type of their own keep it
+    numeric_field_list = list(data.loc[:,~data.columns.isin(alphanumeric_field_list + list(dtype or {}))].columns)
+    numeric_to_float_dict = {n_field:float for n_field in numeric_field_list} 
+    data = data.astype(numeric_to_float_dict) # casting numeric fields to floats 
+    data['Census tract. Implied decimal point'] = data['Census tract. Implied decimal point'].apply(int)/100
+    data['Census tract. Implied decimal point'] = format_census_tracts(data['Census tract. Implied decimal point'])
+    data['FIPS state code'] = pad_state_codes(data['FIPS state code'])
+    data['FIPS county code'] = data['FIPS state code'] + pad_county_codes(data['FIPS county code'])
+    # keep the counties of focus by their padded five digit fips codes, before they are replaced with names
+    data = data[data['FIPS county code'].isin([str(int(county_code)).zfill(5) for county_code in keep_codes])]
+    fips_dict = fcc_fips_mappings() if fcc_fips_dict is None else fcc_fips_dict
+    data['FIPS state code'] = data['FIPS state code'].map(fips_dict['fcc_states'])
+    data['FIPS county code'] = data['FIPS county code'].map(fips_dict['fcc_counties'])
+    data = data.rename(columns = {'Census tract. Implied decimal point':'Census tract', 'FIPS county code':'County','FIPS state code':'State'})
+    data = data.rename(columns = lambda x: x.strip())
+    return data
@@ -0,0 +1,143 @@
+# helper functions to work on the numeric census flat file columns (output of ffiec_flat_file_extractor) as one float32
+# matrix. Named column groups (ex: the race counts the summaries add up) are stored as weight matrices, so all of a
+# group's totals for every tract come out of a single matrix multiply
+
+import numpy as np
+import pandas as pd
+
+# race counts by race (Hispanic or Latino ethnicity not considered), as built in the tabular summaries
+_race_asian_columns = ['Total population Asian',
+                       'Total population White and Asian',
+                       'Total population American Indian or Alaska native',
+                       'Total population White and Native Hawaiian or other Pacific Islander',
+                       'Total population Native Hawaiian or other Pacific Islander']
+_race_black_columns = ['Total population Black/African American',
+                       'Total population White and Black',
+                       'Total population Black and American Indian or Alaska Native']
+_race_white_columns = ['Total population White',
+                       'Total population White and some other race']
+
+# race and ethnicity counts (Hispanic or Latino of any race, the other groups non-Hispanic)
+_ethnicity_hispanic_columns = ['Total population Hispanic or Latino by race']
+_ethnicity_white_columns = ['Total population non-Hispanic White']
+_ethnicity_black_columns = ['Total population non-Hispanic White and Black',
+                            'Total population non-Hispanic Black/African American',
+                            'Total population non-Hispanic Black and American Indian or Alaska native']
+_ethnicity_asian_columns = ['Total population non-Hispanic Asian',
+                            'Total population non-Hispanic native Hawaiian or other Pacific Islander',
+                            'Total population non-Hispanic White and Asian',
+                            'Total population non-Hispanic White and Native Hawaiian or other Pacific Islander']
+
+
+def _remainder(total_column: str, *column_lists) -> dict[str: float]:
+    """Used to define a group column as a total minus other columns (ex: people of some other race)."""
+    weights = {total_column: 1.0}
+    for columns in column_lists:
+        for column in columns:
+            weights[column] = weights.get(column, 0.0) - 1.0
+    return weights
+
+
+# named column groups. Each group maps the columns it makes to the flat file columns they add up, given as a list of
+# columns (each added once) or as a dictionary of columns and the weight they are added with
+ffiec_column_groups = {
+    'race': {
+        'Total Population Asian': _race_asian_columns,
+        'Total Population Black': _race_black_columns,
+        'Total Population White': _race_white_columns,
+        'Total population': ['Total population by race'],
+        'Total Population Other': _remainder('Total population by race', _race_asian_columns, _race_black_columns,
+                                             _race_white_columns)},
+    'race_ethnicity': {
+        'Total Population Hispanic': _ethnicity_hispanic_columns,
+        'Total Population White': _ethnicity_white_columns,
+        'Total Population Black': _ethnicity_black_columns,
+        'Total Population Asian': _ethnicity_asian_columns,
+        'Total Population': ['Total population Hispanic and Non-Hispanic'],
+        'Total Population Other': _remainder('Total population Hispanic and Non-Hispanic', _ethnicity_hispanic_columns,
+                                             _ethnicity_white_columns, _ethnicity_black_columns,
+                                             _ethnicity_asian_columns)}}
+
+
+def ffiec_numeric_matrix(ffiec_df: pd.core.frame.DataFrame, columns: list = None) -> dict:
+    """Used to copy the numeric columns of the census flat file data into one contiguous float32 matrix.
+
+    Args:
+        ffiec_df: census flat file data (output of ffiec_flat_file_extractor).
+        columns: columns to put in the matrix. All numeric columns by default.
+
+    Returns:
+        A dictionary with the matrix ('values', a row per tract and a column per field), the names of its columns
+        ('columns', a pandas Index) and the row index of ffiec_df ('index').
+    """
+    if columns is None:
+        columns = ffiec_df.select_dtypes(include = 'number').columns
+    values = np.ascontiguousarray(ffiec_df[list(columns)].to_numpy(dtype = np.float32))
+    return {'values': values, 'columns': pd.Index(columns), 'index': ffiec_df.index}
+
+
+def ffiec_group_weights(ffiec_matrix: dict, group) -> tuple[np.ndarray, np.ndarray, list]:
+    """Used to turn a column group into a weight matrix over the matrix columns it uses.
+
+    Args:
+        ffiec_matrix: output of ffiec_numeric_matrix.
+        group: name of a group in ffiec_column_groups, or a group definition in the same form.
+
+    Returns:
+        The positions of the matrix columns the group uses, a float32 weight matrix with a row per used column and a
+        column per group column, and the names of the group columns.
+
+    Raises:
+        KeyError: if the group uses a column that is not in the matrix.
+    """
+    group = ffiec_column_groups[group] if isinstance(group, str) else group
+    group_weights = {name: (columns if isinstance(columns, dict) else {column: 1.0 for column in columns})
+                     for name, columns in group.items()}
+    used_columns = list(dict.fromkeys(column for weights in group_weights.values() for column in weights))
+    missing_columns = [column for column in used_columns if column not in ffiec_matrix['columns']]
+    if missing_columns:
+        raise KeyError('columns not in the ffiec matrix: ' + str(missing_columns))
+    weights = np.zeros((len(used_columns), len(group_weights)), dtype = np.float32)
+    for group_position, column_weights in enumerate(group_weights.values()):
+        for column, weight in column_weights.items():
+            weights[used_columns.index(column), group_position] += weight
+    return ffiec_matrix['columns'].get_indexer(used_columns), weights, list(group_weights)
+
+
+def ffiec_group_totals(ffiec_matrix: dict, group) -> pd.core.frame.DataFrame:
+    """Used to compute the columns of a group for every tract with one matrix multiply. A group column is missing for
+    a tract if any column it adds up is missing, like adding the columns up one by one. Counts are exact as long as
+    they stay below 2**24.
+
+    Args:
+        ffiec_matrix: output of ffiec_numeric_matrix.
+        group: name of a group in ffiec_column_groups, or a group definition in the same form.
+
+    Returns:
+        A float64 dataframe with a column per group column and the row index of the census flat file data.
+    """
+    positions, weights, names = ffiec_group_weights(ffiec_matrix, group)
+    values = ffiec_matrix['values'][:, positions]
+    missing = np.isnan(values)
+    totals = np.where(missing, 0, values) @ weights
+    if missing.any():
+        totals[(missing.astype(np.float32) @ (weights != 0).astype(np.float32)) > 0] = np.nan
+    return pd.DataFrame(totals.astype(np.float64), index = ffiec_matrix['index'], columns = names)
+
+
+def ffiec_group_shares(ffiec_matrix: dict, group, total_column: str, decimals: int = 2) -> pd.core.frame.DataFrame:
+    """Used to compute each group column as a percentage of one of the group's columns (ex: the share of each race in
+    a tract's total population).
+
+    Args:
+        ffiec_matrix: output of ffiec_numeric_matrix.
+        group: name of a group in ffiec_column_groups, or a group definition in the same form.
+        total_column: group column the others are divided by.
+        decimals: decimal places the percentages are rounded to.
+
+    Returns:
+        A dataframe with a percentage column for every group column except total_column, named like the group column.
+    """
+    totals = ffiec_group_totals(ffiec_matrix, group)
+    shares = totals.drop(columns = total_column).div(totals[total_column], axis = 0) * 100
+    return shares.round(decimals)
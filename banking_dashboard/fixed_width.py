@@ -0,0 +1,211 @@
+# helper functions to parse fixed width text files (like the CRA .dat files) with numpy. The file is read in as one byte
+# buffer, the records are laid out as rows of a 2d byte array and each field is sliced out of it as a block of columns,
+# so no line is split in python. Gives the same dataframe as pd.read_fwf(file, widths = widths, header = None,
+# names = names)
+
+import io
+import csv
+import numpy as np
+import pandas as pd
+
+# number of records laid out at a time when the records are not all the same length
+fixed_width_block_rows = 100000
+
+_space = ord(' ')
+_tab = ord('\t')
+
+
+def fixed_width_records(buffer: bytes, record_width: int) -> np.ndarray:
+    """Used to lay out the records of a fixed width file as the rows of a 2d byte array.
+
+    Args:
+        buffer: contents of the file.
+        record_width: number of characters of each record to keep (the sum of the field widths).
+
+    Returns:
+        A uint8 array with a row per record and record_width columns. Records shorter than record_width are padded with
+        spaces, and blank records are dropped like pd.read_fwf does.
+    """
+    data = np.frombuffer(buffer, dtype = np.uint8)
+    line_ends = np.flatnonzero(data == ord('\n'))
+    if len(data) > 0 and (len(line_ends) == 0 or line_ends[-1] != len(data) - 1):
+        line_ends = np.append(line_ends, len(data))
+    line_starts = np.concatenate([[0], line_ends[:-1] + 1]).astype(np.int64)
+    line_lengths = line_ends - line_starts
+    # drop the carriage return of windows line breaks
+    carriage_returns = np.zeros(len(line_ends), dtype = bool)
+    has_characters = line_lengths > 0
+    carriage_returns[has_characters] = data[line_ends[has_characters] - 1] == ord('\r')
+    line_lengths = line_lengths - carriage_returns
+
+    stride = line_lengths[0] + carriage_returns[0] + 1 if len(line_ends) > 0 else 0
+    if len(line_ends) > 0 and (line_lengths >= record_width).all() and (np.diff(line_starts) == stride).all():
+        # every record has the same length so the buffer can be viewed as a 2d array without copying it
+        padded = data if len(data) >= len(line_ends) * stride else np.concatenate([data, np.full(len(line_ends) * stride - len(data), ord('\n'), dtype = np.uint8)])
+        records = padded[:len(line_ends) * stride].reshape(len(line_ends), stride)[:, :record_width]
+    else:
+        records = np.empty((len(line_ends), record_width), dtype = np.uint8)
+        positions = np.arange(record_width)
+        for block_start in range(0, len(line_ends), fixed_width_block_rows):
+            block = slice(block_start, block_start + fixed_width_block_rows)
+            in_line = positions < line_lengths[block, None]
+            indices = np.minimum(line_starts[block, None] + positions, max(len(data) - 1, 0))
+            records[block] = np.where(in_line, data[indices], _space)
+    blank = ((records == _space) | (records == _tab)).all(axis = 1)
+    return records[~blank] if blank.any() else records
+
+
+def _number_field(field: np.ndarray):
+    """Used to convert a field made up only of numbers (digits with at most one decimal point) and surrounding spaces
+    straight from its bytes. The field is scanned one character column at a time for all records at once. Decimals are
+    the integer of their digits divided by a power of ten, which rounds the same way as parsing the text.
+
+    Args:
+        field: uint8 array with a row per record and a column per character of the field.
+
+    Returns:
+        The field as an int64 array (float64 if any record is blank or has a decimal point), or None if the field is
+        not made up only of numbers with spaces around them.
+    """
+    record_count, width = field.shape
+    if width > 15:
+        return None
+    # one contiguous row per character column
+    field_columns = np.ascontiguousarray(field.T)
+    values = np.zeros(record_count, dtype = np.int64)
+    decimals = np.zeros(record_count, dtype = np.int64)
+    point_count = np.zeros(record_count, dtype = np.int64)
+    started = np.zeros(record_count, dtype = bool)
+    ended = np.zeros(record_count, dtype = bool)
+    last_is_point = np.zeros(record_count, dtype = bool)
+    for position in range(width):
+        characters = field_columns[position]
+        is_digit = (characters >= ord('0')) & (characters <= ord('9'))
+        is_point = characters == ord('.')
+        is_space = characters == _space
+        is_character = is_digit | is_point
+        # a number is one run of digits ("1 2" is a string) with a decimal point only between digits
+        if not (is_character | is_space).all() or (is_character & ended).any() or (is_point & ~started).any():
+            return None
+        ended |= is_space & started
+        point_count += is_point
+        decimals += is_digit & (point_count > 0)
+        values = np.where(is_digit, values * 10 + characters.astype(np.int64) - ord('0'), values)
+        started |= is_character
+        last_is_point = np.where(is_character, is_point, last_is_point)
+    if (point_count > 1).any() or last_is_point.any():
+        return None
+    if point_count.any():
+        values = values / (10.0 ** decimals)
+    if started.all():
+        return values
+    return np.where(started, values, np.nan)
+
+
+def _text_field(field: np.ndarray) -> pd.Series:
+    """Used to convert any other field. Each distinct value is stripped once and the distinct values are run through
+    pandas' own type inference (numbers, booleans, missing value markers like 'NA'), so the column gets the same type and
+    values pd.read_fwf would give it.
+
+    Args:
+        field: uint8 array with a row per record and a column per character of the field.
+
+    Returns:
+        The field as a series.
+    """
+    field = np.ascontiguousarray(field)
+    width = field.shape[1]
+    if ((field == _space) | (field == _tab)).all():
+        return pd.Series(np.full(len(field), np.nan))
+    if width <= 8:
+        # pack the bytes of each record into one integer so the distinct values can be found by hashing
+        keys = np.zeros(len(field), dtype = np.uint64)
+        for position in range(width):
+            keys = (keys << np.uint64(8)) | field[:, position].astype(np.uint64)
+        positions, distinct_keys = pd.factorize(keys)
+        shifts = np.arange(width - 1, -1, -1, dtype = np.uint64) * np.uint64(8)
+        distinct_values = ((distinct_keys[:, None] >> shifts) & np.uint64(255)).astype(np.uint8).view('S' + str(width)).ravel()
+    else:
+        distinct_values, positions = np.unique(field.view('S' + str(width)).ravel(), return_inverse = True)
+    stripped_values = [value.decode('ascii').strip(' \t') for value in distinct_values]
+    # one value per line with no separator or quoting, and blank lines kept so empty values become missing
+    parsed_values = pd.read_csv(io.StringIO('\n'.join(stripped_values) + '\n'), header = None, names = ['value'],
+                                sep = '\x1f', quoting = csv.QUOTE_NONE, skip_blank_lines = False, engine = 'python')['value']
+    return parsed_values.take(positions).reset_index(drop = True)
+
+
+def _field_matches(field: np.ndarray, values: list) -> np.ndarray:
+    """Used to find the records whose field holds one of a list of values, straight from the field's bytes. Numbers are
+    compared as numbers (so '085', ' 85' and 85 all match) and anything else as stripped text.
+
+    Args:
+        field: uint8 array with a row per record and a column per character of the field.
+        values: values to keep.
+
+    Returns:
+        A boolean array with a row per record.
+    """
+    number_values = set(pd.to_numeric(pd.Series([str(value).strip() for value in values]), errors = 'coerce').dropna())
+    numbers = _number_field(field)
+    if numbers is not None:
+        return np.isin(numbers, list(number_values))
+    # fields with some text in them are checked once per distinct value
+    distinct_values, positions = np.unique(np.ascontiguousarray(field).view('S' + str(field.shape[1])).ravel(),
+                                           return_inverse = True)
+    text_values = {str(value).strip() for value in values}
+    stripped_values = [value.decode('ascii').strip(' \t') for value in distinct_values]
+    distinct_numbers = pd.to_numeric(pd.Series(stripped_values, dtype = object), errors = 'coerce')
+    distinct_matches = np.array([value in text_values or number in number_values
+                                 for value, number in zip(stripped_values, distinct_numbers)], dtype = bool)
+    return distinct_matches[positions]
+
+
+def read_fixed_width(file, widths: list[int], names: list[str], record_filter: dict[str: list] = None) -> pd.core.frame.DataFrame:
+    """Used to read in a fixed width file. Same output as pd.read_fwf(file, widths = widths, header = None,
+    names = names). Files with non-ascii characters, where byte and character positions can differ, are read in with
+    pd.read_fwf.
+
+    Args:
+        file: path of the file or a binary file object.
+        widths: width of each field.
+        names: name of each field.
+        record_filter: fields mapped to the values to keep (ex: {'State': ['48'], 'County': ['085', '113']}). Records are
+            kept if each of the fields holds one of its values. The fields are checked on the raw bytes before anything
+            else is parsed, and kept records keep the row number they would have in the full file as their index.
+
+    Returns:
+        A dataframe with a column per field.
+    """
+    if isinstance(file, str):
+        with open(file, 'rb') as fixed_width_file:
+            buffer = fixed_width_file.read()
+    else:
+        buffer = file.read()
+    if (np.frombuffer(buffer, dtype = np.uint8) >= 128).any():
+        df = pd.read_fwf(io.BytesIO(buffer), widths = widths, header = None, names = names)
+        for name, values in (record_filter or {}).items():
+            number_values = pd.to_numeric(pd.Series([str(value).strip() for value in values]), errors = 'coerce').dropna()
+            text = df[name].astype(str).str.strip()
+            df = df[text.isin([str(value).strip() for value in values]) |
+                    pd.to_numeric(text, errors = 'coerce').isin(number_values)]
+        return df
+
+    records = fixed_width_records(buffer, sum(widths))
+    field_starts = dict(zip(names, np.cumsum([0] + list(widths[:-1]))))
+    kept_rows = None
+    if record_filter:
+        keep = np.ones(len(records), dtype = bool)
+        for name, values in record_filter.items():
+            keep &= _field_matches(records[:, field_starts[name]:field_starts[name] + widths[names.index(name)]], values)
+        kept_rows = np.flatnonzero(keep)
+        records = records[kept_rows]
+
+    columns = {}
+    for name, width in zip(names, widths):
+        field = records[:, field_starts[name]:field_starts[name] + width]
+        values = _number_field(field)
+        columns[name] = pd.Series(values) if values is not None else _text_field(field)
+    df = pd.DataFrame(columns)
+    if kept_rows is not None:
+        df.index = kept_rows
+    return df
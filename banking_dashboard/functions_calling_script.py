@@ -25,7 +25,7 @@ hmda_dict = hmda_data_ingester('a') # can be any string currently
 cra_dict = cra_data_ingester('t') # can be any string currently 
 cra_dict_no_fips = cra_mapping_function(cra_dict)
 fcc_fips_url = 'https://transition.fcc.gov/oet/info/maps/census/fips/fips.txt'
-fcc_fips = fcc_fips_mappings_getter(fcc_fips_url)
+fcc_fips = fcc_fips_mappings(fcc_fips_url)
 cra_dict_mapped_fips = state_county_fips_mapper(cra_dict_no_fips, fcc_fips)
 final_cra_dict = thousands_adder(cra_dict_mapped_fips)
 
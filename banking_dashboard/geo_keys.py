@@ -0,0 +1,196 @@
+# helper functions to normalize state, county, census tract and respondent id keys. The per value functions are the
+# reference formats, and the column functions apply them to whole columns at once by normalizing each distinct value once
+
+import time
+import pandas as pd
+import numpy as np
+
+
+def fmt_respondent_id(respondent_id_val):
+  # Cast as string if necessary
+  respondent_id_val = str(respondent_id_val)
+  # Include as many leading zeroes as needed to get up to 10 characters
+  return respondent_id_val.zfill(10)
+
+def format_census_tract(tract_number):
+    return '%07.2F'% tract_number
+
+def clean_county_code(county_code, validate_tx = False):
+    """Cleans and formats a county code string.
+
+    Args:
+        county_code (int): The county code to be cleaned.
+
+    Returns:
+        str: The cleaned and formatted county code.
+    """
+    raw_county_code_str = str(county_code)
+    county_code_str = str(county_code)
+    county_code_str = county_code_str.replace('.0', '') # , regex=True
+    #county_code_str = county_code_str[:-3]
+    #if len(county_code_str) < 2:
+    #    county_code_str = '0' + county_code_str
+    #county_code_str += county_code_str[-3:]
+
+    if validate_tx and ('48085' in raw_county_code_str) | ('48113' in raw_county_code_str) | ('48439' in raw_county_code_str):
+        print(f'County code = converted from `{raw_county_code_str}` to `{county_code_str}`')
+
+    return county_code_str
+
+
+
+def clean_census_tract(census_tract, validate_tx = False):
+    """Cleans and formats a census tract string.
+
+    Args:
+        census_tract (str): The census tract to be cleaned.
+
+    Returns:
+        str: The cleaned and formatted census tract.
+    """
+    if not census_tract:
+        return '0000NAN_tract'
+    census_tract_raw = str(census_tract)
+    census_tract = census_tract_raw.replace('.0', '')
+    census_tract = census_tract[-6:]
+    census_tract = ''.join(census_tract[-6:-2] + '.' + census_tract[-2:])
+    census_tract = census_tract.replace('.an', 'an')
+    if validate_tx and ('48085' in census_tract_raw) | ('48113' in census_tract) | ('48439' in census_tract):
+        print(f'Census tract = converted from `{census_tract_raw}` to `{census_tract}`')
+    return census_tract
+
+def zero_adder(fips_code: str)->str:
+    """Takes in a county code string and add zeroes to make it accuarte  to the fcc website county codes.
+
+    Args:
+        fips_code: a county fips code from the cra files
+
+    Returns:
+        A county code string that matches the county portion of the county code on the fcc website.
+    """
+    if len(fips_code) == 1:
+        return '00'+ fips_code
+    elif len(fips_code) == 2:
+        return '0' + fips_code
+    else:
+        return fips_code
+
+def state_code_zero_adder(state_code: str)->str:
+    """Takes in a state fips code string and adds a leading zero to single digit codes.
+
+    Args:
+        state_code: a state fips code from the cra files
+
+    Returns:
+        A two digit state code string.
+    """
+    return '0'+ state_code if len(state_code)<2 else state_code
+
+def float_suffix_remover(value)->str:
+    """Casts a value to a string and removes the '.0' left over from codes read in as floats.
+
+    Args:
+        value: a code read in from a data file
+
+    Returns:
+        The code as a string without '.0'.
+    """
+    return str(value).replace('.0','')
+
+
+def normalize_column(column: pd.Series, normalizer) -> pd.Series:
+    """Used to apply a per value normalizer to a whole column. Gives the same output as column.apply(normalizer) but
+    calls the normalizer once per distinct value and spreads the results back over the rows with a numpy take, so the
+    cost depends on the number of distinct keys (tracts, counties, lenders) rather than the number of rows.
+
+    Args:
+        column: column of raw keys.
+        normalizer: function that normalizes a single key.
+
+    Returns:
+        A column of normalized keys with the same index and name as the column passed in.
+    """
+    if len(column) == 0:
+        return column.apply(normalizer)
+    values = column.to_numpy()
+    positions, distinct_values = pd.factorize(values)
+    normalized = np.empty(len(distinct_values) + 1, dtype = object)
+    normalized[:len(distinct_values)] = [normalizer(value) for value in distinct_values]
+    # missing values all share the -1 position (the last entry). In numeric columns they are all NaN, but object columns
+    # can mix None and NaN, which normalize differently, so those are normalized one by one
+    missing = positions == -1
+    if missing.any() and values.dtype != object:
+        normalized[-1] = normalizer(values[missing][0])
+    normalized_column = normalized[positions]
+    if missing.any() and values.dtype == object:
+        normalized_column[missing] = [normalizer(value) for value in values[missing]]
+    return pd.Series(normalized_column, index = column.index, name = column.name)
+
+def normalize_county_codes(column: pd.Series) -> pd.Series:
+    """Used to clean a column of LAR county codes. Same output as column.apply(clean_county_code)."""
+    return normalize_column(column, clean_county_code)
+
+def normalize_census_tracts(column: pd.Series) -> pd.Series:
+    """Used to clean a column of LAR census tracts. Same output as column.apply(clean_census_tract)."""
+    return normalize_column(column, clean_census_tract)
+
+def format_census_tracts(column: pd.Series) -> pd.Series:
+    """Used to format a column of numeric census tracts (ex: 78.06 -> '0078.06'). Same output as
+    column.apply(format_census_tract)."""
+    return normalize_column(column, format_census_tract)
+
+def pad_county_codes(column: pd.Series) -> pd.Series:
+    """Used to pad a column of county fips code strings to three digits. Same output as column.apply(zero_adder)."""
+    return normalize_column(column, zero_adder)
+
+def pad_state_codes(column: pd.Series) -> pd.Series:
+    """Used to pad a column of state fips code strings to two digits. Same output as column.apply(state_code_zero_adder)."""
+    return normalize_column(column, state_code_zero_adder)
+
+def format_respondent_ids(column: pd.Series) -> pd.Series:
+    """Used to pad a column of respondent ids to ten characters. Same output as column.apply(fmt_respondent_id)."""
+    return normalize_column(column, fmt_respondent_id)
+
+def remove_float_suffixes(column: pd.Series) -> pd.Series:
+    """Used to cast a column of codes to strings without '.0'. Same output as
+    column.astype(str).apply(lambda x: x.replace('.0',''))."""
+    return normalize_column(column, float_suffix_remover)
+
+
+def geo_keys_benchmark(n_rows: int = 10000000, seed: int = 0) -> pd.core.frame.DataFrame:
+    """Used to time the column functions against .apply with the per value functions on LAR sized columns.
+
+    Args:
+        n_rows: number of rows in each benchmark column.
+        seed: seed for the random keys.
+
+    Returns:
+        A dataframe with the .apply and column function run times (seconds) for each key type.
+    """
+    rng = np.random.default_rng(seed)
+    county_codes = rng.choice([48085, 48113, 48439, 48201, 6037, 17031], n_rows).astype(float)
+    county_codes[rng.random(n_rows) < 0.01] = np.nan
+    tracts = county_codes * 1000000 + rng.integers(100, 20000, n_rows)
+    benchmark_columns = {
+        'county code': (pd.Series(county_codes), clean_county_code, normalize_county_codes),
+        'census tract': (pd.Series(tracts), clean_census_tract, normalize_census_tracts),
+        'formatted census tract': (pd.Series(rng.integers(100, 20000, n_rows) / 100), format_census_tract, format_census_tracts),
+        'respondent id': (pd.Series(rng.integers(1, 50000, n_rows).astype(str)), fmt_respondent_id, format_respondent_ids),
+    }
+    results = []
+    for key_type, (column, normalizer, column_normalizer) in benchmark_columns.items():
+        start = time.time()
+        expected = column.apply(normalizer)
+        apply_seconds = time.time() - start
+        start = time.time()
+        normalized = column_normalizer(column)
+        column_seconds = time.time() - start
+        assert normalized.equals(expected)
+        results.append({'key': key_type, 'apply (s)': apply_seconds, 'column function (s)': column_seconds,
+                        'speedup': apply_seconds / column_seconds})
+        print(key_type, 'done')
+    return pd.DataFrame(results)
+
+
+if __name__ == '__main__':
+    print(geo_keys_benchmark())
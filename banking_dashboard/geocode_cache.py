@@ -0,0 +1,127 @@
+# helper functions to keep the census geocoder's answers in a local sqlite database so an address is only sent to the
+# geocoder once. Answers are stored as the csv record the batch geocoder returned for the address (without the record's
+# id) and are keyed by the normalized address (see address_normalize) and the benchmark, vintage and layers it was
+# geocoded against
+
+import os
+import re
+import json
+import time
+import sqlite3
+from address_normalize import normalize_address_text, normalize_street_address
+
+# default location of the geocode cache (relative to where ingestion is run, like the data folder)
+geocode_cache_path = os.path.join('data', 'geocode_cache.sqlite')
+
+# days answers other than a match (No_Match, Tie) are used before the address is geocoded again, since they are often
+# fixed by correcting the address data or by a newer geocoder benchmark
+geocode_no_match_max_age_days = 7
+
+# addresses looked up in the cache per query, to stay under sqlite's limit on query parameters
+_cache_query_rows = 500
+
+
+def normalize_geocode_address(street: str, city: str, state: str, zip_code: str) -> str:
+    """Used to turn the parts of an address into the key it is cached under, so the same address written differently
+    (case, spacing, punctuation, street suffixes and directionals, zip+4) or with a different suite or apartment
+    (which is in the same census block) is only geocoded once.
+
+    Args:
+        street: street address.
+        city: city.
+        state: state abbreviation or name.
+        zip_code: zip code.
+
+    Returns:
+        The address key, the normalized parts joined by '|'.
+    """
+    parts = [normalize_street_address(street), normalize_address_text(city), normalize_address_text(state)]
+    zip_digits = re.sub(r'\D', '', str(zip_code if zip_code is not None else '').split('-')[0].split('.')[0])
+    parts.append(zip_digits.zfill(5)[:5] if zip_digits else '')
+    return '|'.join(parts)
+
+
+def open_geocode_cache(cache_path: str = None) -> sqlite3.Connection:
+    """Used to open the geocode cache, creating it if it does not exist yet.
+
+    Args:
+        cache_path: path of the sqlite database. Defaults to geocode_cache_path.
+
+    Returns:
+        A connection to the cache.
+    """
+    cache_path = cache_path or geocode_cache_path
+    if os.path.dirname(cache_path):
+        os.makedirs(os.path.dirname(cache_path), exist_ok = True)
+    connection = sqlite3.connect(cache_path)
+    connection.execute('''create table if not exists geocodes (
+                              address_key text not null,
+                              benchmark text not null,
+                              vintage text not null,
+                              layers text not null,
+                              record text not null,
+                              geocoded_at real not null,
+                              primary key (address_key, benchmark, vintage, layers))''')
+    return connection
+
+
+def read_geocode_cache(connection: sqlite3.Connection,
+                       address_keys: list[str],
+                       benchmark: str,
+                       vintage: str,
+                       layers: str,
+                       max_age_days: float = None,
+                       no_match_max_age_days: float = geocode_no_match_max_age_days) -> dict[str: list]:
+    """Used to look addresses up in the geocode cache.
+
+    Args:
+        connection: connection to the cache (output of open_geocode_cache).
+        address_keys: address keys to look up (output of normalize_geocode_address).
+        benchmark: census geocoder benchmark (ex: 'CURRENT').
+        vintage: census geocoder vintage.
+        layers: census geocoder layers.
+        max_age_days: answers older than this many days are treated as missing. Answers never expire if None.
+        no_match_max_age_days: answers that are not a match (ex: 'No_Match', 'Tie') older than this many days are
+            treated as missing, so addresses the geocoder could not match are tried again. Never expire if None.
+
+    Returns:
+        A dictionary of the address keys found and their cached csv record, without the record's id.
+    """
+    now = time.time()
+    oldest = 0 if max_age_days is None else now - max_age_days * 24 * 60 * 60
+    oldest_no_match = 0 if no_match_max_age_days is None else now - no_match_max_age_days * 24 * 60 * 60
+    address_keys = list(dict.fromkeys(address_keys))
+    cached_records = {}
+    for start in range(0, len(address_keys), _cache_query_rows):
+        keys = address_keys[start:start + _cache_query_rows]
+        rows = connection.execute('select address_key, record, geocoded_at from geocodes where benchmark = ? and '
+                                  'vintage = ? and layers = ? and geocoded_at >= ? and address_key in (' +
+                                  ', '.join('?' * len(keys)) + ')',
+                                  [benchmark.upper(), vintage.upper(), layers.lower(), oldest] + keys)
+        for address_key, record, geocoded_at in rows:
+            record = json.loads(record)
+            # the record's second field is the match result
+            if geocoded_at >= oldest_no_match or (len(record) > 1 and record[1] == 'Match'):
+                cached_records[address_key] = record
+    return cached_records
+
+
+def write_geocode_cache(connection: sqlite3.Connection,
+                        address_records: dict[str: list],
+                        benchmark: str,
+                        vintage: str,
+                        layers: str):
+    """Used to add the geocoder's answers to the geocode cache, replacing older answers for the same addresses.
+
+    Args:
+        connection: connection to the cache (output of open_geocode_cache).
+        address_records: address keys mapped to the csv record the geocoder returned for them, without the record's id.
+        benchmark: census geocoder benchmark the addresses were geocoded against.
+        vintage: census geocoder vintage.
+        layers: census geocoder layers.
+    """
+    geocoded_at = time.time()
+    with connection:
+        connection.executemany('insert or replace into geocodes values (?, ?, ?, ?, ?, ?)',
+                               [(address_key, benchmark.upper(), vintage.upper(), layers.lower(), json.dumps(record),
+                                 geocoded_at) for address_key, record in address_records.items()])
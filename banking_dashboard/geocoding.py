@@ -0,0 +1,300 @@
+# helper functions to look up the census geography of addresses with the census geocoder. Answers are kept in a local
+# geocode cache (see geocode_cache) so repeat runs only geocode new addresses. census_geocoder and validator_collection
+# are slow to import, so they are imported inside the functions that use them. Large batch files are split into batches
+# that are sent to the geocoder a few at a time, with the number of batches in flight adapting to errors and latency
+
+import io
+import os
+import csv
+import time
+import random
+import pandas as pd
+from geocode_cache import normalize_geocode_address, open_geocode_cache, read_geocode_cache, write_geocode_cache
+
+
+# def get_census_geocode(address_str: str)->dict[str: str]:
+#     """Takes in an address and returns the Census Tract, County and State associated with it if available.
+
+#     Args: 
+#         address_str: the address string that the returned Census Tract, County and State will be based on.
+
+#     Returns:
+#         A dictionary containing the Census Tract, County and State associated with the provided address if they are available.
+#     """
+#     try:
+#       # Get census geocoding
+#       geo_dict = geocoder.geography.from_address(address_str).__dict__
+    
+#       # # Get geographical details
+#       geo = geo_dict['extensions']['result']['addressMatches'][0]['geographies']
+    
+#       # Get census tract(s)... hopefully there's only one?
+#       # If more than 1, print a warning: 
+#       #        print(f"{len(census_tracts)} census tracts found. Using first result")
+#       # Similar for states and counties
+    
+#       census_tracts = [i['TRACT'] for i in geo['Census Tracts']]
+#       counties = [i['BASENAME'] for i in geo['Counties']]
+#       states = [i['BASENAME'] for i in geo['States']]    
+    
+#       return {
+#           'state': states[0],
+#           'county': counties[0],
+#           'census_tract': census_tracts[0],
+#       }
+#     except:
+#         return {
+#           'state': None,
+#           'county': None,
+#           'census_tract': None,
+#       }
+    
+# census batch geocoder endpoint. Can be pointed at another server (ex: a local stand-in for testing) with the
+# CENSUS_GEOCODER_URL environment variable
+census_batch_geocoder_url = 'https://geocoding.geo.census.gov/geocoder/geographies/addressbatch'
+
+# most addresses the census batch geocoder takes in one request, and the number sent per request by default. Smaller
+# batches come back sooner and can be sent side by side
+geocoder_max_batch_rows = 10000
+geocoder_batch_rows = 1000
+
+# batches in flight at most, and the seconds a batch can take before the geocoder is treated as overloaded
+geocoder_max_workers = 4
+geocoder_slow_seconds = 120
+
+def geocode_batch(rows: list[list[str]],
+                  benchmark: str,
+                  vintage: str,
+                  layers: str,
+                  geocoder_url: str = None,
+                  timeout: float = 600) -> list[list[str]]:
+    """Used to send one batch of addresses to the census batch geocoder.
+
+    Args:
+        rows: batch file rows (id, street address, city, state and zip code).
+        benchmark: census geocoder benchmark (ex: 'CURRENT').
+        vintage: census geocoder vintage.
+        layers: census geocoder layers.
+        geocoder_url: url of the batch geocoder. Defaults to the CENSUS_GEOCODER_URL environment variable, or
+            census_batch_geocoder_url.
+        timeout: seconds to wait for the geocoder to answer.
+
+    Returns:
+        The csv records the geocoder returned, in the order it returned them.
+
+    Raises:
+        ValueError: if the geocoder could not read the batch. Not worth sending again.
+        RuntimeError: if the geocoder returned any other error.
+    """
+    import requests
+    from census_geocoder.metaclasses import parse_benchmark_vintage_layers
+    benchmark, vintage, layers = parse_benchmark_vintage_layers(benchmark, vintage, layers)
+    parameters = {'benchmark': benchmark, 'vintage': vintage, 'format': 'json'}
+    if layers:
+        parameters['layers'] = layers
+    batch_csv = io.StringIO()
+    csv.writer(batch_csv).writerows(rows)
+    response = requests.post(geocoder_url or os.environ.get('CENSUS_GEOCODER_URL', census_batch_geocoder_url),
+                             files = {'addressFile': ('addresses.csv', batch_csv.getvalue())},
+                             params = parameters,
+                             timeout = timeout)
+    if response.status_code >= 400 and 'Malformed input' in response.text:
+        raise ValueError('the census geocoder could not read the batch: ' + response.text[:200])
+    if response.status_code >= 400:
+        raise RuntimeError('the census geocoder returned status code ' + str(response.status_code) + ': ' + response.text[:200])
+    return list(csv.reader(response.content.decode('utf-8').splitlines(), delimiter = ','))
+
+def geocode_batches(rows: list[list[str]],
+                    benchmark: str,
+                    vintage: str,
+                    layers: str,
+                    batch_rows: int = geocoder_batch_rows,
+                    max_workers: int = geocoder_max_workers,
+                    max_tries: int = 5,
+                    slow_seconds: float = geocoder_slow_seconds,
+                    geocoder_url: str = None,
+                    timeout: float = 600) -> list[list[str]]:
+    """Used to geocode any number of addresses with the census batch geocoder. The rows are split into batches that are
+    sent side by side. The number of batches in flight starts at one and goes up by one after every batch that comes
+    back within slow_seconds, up to max_workers, and is halved after an error or a slow batch. A batch that fails is
+    sent again after a growing, randomized wait, up to max_tries times.
+
+    Args:
+        rows: batch file rows (id, street address, city, state and zip code).
+        benchmark: census geocoder benchmark (ex: 'CURRENT').
+        vintage: census geocoder vintage.
+        layers: census geocoder layers.
+        batch_rows: addresses sent per request, at most geocoder_max_batch_rows.
+        max_workers: batches in flight at most.
+        max_tries: times a batch is sent before giving up.
+        slow_seconds: seconds a batch can take before fewer batches are sent at a time.
+        geocoder_url: url of the batch geocoder (see geocode_batch).
+        timeout: seconds to wait for the geocoder to answer one batch.
+
+    Returns:
+        The csv records the geocoder returned, in the order of rows whatever order the batches finished in.
+
+    Raises:
+        ValueError: if batch_rows is over geocoder_max_batch_rows, or the geocoder could not read a batch.
+        RuntimeError: if a batch still fails after max_tries tries.
+    """
+    if batch_rows > geocoder_max_batch_rows:
+        raise ValueError('the census batch geocoder takes at most ' + str(geocoder_max_batch_rows) + ' addresses per batch')
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+    batches = [rows[start:start + batch_rows] for start in range(0, len(rows), batch_rows)]
+    waiting = list(range(len(batches)))
+    tries = [0] * len(batches)
+    send_after = [0.0] * len(batches)
+    batch_records = {}
+    in_flight = {}
+    limit = 1
+    with ThreadPoolExecutor(max_workers = max(max_workers, 1)) as executor:
+        while waiting or in_flight:
+            # send the batches that are not waiting out a retry, up to the limit
+            now = time.monotonic()
+            for batch_number in [number for number in waiting if send_after[number] <= now]:
+                if len(in_flight) >= limit:
+                    break
+                waiting.remove(batch_number)
+                tries[batch_number] += 1
+                future = executor.submit(geocode_batch, batches[batch_number], benchmark, vintage, layers,
+                                         geocoder_url = geocoder_url, timeout = timeout)
+                in_flight[future] = (batch_number, time.monotonic())
+            next_send = min((send_after[number] for number in waiting), default = None)
+            if not in_flight:
+                time.sleep(max(next_send - time.monotonic(), 0))
+                continue
+            # only wake up early for a retry when there is a free slot to send it in, otherwise wait for a batch
+            wait_timeout = None
+            if next_send is not None and len(in_flight) < limit:
+                wait_timeout = max(next_send - time.monotonic(), 0)
+            done, _ = wait(in_flight, timeout = wait_timeout, return_when = FIRST_COMPLETED)
+
+            for future in done:
+                batch_number, sent_at = in_flight.pop(future)
+                seconds = time.monotonic() - sent_at
+                try:
+                    batch_records[batch_number] = future.result()
+                except ValueError:
+                    raise
+                except Exception as error:
+                    limit = max(limit // 2, 1)
+                    if tries[batch_number] >= max_tries:
+                        raise RuntimeError('batch ' + str(batch_number + 1) + ' of ' + str(len(batches)) +
+                                           ' failed ' + str(max_tries) + ' times: ' + str(error)) from error
+                    send_after[batch_number] = time.monotonic() + random.uniform(0.5, 1) * min(2 ** tries[batch_number], 60)
+                    waiting.insert(0, batch_number)
+                    print('batch', batch_number + 1, 'of', len(batches), 'failed (' + str(error) + '), sending it again with',
+                          limit, 'batch(es) at a time')
+                    continue
+                limit = min(limit + 1, max_workers) if seconds <= slow_seconds else max(limit // 2, 1)
+                print('batch', batch_number + 1, 'of', len(batches), 'geocoded in', round(seconds, 1), 'seconds,',
+                      len(batch_records), 'done,', limit, 'batch(es) at a time')
+
+    # each batch's records in the order of its rows, then the batches in order
+    records = []
+    for batch_number, batch in enumerate(batches):
+        row_positions = {row[0]: position for position, row in reversed(list(enumerate(batch)))}
+        records += sorted((record for record in batch_records[batch_number] if record and record[0] in row_positions),
+                          key = lambda record: row_positions[record[0]])
+    return records
+    
+def census_batch_lookup(filename: str, srch_level: str, cache_path: str = None, use_cache: bool = True,
+                        max_age_days: float = None, batch_rows: int = geocoder_batch_rows,
+                        max_workers: int = geocoder_max_workers, geocoder_url: str = None):
+  """Used to look up the census geography of each address in a batch file with the census batch geocoder. Addresses
+  already in the geocode cache (see geocode_cache) are answered from it, and only the others are sent to the geocoder,
+  one row per distinct address (rows for the same address written differently or with a different suite or apartment
+  share the answer, see normalize_geocode_address), in batches sent side by side (see geocode_batches). The geocoder's
+  answers are added to the cache.
+
+  Args:
+      filename: csv file with an id, street address, city, state and zip code on each row.
+      srch_level: name put in front of the identifier and street address columns (ex: 'Branch').
+      cache_path: path of the geocode cache. Defaults to geocode_cache_path.
+      use_cache: False to send every distinct address to the geocoder and leave the cache alone.
+      max_age_days: cached answers older than this many days are geocoded again. Answers never expire if None.
+          Addresses the geocoder could not match are geocoded again after geocode_no_match_max_age_days days.
+      batch_rows: addresses sent to the geocoder per request.
+      max_workers: batches sent to the geocoder at a time at most.
+      geocoder_url: url of the batch geocoder. Defaults to the CENSUS_GEOCODER_URL environment variable, or
+          census_batch_geocoder_url.
+
+  Returns:
+      A dataframe with the census geography of each address that was matched.
+  """
+
+  DEFAULT_BENCHMARK = os.environ.get('CENSUS_GEOCODER_BENCHMARK', 'CURRENT')
+  DEFAULT_VINTAGE = os.environ.get('CENSUS_GEOCODER_VINTAGE', 'CURRENT')
+  DEFAULT_LAYERS = os.environ.get('CENSUS_GEOCODER_LAYERS', 'all')
+
+  import census_geocoder as geocoder
+  from validator_collection import validators
+
+  print("Validate file existence")
+  file_ = validators.file_exists(filename, allow_empty = False)
+
+  with open(file_, newline = '') as batch_file:
+    rows = [row for row in csv.reader(batch_file) if row]
+
+  # rows with the same address (see normalize_geocode_address) are only geocoded once
+  address_keys = [normalize_geocode_address(*(row[1:5] + [''] * (5 - len(row)))) for row in rows]
+
+  cache = None
+  cached_records = {}
+  if use_cache:
+    print("Look up cached addresses")
+    cache = open_geocode_cache(cache_path)
+  try:
+    if use_cache:
+      cached_records = read_geocode_cache(cache, address_keys, DEFAULT_BENCHMARK, DEFAULT_VINTAGE, DEFAULT_LAYERS,
+                                          max_age_days = max_age_days)
+    # one row per address that is not cached yet
+    missing_rows = {}
+    for row, address_key in zip(rows, address_keys):
+      if address_key not in cached_records and address_key not in missing_rows:
+        missing_rows[address_key] = row
+    cached_count = sum(address_key in cached_records for address_key in address_keys)
+    print(f"{len(set(address_keys))} distinct addresses in {len(rows)} rows, {cached_count} rows cached, "
+          f"{len(missing_rows)} addresses to geocode")
+
+    if missing_rows:
+      print("Get batch addresses")
+      geocoded = geocode_batches(list(missing_rows.values()), DEFAULT_BENCHMARK, DEFAULT_VINTAGE, DEFAULT_LAYERS,
+                                 batch_rows = batch_rows, max_workers = max_workers, geocoder_url = geocoder_url)
+      key_of_id = {row[0]: address_key for address_key, row in missing_rows.items()}
+      geocoded_records = {key_of_id[record[0]]: record[1:] for record in geocoded if record and record[0] in key_of_id}
+      if use_cache:
+        write_geocode_cache(cache, geocoded_records, DEFAULT_BENCHMARK, DEFAULT_VINTAGE, DEFAULT_LAYERS)
+      cached_records.update(geocoded_records)
+  finally:
+    if cache is not None:
+      cache.close()
+
+  # answers in the order of the batch file, under each row's own id
+  result_ = [[row[0]] + cached_records[address_key] for row, address_key in zip(rows, address_keys)
+             if address_key in cached_records]
+  
+  print("Get results that were non-failures")
+  res_nonfail = [i for i in result_ if len(i) >3]
+ 
+  print(f"{len(res_nonfail)} out of {len(result_)} succeeded")
+
+  print("Extract geographic components")
+  res2 = [geocoder.geography.from_csv_record(x) for x in res_nonfail]
+
+  print("Extract components as dicts")
+  out = [i.__dict__ for i in res2]
+
+  print("Format result")
+  out_df = pd.DataFrame(out)
+  out_df['_latitude'] = [out_df['extensions'][k]['latitute'] for k in range(0,out_df.shape[0])]
+  out_df.dropna(how='all', axis=1, inplace=True) 
+  out_df[srch_level + ' identifier'] = [i[0] for i in res_nonfail]
+  out_df[srch_level + ' street address'] = [i[1] for i in res_nonfail]
+  out_df['Match result'] = [i[2] for i in res_nonfail]
+  out_df['Match type'] = [i[3] for i in res_nonfail]
+
+  print("Done")
+
+  return out_df
@@ -0,0 +1,725 @@
+# helper functions to read in the hmda loan/application register (LAR), panel and transmittal sheet files, one year
+# or several years at a time
+
+import io
+import os
+import json
+import shutil
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from lei_index import build_lei_index, lei_codes
+from lar_store import write_lar_store_chunk, read_lar_store, lar_store_year_path
+from memory_budget import (memory_size_bytes, frame_bytes_per_row, budget_chunk_rows, probe_chunk_rows,
+                           print_peak_memory_usage, call_with_peak_memory)
+from ingest_progress import start_progress, update_progress, finish_progress, print_progress
+from source_files import find_source_file, open_source_file, source_file_size
+from code_tables import hmda_lar_value_maps, decode_column
+from geo_keys import normalize_county_codes, normalize_census_tracts
+from common_fcns import hmda_county_codes, file_content_hash, state_abbrevs, fcc_fips_mappings
+
+# LAR columns used by the tabular summaries. Read in by default when hmda_data_ingester is run with prefilter = True
+hmda_lar_summary_columns = ['activity_year', 'lei', 'derived_msa_md', 'state_code', 'county_code', 'census_tract',
+                            'derived_loan_product_type', 'derived_ethnicity', 'derived_race', 'derived_sex',
+                            'action_taken', 'loan_type', 'loan_purpose', 'lien_status', 'open_end_line_of_credit',
+                            'business_or_commercial_purpose', 'loan_amount', 'interest_rate', 'origination_charges',
+                            'debt_to_income_ratio', 'applicant_credit_score_type', 'applicant_ethnicity_1',
+                            'applicant_race_1', 'applicant_sex', 'applicant_age']
+
+# LAR columns that are always read in since they are needed to subset and reformat the LAR records
+hmda_lar_key_columns = ['activity_year', 'lei', 'derived_msa_md', 'state_code', 'county_code', 'census_tract']
+
+def hmda_lar_mapper(lar_df_chunk: pd.core.frame.DataFrame) -> pd.core.frame.DataFrame:
+    """Used to replace the codes in a chunk of LAR records with their descriptions. Columns that were not read in are skipped.
+
+    Args:
+        lar_df_chunk: a dataframe of LAR records read in from the LAR csv.
+
+    Returns:
+        The LAR dataframe with codes replaced by their descriptions, as Categoricals so chunks held in memory and passed
+        back from worker processes take up less space.
+    """
+    for column, value_map in hmda_lar_value_maps.items():
+        if column not in lar_df_chunk.columns:
+            continue
+        # aus_4 descriptions have always been written to an 'aus-4' column, so keep doing that for existing exports
+        mapped_column = 'aus-4' if column == 'aus_4' else column
+        lar_df_chunk[mapped_column] = decode_column(lar_df_chunk[column], value_map, categorical = True)
+    return lar_df_chunk
+
+def hmda_lar_prefilter(lar_df_chunk: pd.core.frame.DataFrame,
+                       state_code: str = 'TX',
+                       county_codes: list = hmda_county_codes,
+                       action_taken: list = None) -> pd.core.frame.DataFrame:
+    """Used to subset a chunk of LAR records on their raw (not yet mapped) state, county and action taken codes.
+
+    Args:
+        lar_df_chunk: a dataframe of LAR records read in with 'state_code' and 'county_code' as strings.
+        state_code: state abbreviation to keep.
+        county_codes: five digit county fips codes to keep.
+        action_taken: action taken codes to keep (ex: [1] for originated loans). All codes are kept if None.
+
+    Returns:
+        A copy of the LAR dataframe containing only the matching records.
+    """
+    keep = (lar_df_chunk['state_code'] == state_code) & lar_df_chunk['county_code'].isin(county_codes)
+    if action_taken is not None:
+        keep &= lar_df_chunk['action_taken'].isin(action_taken)
+    return lar_df_chunk[keep].copy()
+
+def hmda_lar_chunk_cleaner(lar_df_chunk: pd.core.frame.DataFrame,
+                           prefilter: bool = False,
+                           action_taken: list = None) -> pd.core.frame.DataFrame:
+    """Used to map, clean and subset a chunk of LAR records read in from the LAR csv for Texas and the counties of interest.
+
+    Args:
+        lar_df_chunk: a dataframe of LAR records read in from the LAR csv.
+        prefilter: if True, the records are subset on their raw codes with hmda_lar_prefilter before they are mapped.
+        action_taken: raw action taken codes to keep. Only used when prefilter is True.
+
+    Returns:
+        The cleaned LAR records for Texas and the counties of interest.
+    """
+    if prefilter:
+        lar_df_chunk = hmda_lar_prefilter(lar_df_chunk, action_taken = action_taken)
+
+    # mapping values for columns in Loan/Application Records(LAR)
+    lar_df_chunk = hmda_lar_mapper(lar_df_chunk)
+    
+    # Cleaning and formatting county code
+    #lar_df_chunk['county_code'] = lar_df_chunk['county_code'].apply(str).str.replace('.0','').str[:-3].apply(lambda x: '0'+ x if len(x)<2 else x) + lar_df_chunk['county_code'].apply(str).str.replace('.0','').str[-3:]
+    #lar_df_chunk['county_code'] = lar_df_chunk['county_code'].apply(str).str.replace('.0', '', regex=True).str[:-3].apply(lambda x: '0' + x if len(x) < 2 else x) + lar_df_chunk['county_code'].apply(str).str.replace('.0', '', regex=True).str[-3:]
+    #global k_county_code
+    #k_county_code = 0
+    lar_df_chunk['county_code'] = normalize_county_codes(lar_df_chunk['county_code'])
+    
+    # subset for texas and counties of interest
+    # Collin County = 48085, Dallas County = 48113, Tarrant County = 48439
+    lar_df_chunk = lar_df_chunk[lar_df_chunk['state_code'] == 'TX']
+    lar_df_chunk = lar_df_chunk[(lar_df_chunk['county_code'] == '48439') | (lar_df_chunk['county_code'] == '48085') | (lar_df_chunk['county_code'] == '48113')]
+    return lar_df_chunk
+
+def hmda_lar_chunk_offsets(lar_path: str, chunksize: int = 50000, block_size: int = 2**26) -> tuple:
+    """Used to split the LAR csv into byte ranges that each hold the same rows as one chunk of
+    pd.read_csv(lar_path, chunksize = chunksize). Assumes no field in the csv contains a line break, which holds for the
+    public LAR files.
+
+    Args:
+        lar_path: path of the LAR csv.
+        chunksize: number of records in each byte range.
+        block_size: number of bytes read in at a time while looking for line breaks.
+
+    Returns:
+        The header line of the csv (bytes) and a list of (start, end) byte offsets, one for each chunk.
+    """
+    with open(lar_path, 'rb') as lar:
+        header = lar.readline()
+        offsets = [lar.tell()]
+        position = lar.tell()
+        line_count = 0
+        while True:
+            block = lar.read(block_size)
+            if not block:
+                break
+            line_ends = np.flatnonzero(np.frombuffer(block, dtype = np.uint8) == ord('\n'))
+            # a chunk ends on every chunksize-th line break after the header
+            for line_end in line_ends[chunksize - line_count % chunksize - 1::chunksize]:
+                offsets.append(position + int(line_end) + 1)
+            line_count += len(line_ends)
+            position += len(block)
+    # last chunk is shorter than chunksize or the file does not end with a line break
+    if offsets[-1] < position:
+        offsets.append(position)
+    return header, list(zip(offsets[:-1], offsets[1:]))
+
+def hmda_lar_range_cleaner(lar_path: str,
+                           header: bytes,
+                           start: int,
+                           end: int,
+                           first_row: int,
+                           usecols: list = None,
+                           lar_dtypes: dict = None,
+                           prefilter: bool = False,
+                           action_taken: list = None) -> tuple:
+    """Used to read in and clean the LAR records in one byte range of the LAR csv. Run in the worker processes of
+    hmda_lar_parallel_cleaner.
+
+    Args:
+        lar_path: path of the LAR csv.
+        header: header line of the LAR csv.
+        start: byte offset of the first record in the range.
+        end: byte offset just past the last record in the range.
+        first_row: row number of the first record in the range, used so the index matches a serial read.
+        usecols: LAR columns to read in.
+        lar_dtypes: data types passed to pd.read_csv.
+        prefilter: passed to hmda_lar_chunk_cleaner.
+        action_taken: passed to hmda_lar_chunk_cleaner.
+
+    Returns:
+        The cleaned LAR records in the range and the number of records read in.
+    """
+    with open(lar_path, 'rb') as lar:
+        lar.seek(start)
+        lar_bytes = lar.read(end - start)
+    return hmda_lar_bytes_cleaner(header, lar_bytes, first_row, usecols, lar_dtypes, prefilter, action_taken)
+
+def hmda_lar_bytes_cleaner(header: bytes,
+                           lar_bytes: bytes,
+                           first_row: int,
+                           usecols: list = None,
+                           lar_dtypes: dict = None,
+                           prefilter: bool = False,
+                           action_taken: list = None) -> tuple:
+    """Used to read in and clean a block of raw LAR csv records.
+
+    Args:
+        header: header line of the LAR csv.
+        lar_bytes: whole LAR csv lines, without the header.
+        first_row: row number of the first record in the block, used so the index matches a serial read.
+        usecols: LAR columns to read in.
+        lar_dtypes: data types passed to pd.read_csv.
+        prefilter: passed to hmda_lar_chunk_cleaner.
+        action_taken: passed to hmda_lar_chunk_cleaner.
+
+    Returns:
+        The cleaned LAR records in the block and the number of records read in.
+    """
+    lar_df_chunk = pd.read_csv(io.BytesIO(header + lar_bytes), usecols = usecols, dtype = lar_dtypes)
+    lar_df_chunk.index = lar_df_chunk.index + first_row
+    return hmda_lar_chunk_cleaner(lar_df_chunk, prefilter, action_taken), len(lar_df_chunk)
+
+def hmda_lar_stream_chunks(lar_file, chunksize: int = 50000, block_size: int = 2**26):
+    """Used to split a LAR csv stream that cannot be seeked cheaply (ex: a member of a zip archive) into blocks of raw
+    lines that each hold the same rows as one chunk of pd.read_csv(lar_file, chunksize = chunksize). Like
+    hmda_lar_chunk_offsets it assumes no field in the csv contains a line break.
+
+    Args:
+        lar_file: binary file object of the LAR csv, already read past the header line.
+        chunksize: number of records in each block.
+        block_size: number of bytes read in at a time while looking for line breaks.
+
+    Yields:
+        The raw lines of each chunk (bytes), in file order.
+    """
+    pending = []
+    line_count = 0
+    while True:
+        block = lar_file.read(block_size)
+        if not block:
+            break
+        line_ends = np.flatnonzero(np.frombuffer(block, dtype = np.uint8) == ord('\n'))
+        start = 0
+        # a chunk ends on every chunksize-th line break after the header
+        for line_end in line_ends[chunksize - line_count - 1::chunksize]:
+            pending.append(block[start:line_end + 1])
+            yield b''.join(pending)
+            pending = []
+            start = int(line_end) + 1
+        line_count = (line_count + len(line_ends)) % chunksize
+        pending.append(block[start:])
+    # last chunk is shorter than chunksize or the file does not end with a line break
+    last_chunk = b''.join(pending)
+    if len(last_chunk) > 0:
+        yield last_chunk
+
+def hmda_lar_serial_cleaner(data_folder: str,
+                            lar_file: str,
+                            usecols: list = None,
+                            lar_dtypes: dict = None,
+                            prefilter: bool = False,
+                            action_taken: list = None,
+                            chunksize: int = 50000,
+                            memory_budget: int = None,
+                            memory_state: dict = None):
+    """Used to read in and clean the LAR csv in chunks in the current process. The csv is streamed out of its zip
+    archive if it is not a plain file in data_folder. With a memory budget, the first chunk is used to measure the
+    memory a row takes up and every later chunk is sized to fit in what is left of the budget.
+
+    Args:
+        data_folder: folder holding the LAR csv or the zip archive it was downloaded in.
+        lar_file: name of the LAR csv.
+        usecols: LAR columns to read in.
+        lar_dtypes: data types passed to pd.read_csv.
+        prefilter: passed to hmda_lar_chunk_cleaner.
+        action_taken: passed to hmda_lar_chunk_cleaner.
+        chunksize: number of records in each chunk. With a memory budget, the size of the first chunk (at most
+            probe_chunk_rows).
+        memory_budget: memory budget in bytes. Chunks have a fixed size if None.
+        memory_state: dictionary shared with the caller. The largest raw bytes per row seen so far is kept under
+            'bytes_per_row', and the caller keeps the memory taken up by the cleaned chunks it holds on to under
+            'held_bytes'.
+
+    Yields:
+        The cleaned LAR records of each chunk in file order, with the number of records read in for the chunk and the
+        number of bytes of the csv read in so far.
+    """
+    with open_source_file(data_folder, lar_file) as lar:
+        if memory_budget is None:
+            for lar_df_chunk in pd.read_csv(lar, chunksize = chunksize, usecols = usecols, dtype = lar_dtypes):
+                yield hmda_lar_chunk_cleaner(lar_df_chunk, prefilter, action_taken), len(lar_df_chunk), lar.tell()
+            return
+
+        if memory_state is None:
+            memory_state = {}
+        memory_state.setdefault('bytes_per_row', 0)
+        memory_state.setdefault('held_bytes', 0)
+        chunk_rows = min(chunksize, probe_chunk_rows)
+        with pd.read_csv(lar, chunksize = chunk_rows, usecols = usecols, dtype = lar_dtypes) as lar_reader:
+            while True:
+                try:
+                    lar_df_chunk = lar_reader.get_chunk(chunk_rows)
+                except StopIteration:
+                    break
+                memory_state['bytes_per_row'] = max(memory_state['bytes_per_row'], frame_bytes_per_row(lar_df_chunk))
+                yield hmda_lar_chunk_cleaner(lar_df_chunk, prefilter, action_taken), len(lar_df_chunk), lar.tell()
+                chunk_rows = budget_chunk_rows(memory_budget, memory_state['bytes_per_row'], memory_state['held_bytes'])
+
+def hmda_lar_probe_bytes_per_row(data_folder: str,
+                                 lar_file: str,
+                                 usecols: list = None,
+                                 lar_dtypes: dict = None,
+                                 rows: int = probe_chunk_rows) -> float:
+    """Used to measure the memory a LAR record takes up once read in, from the first records of the LAR csv.
+
+    Args:
+        data_folder: folder holding the LAR csv or the zip archive it was downloaded in.
+        lar_file: name of the LAR csv.
+        usecols: LAR columns to read in.
+        lar_dtypes: data types passed to pd.read_csv.
+        rows: number of records to read in.
+
+    Returns:
+        Bytes per record.
+    """
+    with open_source_file(data_folder, lar_file) as lar:
+        return frame_bytes_per_row(pd.read_csv(lar, nrows = rows, usecols = usecols, dtype = lar_dtypes))
+
+def hmda_lar_parallel_cleaner(data_folder: str,
+                              lar_file: str,
+                              workers: int,
+                              usecols: list = None,
+                              lar_dtypes: dict = None,
+                              prefilter: bool = False,
+                              action_taken: list = None,
+                              chunksize: int = 50000,
+                              memory_budget: int = None,
+                              memory_state: dict = None):
+    """Used to read in and clean the LAR csv in a pool of worker processes. The csv is split into byte ranges holding
+    the same records as the chunks of a serial read, and the cleaned chunks are yielded in file order so the output
+    matches the serial path exactly. A plain csv is split up front and each worker reads its own byte ranges. A csv in a
+    zip archive is decompressed once in this process and its blocks of lines are handed to the workers. Either way at
+    most two chunks per worker are worked on or waiting at a time.
+
+    Args:
+        data_folder: folder holding the LAR csv or the zip archive it was downloaded in.
+        lar_file: name of the LAR csv.
+        workers: number of worker processes.
+        usecols: LAR columns to read in.
+        lar_dtypes: data types passed to pd.read_csv.
+        prefilter: passed to hmda_lar_chunk_cleaner.
+        action_taken: passed to hmda_lar_chunk_cleaner.
+        chunksize: number of records in each byte range.
+        memory_budget: memory budget in bytes. If given, chunksize is replaced by the number of records that lets
+            every chunk in flight fit in the budget, measured on the first records of the csv.
+        memory_state: dictionary the largest peak RSS of the worker processes is kept in ('worker_peak_bytes').
+
+    Yields:
+        The cleaned LAR records of each chunk in file order, with the number of records read in for the chunk and the
+        number of bytes of the csv read in so far.
+    """
+    if memory_budget is not None:
+        bytes_per_row = hmda_lar_probe_bytes_per_row(data_folder, lar_file, usecols, lar_dtypes)
+        chunksize = budget_chunk_rows(memory_budget, bytes_per_row, chunks_in_memory = 2 * workers)
+        print('reading ' + str(chunksize) + ' LAR records per chunk to stay under the memory budget')
+
+    def worker_result(future):
+        # keep the largest peak RSS the workers sent back with their chunks
+        result, worker_peak_bytes = future.result()
+        if memory_state is not None and worker_peak_bytes is not None:
+            memory_state['worker_peak_bytes'] = max(memory_state.get('worker_peak_bytes') or 0, worker_peak_bytes)
+        return result
+
+    lar_path, lar_member = find_source_file(data_folder, lar_file)
+    if lar_member is None:
+        header, byte_ranges = hmda_lar_chunk_offsets(lar_path, chunksize)
+        with ProcessPoolExecutor(max_workers = workers) as executor:
+            futures = deque()
+            for chunk_number, (start, end) in enumerate(byte_ranges):
+                futures.append((executor.submit(call_with_peak_memory, hmda_lar_range_cleaner, lar_path, header, start, end,
+                                                chunk_number * chunksize, usecols, lar_dtypes, prefilter, action_taken), end))
+                if len(futures) >= 2 * workers:
+                    future, bytes_read = futures.popleft()
+                    yield worker_result(future) + (bytes_read,)
+            while len(futures) > 0:
+                future, bytes_read = futures.popleft()
+                yield worker_result(future) + (bytes_read,)
+        return
+
+    with open_source_file(data_folder, lar_file) as lar, ProcessPoolExecutor(max_workers = workers) as executor:
+        header = lar.readline()
+        bytes_read = len(header)
+        futures = deque()
+        for chunk_number, lar_bytes in enumerate(hmda_lar_stream_chunks(lar, chunksize)):
+            bytes_read += len(lar_bytes)
+            futures.append((executor.submit(call_with_peak_memory, hmda_lar_bytes_cleaner, header, lar_bytes,
+                                            chunk_number * chunksize, usecols, lar_dtypes, prefilter, action_taken), bytes_read))
+            if len(futures) >= 2 * workers:
+                future, chunk_bytes_read = futures.popleft()
+                yield worker_result(future) + (chunk_bytes_read,)
+        while len(futures) > 0:
+            future, chunk_bytes_read = futures.popleft()
+            yield worker_result(future) + (chunk_bytes_read,)
+
+def hmda_lar_formatter(lar_df: pd.core.frame.DataFrame,
+                       state_abbrev_map: dict,
+                       fips_dict: dict[str: dict]) -> pd.core.frame.DataFrame:
+    """Used to map in full state and county names and reformat the census tract of LAR records that have already been
+    mapped and subset for the counties of interest.
+
+    Args:
+        lar_df: a dataframe of LAR records.
+        state_abbrev_map: mapping of state abbreviations to full state names (output of state_abrevs_getter).
+        fips_dict: fcc fips mappings (output of fcc_fips_mappings_getter).
+
+    Returns:
+        The formatted LAR records.
+    """
+    # map in full state names
+    lar_df['state_code'] = lar_df['state_code'].map(state_abbrev_map)
+
+    # map in county names 
+    #lar_df_chunk['county_code'] = lar_df_chunk['county_code'].apply(str).str.replace('.0','').str[:-3].apply(lambda x: '0'+ x if len(x)<2 else x) + lar_df_chunk['county_code'].apply(str).str.replace('.0','').str[-3:]
+    lar_df['county_code'] = lar_df['county_code'].map(fips_dict['fcc_counties'])
+
+    # recast data types
+    lar_df = lar_df.astype({"derived_msa_md": str, "census_tract": str})
+
+    # reformat the census tract column and subset for records in TEXAS and counties of interest and  stipping whitespace from column names
+    lar_df['census_tract_full'] = lar_df['census_tract']
+    #lar_df_full['census_tract'] = lar_df_full['census_tract'].str.replace('.0','').str[-6:].apply(lambda x: ''.join(x[-6:-2]+'.'+x[-2:])).str.replace('.an', 'an')
+    lar_df['census_tract'] = normalize_census_tracts(lar_df['census_tract'])
+    #lar_df_full = lar_df_full[lar_df_full['state_code'] == 'TEXAS']
+    #lar_df_full = lar_df_full[(lar_df_full['county_code'] == 'Tarrant County') | (lar_df_full['county_code'] == 'Collin County') | (lar_df_full['county_code'] == 'Dallas County')]
+    lar_df = lar_df.rename(columns = lambda x: x.strip())
+    return lar_df
+
+def hmda_data_ingester(url: str,
+                       data_folder: str = 'data',
+                       lar_file: str = 'lar',
+                       panel_file: str = 'panel',
+                       ts_file: str = 'ts',
+                       prefilter: bool = False,
+                       usecols: list = None,
+                       action_taken: list = None,
+                       output_store: str = None,
+                       workers: int = None,
+                       chunksize: int = 50000,
+                       memory_budget = None,
+                       progress_callback = None,
+                       report_memory: bool = False) -> dict[pd.core.frame.DataFrame]:
+    
+    """Used to read in all necessary .csv files from HMDA website and return a dictionary containing all of the read in
+    files.
+    
+    Args: 
+        url: url of HMDA page with zip file datasets on it. 
+        data_folder: file path for data folder. The LAR, panel and transmittal sheet csvs can be plain files in it or
+            members of the zip archives they were downloaded in, which are read without being extracted.
+        prefilter: if True, LAR records are subset for Texas and the counties of interest on their raw codes before any
+            of the codes are mapped, and only the columns in usecols are read in.
+        usecols: LAR columns to read in. Defaults to hmda_lar_summary_columns when prefilter is True and all columns
+            otherwise. The columns in hmda_lar_key_columns are always read in.
+        action_taken: raw action taken codes to keep (ex: [1] for originated loans). Only used when prefilter is True.
+        output_store: folder of a LAR store. If given, each processed LAR chunk is written to the store (partitioned by
+            activity year and county) instead of being kept in memory, and the store path is returned under 'lar_store'
+            in place of 'lar_df'. Use read_lar_store to load a year, county or set of tracts back out of it.
+        workers: number of processes used to read in and clean the LAR csv. The csv is read in serially if None or 1.
+            The output is the same either way.
+        chunksize: number of LAR records read in at a time when no memory budget is given.
+        memory_budget: memory budget for reading in and cleaning the LAR csv, in bytes or as a string like '4GB'. The
+            first chunk is used to measure the memory a record takes up and later chunks are sized to stay under the
+            budget. Cleaned records kept in memory count against the budget, so use output_store when the records
+            kept will not fit. Chunks have a fixed size if None.
+        progress_callback: function called with a progress dictionary (see ingest_progress.start_progress) after every LAR
+            chunk and once more when the LAR csv is done. The dictionary holds the rows read, kept and dropped, bytes
+            read, rows/s and estimated seconds left. Defaults to print_progress. Use logger_progress_callback to send
+            the reports to a logger instead.
+        report_memory: if True, the peak memory usage of this process and of the largest worker process is printed
+            once the files are read in (see print_peak_memory_usage).
+        
+    Returns:
+        A dictionary of dataframes. One for each ingested file from the HMDA website, plus the LEI index of the panel
+        and transmittal sheet institutions ('lei_index', see build_lei_index). The LAR records get a 'lei_code' column
+        with the LEI code of each record (-1 if the LEI is not in the panel or transmittal sheet). Records read back
+        from a LAR store do not have it, since codes are only valid within one year's index, and attach_lei_attributes
+        looks their codes up from 'lei' instead.
+        
+    Raises:
+        TypeError: if url is not a string.
+    """
+    
+    # NOTE: page associated with url uses javascript so http request made will need to match http request being made from
+    # javascript(https://stackoverflow.com/questions/26393231/using-python-requests-with-javascript-pages). Additionally,
+    # the extracted Loan/Application Records (LAR) csv is greater than 5 gigabytes so will working to find other method 
+    # of storing file. When analyzing the LAR dataset, using the dask library will work specificlly dask.dataframe().
+
+    # read in loan/application records as df
+    #lar_df = pd.read_csv(os.path.join(data_folder, 'public_lar_csv.csv'),  nrows = 2000000) 
+    # file_year = data_folder.split('\\')[1]
+    file_year = os.path.basename(data_folder)
+    counter = 0
+    lar_df_chunks = []
+    store_years = set()
+
+    # get the state and county name mappings up front so chunks can be fully formatted as they are read in
+    state_abbrev_map = state_abbrevs()
+    fips_dict = fcc_fips_mappings()
+
+    # in prefilter mode only read in the needed columns and keep the state and county codes as strings so records can be
+    # dropped before the ~60 code mappings below are run on them
+    lar_dtypes = None
+    if prefilter and usecols is None:
+        usecols = hmda_lar_summary_columns
+    if usecols is not None:
+        usecols = list(dict.fromkeys(hmda_lar_key_columns + list(usecols)))
+    if prefilter:
+        lar_dtypes = {'state_code': str, 'county_code': str}
+
+    # read and clean the LAR csv in chunks, in a pool of worker processes if more than one worker is asked for
+    if memory_budget is not None:
+        memory_budget = memory_size_bytes(memory_budget)
+    memory_state = {'bytes_per_row': 0, 'held_bytes': 0}
+    if workers is not None and workers > 1:
+        lar_df_cleaned_chunks = hmda_lar_parallel_cleaner(data_folder, lar_file, workers, usecols, lar_dtypes, prefilter,
+                                                          action_taken, chunksize, memory_budget, memory_state)
+    else:
+        lar_df_cleaned_chunks = hmda_lar_serial_cleaner(data_folder, lar_file, usecols, lar_dtypes, prefilter, action_taken,
+                                                        chunksize, memory_budget, memory_state)
+    if progress_callback is None:
+        progress_callback = print_progress
+    progress = start_progress('hmda_lar', lar_file, source_file_size(data_folder, lar_file))
+    for lar_df_chunk, rows_read, bytes_read in lar_df_cleaned_chunks:
+        # write the formatted chunk to the LAR store or keep it to concatenate once all chunks are read in
+        if output_store is not None:
+            lar_df_chunk = hmda_lar_formatter(lar_df_chunk, state_abbrev_map, fips_dict)
+            write_lar_store_chunk(lar_df_chunk, output_store, counter, replace_years = store_years)
+        else:
+            lar_df_chunks.append(lar_df_chunk)
+            if memory_budget is not None:
+                memory_state['held_bytes'] += lar_df_chunk.memory_usage(deep = True).sum()
+        counter += 1
+        progress_callback(dict(update_progress(progress, rows_read, len(lar_df_chunk), bytes_read)))
+    progress_callback(dict(finish_progress(progress)))
+    if memory_budget is not None and memory_state['held_bytes'] > memory_budget:
+        print('cleaned LAR records kept in memory (' + str(round(memory_state['held_bytes'] / 1024**2)) +
+              ' MB) are over the memory budget. Use output_store to write them to disk instead')
+
+    # concatenate chunks once and format them together so column types match across chunks
+    if output_store is None:
+        lar_df_full = pd.concat(lar_df_chunks) if len(lar_df_chunks) > 0 else pd.DataFrame()
+        lar_df_full = hmda_lar_formatter(lar_df_full, state_abbrev_map, fips_dict)
+
+        # hand the decoded columns back as object columns, since value_counts on a Categorical (and on the groups of a
+        # group-by) lists every description in the code table, including ones with no records, and the tabular
+        # summaries are built from those counts
+        categorical_columns = lar_df_full.select_dtypes('category').columns
+        lar_df_full = lar_df_full.astype({column: object for column in categorical_columns})
+        
+    # read in transmittal sheet records as df
+    with open_source_file(data_folder, ts_file) as ts_csv:
+        ts_df = pd.read_csv(ts_csv)
+    
+    # replacing values of "agency_code" with actual string fields in transmittal sheet dataset and removing whitespace from column names
+    ts_df['agency_code'] = decode_column(ts_df['agency_code'], 'hmda_agency_code')
+    ts_df = ts_df.rename(columns = lambda x: x.strip())    
+
+    # read in reporter panel data as df
+    with open_source_file(data_folder, panel_file) as panel_csv:
+        panel_df = pd.read_csv(panel_csv, na_values = [-1]) # -1 is being encoded for NULL so I am replacing 
+                                                            # -1 with NaN. No description in data dictionary for 
+                                                            # field called "upper"
+            
+    # replacing values of "agency_code" with actual string fields
+    panel_df['agency_code'] = decode_column(panel_df['agency_code'], 'hmda_agency_code')
+
+    # replacing values of "other_lender_code" with actual string fields
+    panel_df['other_lender_code'] = decode_column(panel_df['other_lender_code'], 'hmda_other_lender_code') 
+    # renaming upper field to lei and removing whitespace from column names 
+    panel_df.rename(columns = {'upper':'lei'}, inplace = True)
+    panel_df = panel_df.rename(columns = lambda x: x.strip())
+
+    # read in metropolitan statistical area and metropolitan division data as df
+    # msamd_df = pd.read_csv(os.path.join('data', 'public_msamd_csv.csv')) # nothing written in data dictionary saying 99999 is na but it does
+    #                                                     # not look like a legitamate msa_md code
+
+    # recast data types and removing whitespace from column names 
+    # msamd_df = msamd_df.astype({"msa_md": str})
+    # msamd_df = msamd_df.rename(columns = lambda x: x.strip())    
+        
+    # arid_2017 = pd.read_csv('arid2017_to_lei_xref_csv.csv') # not using for the moment because not joining in previous 
+                                                              # years so do not need to use                                                         
+        
+    # give every institution an integer LEI code so panel and transmittal sheet attributes can be added to LAR records
+    # by position with attach_lei_attributes
+    lei_index = build_lei_index(panel_df, ts_df)
+
+    if report_memory:
+        print_peak_memory_usage(memory_state.get('worker_peak_bytes'))
+    hmda_dict = {"ts_df":ts_df, "panel_df":panel_df, "lei_index":lei_index}#, "msamd_df":msamd_df}
+    if output_store is not None:
+        hmda_dict["lar_store"] = output_store
+    else:
+        lar_df_full['lei_code'] = lei_codes(lei_index, lar_df_full['lei'])
+        hmda_dict["lar_df"] = lar_df_full
+   
+    return hmda_dict
+
+# first year of the current HMDA LAR format
+hmda_first_year = 2018
+
+def hmda_year_file_names(year: int, file_names_dict: dict = None) -> dict[str: str]:
+    """Used to get the LAR, panel and transmittal sheet file names for a year of HMDA data.
+
+    Args:
+        year: HMDA activity year.
+        file_names_dict: optional dictionary shaped like the one in run-data-ingestion.ipynb
+            ({'2022': {'hmda': {'lar': ..., 'panel': ..., 'ts': ...}}}). Years not in it use the HMDA snapshot file names.
+
+    Returns:
+        A dictionary with the 'lar', 'panel' and 'ts' file names.
+    """
+    file_names = {'lar': str(year) + '_public_lar_csv.csv',
+                  'panel': str(year) + '_public_panel_csv.csv',
+                  'ts': str(year) + '_public_ts_csv.csv'}
+    if file_names_dict is not None and str(year) in file_names_dict:
+        file_names.update({key: value for key, value in file_names_dict[str(year)]['hmda'].items() if key in file_names})
+    return file_names
+
+def hmda_multi_year_ingester(years,
+                             output_store: str,
+                             data_parent_folder: str = 'data',
+                             file_names_dict: dict = None,
+                             prefilter: bool = False,
+                             usecols: list = None,
+                             action_taken: list = None,
+                             workers: int = None,
+                             memory_budget = None,
+                             progress_callback = None,
+                             report_memory: bool = False,
+                             force: bool = False) -> dict:
+    """Used to ingest several years of HMDA data into one LAR store. The sha256 hash of each year's LAR, panel and
+    transmittal sheet files is saved in the store's manifest along with the ingestion options, and years whose files
+    and options have not changed since they were last ingested are skipped. The panel and transmittal sheet dataframes
+    of each year are pickled in the store next to the LAR partitions.
+
+    Args:
+        years: HMDA activity years to ingest (ex: range(2018, 2024)). Data for each year is read from
+            data_parent_folder/<year>, as plain files or straight out of the zip archives they were downloaded in.
+        output_store: folder of the LAR store.
+        data_parent_folder: folder holding one data folder per year.
+        file_names_dict: optional file names for each year. See hmda_year_file_names.
+        prefilter: passed to hmda_data_ingester.
+        usecols: passed to hmda_data_ingester.
+        action_taken: passed to hmda_data_ingester.
+        workers: passed to hmda_data_ingester.
+        memory_budget: passed to hmda_data_ingester.
+        progress_callback: passed to hmda_data_ingester.
+        report_memory: passed to hmda_data_ingester.
+        force: if True every year is ingested even if its files have not changed.
+
+    Returns:
+        A dictionary with the store path ('lar_store') and the lists of years that were ingested ('ingested_years')
+        and skipped ('skipped_years').
+
+    Raises:
+        ValueError: if a year is before 2018, when the current LAR format started.
+    """
+    years = sorted(int(year) for year in years)
+    if len(years) > 0 and years[0] < hmda_first_year:
+        raise ValueError('HMDA years before ' + str(hmda_first_year) + ' use a different LAR format and cannot be ingested')
+    os.makedirs(output_store, exist_ok = True)
+    manifest_path = os.path.join(output_store, 'manifest.json')
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+    ingest_options = {'prefilter': prefilter,
+                      'usecols': None if usecols is None else list(usecols),
+                      'action_taken': None if action_taken is None else list(action_taken)}
+
+    ingested_years = []
+    skipped_years = []
+    for year in years:
+        data_folder = os.path.join(data_parent_folder, str(year))
+        file_names = hmda_year_file_names(year, file_names_dict)
+        # files read out of a zip archive are hashed through the archive they are in
+        source_hashes = {key: file_content_hash(find_source_file(data_folder, file_name)[0]) for key, file_name in file_names.items()}
+        year_entry = {'source_hashes': source_hashes, 'ingest_options': ingest_options}
+        if not force and manifest.get(str(year)) == year_entry and os.path.isdir(lar_store_year_path(output_store, year)):
+            print(str(year) + ' source files unchanged, skipping')
+            skipped_years.append(year)
+            continue
+
+        # clear the year first so records from a previous run do not linger if the new files have none for a county
+        print('ingesting ' + str(year))
+        shutil.rmtree(lar_store_year_path(output_store, year), ignore_errors = True)
+        hmda_dict = hmda_data_ingester('url',
+                                       data_folder = data_folder,
+                                       lar_file = file_names['lar'],
+                                       panel_file = file_names['panel'],
+                                       ts_file = file_names['ts'],
+                                       prefilter = prefilter,
+                                       usecols = usecols,
+                                       action_taken = action_taken,
+                                       output_store = output_store,
+                                       workers = workers,
+                                       memory_budget = memory_budget,
+                                       progress_callback = progress_callback,
+                                       report_memory = report_memory)
+        for table in ['ts_df', 'panel_df']:
+            os.makedirs(os.path.join(output_store, table), exist_ok = True)
+            hmda_dict[table].to_pickle(os.path.join(output_store, table, str(year) + '.pkl'))
+
+        # update the manifest after every year so an interrupted run keeps the years it finished
+        manifest[str(year)] = year_entry
+        with open(manifest_path, 'w') as manifest_file:
+            json.dump(manifest, manifest_file, indent = 4)
+        ingested_years.append(year)
+
+    return {'lar_store': output_store, 'ingested_years': ingested_years, 'skipped_years': skipped_years}
+
+def hmda_year_loader(store_path: str,
+                     years: list = None,
+                     table: str = 'lar_df',
+                     counties: list = None,
+                     tracts: list = None,
+                     columns: list = None) -> pd.core.frame.DataFrame:
+    """Used to load one HMDA table for several years out of a store built by hmda_multi_year_ingester, for comparing
+    years or looking at trends. Every table keeps its activity_year column so years can be told apart.
+
+    Args:
+        store_path: folder of the LAR store.
+        years: activity years to load. All ingested years are loaded if None.
+        table: 'lar_df', 'panel_df' or 'ts_df'.
+        counties: county names to load. Only used for 'lar_df'.
+        tracts: formatted census tracts to load. Only used for 'lar_df'.
+        columns: columns to load. Only used for 'lar_df'.
+
+    Returns:
+        A dataframe of the table for the requested years.
+
+    Raises:
+        ValueError: if table is not one of 'lar_df', 'panel_df' or 'ts_df'.
+    """
+    if table == 'lar_df':
+        return read_lar_store(store_path, years = years, counties = counties, tracts = tracts, columns = columns)
+    if table not in ['panel_df', 'ts_df']:
+        raise ValueError("table must be one of 'lar_df', 'panel_df' or 'ts_df'")
+    table_folder = os.path.join(store_path, table)
+    if years is None:
+        years = sorted(int(file.split('.')[0]) for file in os.listdir(table_folder) if file.endswith('.pkl'))
+    table_dfs = [pd.read_pickle(os.path.join(table_folder, str(year) + '.pkl')) for year in years]
+    if len(table_dfs) == 0:
+        return pd.DataFrame()
+    return pd.concat(table_dfs, ignore_index = True)
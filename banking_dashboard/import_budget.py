@@ -0,0 +1,83 @@
+# script to measure how long the helper modules take to import. Each module is imported in a fresh python process (like
+# a worker process would) and its time is measured on top of importing pandas and numpy, which every module needs and
+# which make up most of the startup time. The script fails if a module goes over its budget or pulls in one of the
+# packages that should only be imported by the functions that use them
+#
+# usage: python import_budget.py [number of runs per module]
+
+import os
+import sys
+import json
+import compileall
+import subprocess
+
+# import time budgets in milliseconds, on top of importing pandas and numpy
+import_budgets_ms = {'helper_fcns': 60,
+                     'common_fcns': 15,
+                     'geocoding': 15,
+                     'census_ingest': 15,
+                     'ffiec_ingest': 15,
+                     'hmda_ingest': 50,
+                     'cra_ingest': 50,
+                     'fdic_ingest': 15,
+                     'sba_ingest': 15,
+                     'tract_assigner': 15}
+
+# packages that take a long time to import (zipcodes loads its whole database, validator_collection alone takes ~50ms)
+# and should not be imported until a function that uses them is run
+lazy_packages = ['requests', 'bs4', 'zipcodes', 'census_geocoder', 'validator_collection', 'backoff_utils', 'tqdm']
+
+_timing_code = '''
+import sys, json, time
+import numpy, pandas
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'ms': elapsed * 1000, 'loaded': [name for name in {lazy_packages} if name in sys.modules]}}))
+'''
+
+
+def measure_import(module: str, runs: int = 5) -> dict:
+    """Used to measure the import time of a module in fresh python processes.
+
+    Args:
+        module: name of the module to import.
+        runs: number of processes to import it in. The fastest run is kept, since the others only add noise (disk
+            cache, other processes).
+
+    Returns:
+        A dictionary with the fastest import time in milliseconds ('ms') and the lazy packages the import loaded
+        ('loaded').
+    """
+    code = _timing_code.format(module = module, lazy_packages = lazy_packages)
+    measurements = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', code], capture_output = True, text = True, check = True,
+                                cwd = os.path.dirname(os.path.abspath(__file__)))
+        measurements.append(json.loads(output.stdout.strip().split('\n')[-1]))
+    return min(measurements, key = lambda measurement: measurement['ms'])
+
+
+def check_import_budgets(runs: int = 5) -> bool:
+    """Used to measure every module in import_budgets_ms and print the results.
+
+    Args:
+        runs: number of processes each module is imported in.
+
+    Returns:
+        True if every module is within its budget and loads none of the lazy packages.
+    """
+    # byte-compile the modules first so the times are for a normal start, not for the first run after a change
+    compileall.compile_dir(os.path.dirname(os.path.abspath(__file__)), maxlevels = 0, quiet = 1)
+    within_budget = True
+    for module, budget_ms in import_budgets_ms.items():
+        measurement = measure_import(module, runs)
+        passed = measurement['ms'] <= budget_ms and not measurement['loaded']
+        within_budget = within_budget and passed
+        print(module.ljust(15), ('%.1f' % measurement['ms']).rjust(7), 'ms (budget', str(budget_ms) + ' ms)',
+              'ok' if passed else 'OVER', ('loaded ' + ', '.join(measurement['loaded'])) if measurement['loaded'] else '')
+    return within_budget
+
+
+if __name__ == '__main__':
+    sys.exit(0 if check_import_budgets(int(sys.argv[1]) if len(sys.argv) > 1 else 5) else 1)
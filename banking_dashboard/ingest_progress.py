@@ -0,0 +1,130 @@
+# helper functions to track and report the progress of long running reads (rows and bytes read in, rows kept, throughput
+# and time left) through a callback, so the reports can be printed, logged or recorded by a scheduler
+
+import time
+import logging
+from datetime import timedelta
+
+
+def start_progress(stage: str, source: str = None, total_bytes: int = None) -> dict:
+    """Used to start tracking the progress of a stage of a run.
+
+    Args:
+        stage: name of the stage (ex: 'hmda_lar').
+        source: name of the file being read in.
+        total_bytes: size of the file being read in. Used for the percent done and the time left.
+
+    Returns:
+        A progress dictionary to pass to update_progress.
+    """
+    return {'stage': stage,
+            'source': source,
+            'chunk': 0,
+            'rows_read': 0,
+            'rows_kept': 0,
+            'rows_dropped': 0,
+            'bytes_read': 0,
+            'total_bytes': total_bytes,
+            'start_time': time.time(),
+            'elapsed_seconds': 0.0,
+            'rows_per_second': None,
+            'bytes_per_second': None,
+            'eta_seconds': None,
+            'done': False}
+
+
+def update_progress(progress: dict, rows_read: int, rows_kept: int, bytes_read: int = None) -> dict:
+    """Used to add a finished chunk to a progress dictionary and update the throughput and time left.
+
+    Args:
+        progress: progress dictionary from start_progress.
+        rows_read: rows read in for the chunk.
+        rows_kept: rows of the chunk kept after filtering.
+        bytes_read: bytes of the file read in so far (a position, not a count for the chunk).
+
+    Returns:
+        The updated progress dictionary.
+    """
+    progress['chunk'] += 1
+    progress['rows_read'] += rows_read
+    progress['rows_kept'] += rows_kept
+    progress['rows_dropped'] = progress['rows_read'] - progress['rows_kept']
+    if bytes_read is not None:
+        progress['bytes_read'] = bytes_read if progress['total_bytes'] is None else min(bytes_read, progress['total_bytes'])
+    _update_rates(progress)
+    if progress['total_bytes'] is not None and progress['bytes_per_second']:
+        progress['eta_seconds'] = (progress['total_bytes'] - progress['bytes_read']) / progress['bytes_per_second']
+    return progress
+
+
+def finish_progress(progress: dict) -> dict:
+    """Used to mark a progress dictionary as done once the whole file has been read in.
+
+    Args:
+        progress: progress dictionary from start_progress.
+
+    Returns:
+        The updated progress dictionary.
+    """
+    if progress['total_bytes'] is not None:
+        progress['bytes_read'] = progress['total_bytes']
+    _update_rates(progress)
+    progress['eta_seconds'] = 0.0
+    progress['done'] = True
+    return progress
+
+
+def _update_rates(progress: dict):
+    """Used to update the elapsed time and throughput of a progress dictionary."""
+    progress['elapsed_seconds'] = time.time() - progress['start_time']
+    if progress['elapsed_seconds'] > 0:
+        progress['rows_per_second'] = progress['rows_read'] / progress['elapsed_seconds']
+        progress['bytes_per_second'] = progress['bytes_read'] / progress['elapsed_seconds']
+
+
+def format_progress(progress: dict) -> str:
+    """Used to describe a progress dictionary in one line.
+
+    Args:
+        progress: progress dictionary from start_progress.
+
+    Returns:
+        A line like 'hmda_lar: chunk 5, 250000 rows read (120000 kept, 130000 dropped), 210.3/580.0 MB (36%),
+        41000 rows/s, 0:01:02 left'.
+    """
+    line = progress['stage'] + ': chunk ' + str(progress['chunk']) + ', ' + str(progress['rows_read']) + ' rows read (' + \
+        str(progress['rows_kept']) + ' kept, ' + str(progress['rows_dropped']) + ' dropped), ' + \
+        str(round(progress['bytes_read'] / 1024**2, 1))
+    if progress['total_bytes']:
+        line += '/' + str(round(progress['total_bytes'] / 1024**2, 1)) + ' MB (' + \
+            str(round(100 * progress['bytes_read'] / progress['total_bytes'])) + '%)'
+    else:
+        line += ' MB'
+    if progress['rows_per_second'] is not None:
+        line += ', ' + str(round(progress['rows_per_second'])) + ' rows/s'
+    if progress['done']:
+        line += ', done in ' + str(timedelta(seconds = round(progress['elapsed_seconds'])))
+    elif progress['eta_seconds'] is not None:
+        line += ', ' + str(timedelta(seconds = round(progress['eta_seconds']))) + ' left'
+    return line
+
+
+def print_progress(progress: dict):
+    """Used as the default progress callback. Prints a one line summary of the progress."""
+    print(format_progress(progress))
+
+
+def logger_progress_callback(logger: logging.Logger, level: int = logging.INFO):
+    """Used to make a progress callback that sends progress reports to a logger. The progress dictionary is attached to
+    each log record as record.progress so handlers can record the numbers themselves.
+
+    Args:
+        logger: logger to send the progress reports to.
+        level: logging level of the progress reports.
+
+    Returns:
+        A progress callback.
+    """
+    def log_progress(progress: dict):
+        logger.log(level, format_progress(progress), extra = {'progress': dict(progress)})
+    return log_progress
@@ -0,0 +1,180 @@
+# helper functions to write processed HMDA LAR records to a partitioned parquet dataset and to read subsets of it back
+
+import os
+import shutil
+import pandas as pd
+import numpy as np
+
+
+# LAR store layout: <store>/activity_year=<year>/county_code=<county name>/part-<chunk number>.parquet
+lar_store_partition_cols = ['activity_year', 'county_code']
+
+# partition value used for records with a missing year or county
+lar_store_null_partition = '__HIVE_DEFAULT_PARTITION__'
+
+# LAR columns that only ever hold numbers. Every other column is stored as a string so all files share one schema
+lar_store_numeric_columns = ['loan_amount', 'income', 'tract_population', 'tract_minority_population_percent',
+                             'ffiec_msa_md_median_family_income', 'tract_to_msa_income_percentage',
+                             'tract_owner_occupied_units', 'tract_one_to_four_family_homes',
+                             'tract_median_age_of_housing_units']
+
+
+def lar_store_partition_path(store_path: str, activity_year, county_code) -> str:
+    """Used to get the folder a LAR year/county partition is written to.
+
+    Args:
+        store_path: folder of the LAR store.
+        activity_year: activity year of the partition.
+        county_code: county name of the partition.
+
+    Returns:
+        The path of the partition folder.
+    """
+    year_value = lar_store_null_partition if pd.isna(activity_year) else str(int(activity_year))
+    county_value = lar_store_null_partition if pd.isna(county_code) else str(county_code)
+    return os.path.join(store_path, 'activity_year=' + year_value, 'county_code=' + county_value)
+
+
+def lar_store_year_path(store_path: str, activity_year) -> str:
+    """Used to get the folder holding all partitions of a single activity year.
+
+    Args:
+        store_path: folder of the LAR store.
+        activity_year: activity year of the partition.
+
+    Returns:
+        The path of the year folder.
+    """
+    return os.path.dirname(lar_store_partition_path(store_path, activity_year, None))
+
+
+def _string_column(column: pd.Series) -> pd.Series:
+    """Used to cast a LAR column to strings, keeping missing values missing. Whole numbers read in as floats are written
+    without a trailing '.0' so they match the same value read in as text from another chunk.
+    """
+    if pd.api.types.is_float_dtype(column):
+        whole = column.notna() & (column % 1 == 0)
+        as_str = column.astype(object).where(column.isna(), column.astype(str))
+        as_str[whole] = column[whole].astype(np.int64).astype(str)
+        return as_str
+    return column.astype(object).where(column.isna(), column.astype(str))
+
+
+def lar_store_table(lar_df_chunk: pd.core.frame.DataFrame):
+    """Used to convert a chunk of processed LAR records into a pyarrow table with the LAR store schema.
+
+    Args:
+        lar_df_chunk: a dataframe of processed LAR records.
+
+    Returns:
+        A pyarrow table where activity_year is int64, the columns in lar_store_numeric_columns are float64 and every
+        other column is a string.
+    """
+    import pyarrow as pa
+
+    fields = []
+    columns = {}
+    for column in lar_df_chunk.columns:
+        if column == 'activity_year':
+            fields.append(pa.field(column, pa.int64()))
+            columns[column] = pd.to_numeric(lar_df_chunk[column])
+        elif column in lar_store_numeric_columns:
+            fields.append(pa.field(column, pa.float64()))
+            columns[column] = pd.to_numeric(lar_df_chunk[column], errors = 'coerce').astype(float)
+        else:
+            fields.append(pa.field(column, pa.string()))
+            columns[column] = _string_column(lar_df_chunk[column])
+    return pa.Table.from_pandas(pd.DataFrame(columns), schema = pa.schema(fields), preserve_index = False)
+
+
+def write_lar_store_chunk(lar_df_chunk: pd.core.frame.DataFrame,
+                          store_path: str,
+                          chunk_number: int,
+                          replace_years: set = None):
+    """Used to write a chunk of processed LAR records to the LAR store. The records are split into activity year and
+    county partitions and sorted by census tract, so the min/max statistics parquet keeps for every file let readers
+    skip files that do not hold the tracts they ask for.
+
+    Args:
+        lar_df_chunk: a dataframe of processed LAR records.
+        store_path: folder of the LAR store.
+        chunk_number: position of the chunk in the LAR csv. Used to name the files so the store reads back in csv order.
+        replace_years: activity years that have already been cleared during this run. Years in the chunk that are
+            not in this set have their existing partitions removed first and are then added to the set.
+    """
+    import pyarrow.parquet as pq
+
+    if lar_df_chunk.shape[0] == 0:
+        return
+    if replace_years is not None:
+        for activity_year in lar_df_chunk['activity_year'].drop_duplicates():
+            if activity_year not in replace_years:
+                shutil.rmtree(lar_store_year_path(store_path, activity_year), ignore_errors = True)
+                replace_years.add(activity_year)
+    for (activity_year, county_code), partition_df in lar_df_chunk.groupby(lar_store_partition_cols, dropna = False, sort = True):
+        partition_path = lar_store_partition_path(store_path, activity_year, county_code)
+        os.makedirs(partition_path, exist_ok = True)
+        partition_df = partition_df.sort_values('census_tract', kind = 'stable')
+        pq.write_table(lar_store_table(partition_df),
+                       os.path.join(partition_path, 'part-%06d.parquet' % chunk_number),
+                       write_statistics = True)
+
+
+def lar_store_files(store_path: str, years: list = None, counties: list = None) -> list[str]:
+    """Used to list the parquet files in the LAR store, optionally only those for some activity years and counties.
+
+    Args:
+        store_path: folder of the LAR store.
+        years: activity years to keep. All years are kept if None.
+        counties: county names to keep (ex: 'Dallas County'). All counties are kept if None.
+
+    Returns:
+        A sorted list of parquet file paths.
+    """
+    year_values = None if years is None else {str(int(year)) for year in years}
+    county_values = None if counties is None else {str(county) for county in counties}
+    files = []
+    if not os.path.isdir(store_path):
+        return files
+    for year_folder in sorted(os.listdir(store_path)):
+        if not year_folder.startswith('activity_year='):
+            continue
+        if year_values is not None and year_folder.split('=', 1)[1] not in year_values:
+            continue
+        for county_folder in sorted(os.listdir(os.path.join(store_path, year_folder))):
+            if county_values is not None and county_folder.split('=', 1)[1] not in county_values:
+                continue
+            county_path = os.path.join(store_path, year_folder, county_folder)
+            files += [os.path.join(county_path, file) for file in sorted(os.listdir(county_path)) if file.endswith('.parquet')]
+    return files
+
+
+def read_lar_store(store_path: str,
+                   years: list = None,
+                   counties: list = None,
+                   tracts: list = None,
+                   columns: list = None) -> pd.core.frame.DataFrame:
+    """Used to read LAR records back out of the LAR store. Only the year/county partitions asked for are opened and
+    files or row groups whose census tract min/max statistics rule out the requested tracts are skipped.
+
+    Args:
+        store_path: folder of the LAR store.
+        years: activity years to read. All years are read if None.
+        counties: county names to read (ex: ['Dallas County']). All counties are read if None.
+        tracts: formatted census tracts to read (ex: ['0078.06']). All tracts are read if None.
+        columns: columns to read. All columns are read if None.
+
+    Returns:
+        A dataframe of the matching LAR records.
+    """
+    import pyarrow.dataset as ds
+
+    files = lar_store_files(store_path, years, counties)
+    if len(files) == 0:
+        return pd.DataFrame(columns = columns)
+    dataset = ds.dataset(files, format = 'parquet')
+    row_filter = None
+    if tracts is not None:
+        row_filter = ds.field('census_tract').isin([str(tract) for tract in tracts])
+    lar_df = dataset.to_table(columns = columns, filter = row_filter).to_pandas()
+    return lar_df.reset_index(drop = True)
@@ -0,0 +1,101 @@
+# helper functions to hold a set of tables that are only read in when they are first used. Each table has a loader that
+# reads it in and a list of steps (decoding, mapping, filtering) that are run on it right after it is loaded, so tables
+# that are never looked at are never parsed
+
+from collections.abc import MutableMapping
+
+
+class LazyTableDict(MutableMapping):
+    """Used as a dictionary of dataframes whose tables are read in on first access. Keys are listed (and can be checked
+    with `in`) without loading anything; looking a table up runs its loader and then its steps, in the order they were
+    added, and keeps the result.
+
+    Args:
+        loaders: a dictionary of table names and functions that take no arguments and return the table.
+    """
+
+    def __init__(self, loaders: dict = None):
+        self._loaders = dict(loaders or {})
+        self._steps = {key: [] for key in self._loaders}
+        self._tables = {}
+
+    def __getitem__(self, key):
+        if key not in self._tables:
+            if key not in self._loaders:
+                raise KeyError(key)
+            table = self._loaders[key]()
+            for step in self._steps[key]:
+                table = step(table)
+            self._tables[key] = table
+            del self._loaders[key], self._steps[key]
+        return self._tables[key]
+
+    def __setitem__(self, key, table):
+        self._loaders.pop(key, None)
+        self._steps.pop(key, None)
+        self._tables[key] = table
+
+    def __delitem__(self, key):
+        if key not in self._tables and key not in self._loaders:
+            raise KeyError(key)
+        self._loaders.pop(key, None)
+        self._steps.pop(key, None)
+        self._tables.pop(key, None)
+
+    def __iter__(self):
+        return iter(list(self._tables) + [key for key in self._loaders if key not in self._tables])
+
+    def __len__(self):
+        return len(self._tables) + len(self._loaders)
+
+    def __repr__(self):
+        return 'LazyTableDict(loaded = ' + str(self.loaded_tables()) + ', not loaded = ' + str(list(self._loaders)) + ')'
+
+    def loaded_tables(self) -> list:
+        """Used to list the tables that have been read in so far."""
+        return list(self._tables)
+
+    def add_step(self, key, step):
+        """Used to add a step that is run on a table once it is loaded. Runs right away if the table is already loaded.
+
+        Args:
+            key: name of the table.
+            step: function that takes the table and returns the updated table.
+        """
+        if key in self._tables:
+            self._tables[key] = step(self._tables[key])
+        elif key in self._loaders:
+            self._steps[key].append(step)
+        else:
+            raise KeyError(key)
+
+    def subset(self, keys: list) -> 'LazyTableDict':
+        """Used to make a LazyTableDict of some of the tables without loading them. Tables not loaded yet are loaded
+        (once) by whichever dictionary looks them up first.
+
+        Args:
+            keys: names of the tables to keep.
+
+        Returns:
+            A LazyTableDict with the given tables, in the given order.
+        """
+        subset_tables = LazyTableDict({key: (lambda key = key: self[key]) for key in keys})
+        for key in keys:
+            if key in self._tables:
+                subset_tables[key] = self._tables[key]
+        return subset_tables
+
+
+def map_table(df_dict: dict, key, step):
+    """Used to run a step on one table of a dictionary of dataframes. For a LazyTableDict the step is added to the table
+    and only runs when the table is loaded.
+
+    Args:
+        df_dict: a dictionary of dataframes or a LazyTableDict.
+        key: name of the table.
+        step: function that takes the table and returns the updated table.
+    """
+    if isinstance(df_dict, LazyTableDict):
+        df_dict.add_step(key, step)
+    else:
+        df_dict[key] = step(df_dict[key])
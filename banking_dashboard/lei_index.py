@@ -0,0 +1,77 @@
+# helper functions to join HMDA institution attributes (panel and transmittal sheet) onto LAR records. Every LEI gets an
+# integer code, the attributes are kept in tables ordered by code, and records pick up attributes by position instead
+# of through a merge on the LEI strings
+
+import numpy as np
+import pandas as pd
+
+
+def build_lei_index(panel_df: pd.core.frame.DataFrame, ts_df: pd.core.frame.DataFrame = None) -> dict:
+    """Used to build the LEI index for a year of HMDA data.
+
+    Args:
+        panel_df: HMDA reporter panel with an 'lei' column (output of hmda_data_ingester).
+        ts_df: HMDA transmittal sheet with an 'lei' column (output of hmda_data_ingester).
+
+    Returns:
+        A dictionary with the sorted LEIs of every institution in either table ('leis', a pandas Index whose positions
+        are the LEI codes) and one attribute table per source ('panel', 'ts') with a row for every LEI code. LEIs
+        missing from a source have missing attributes in its table, and only the first row of an LEI listed more than
+        once is kept.
+    """
+    source_dfs = {'panel': panel_df}
+    if ts_df is not None:
+        source_dfs['ts'] = ts_df
+    leis = pd.Index(sorted(set().union(*[set(source_df['lei'].dropna()) for source_df in source_dfs.values()])), name = 'lei')
+    lei_index = {'leis': leis}
+    for source, source_df in source_dfs.items():
+        source_df = source_df.dropna(subset = ['lei']).drop_duplicates('lei')
+        lei_index[source] = source_df.set_index('lei').reindex(leis).reset_index(drop = True)
+    return lei_index
+
+
+def lei_codes(lei_index: dict, leis: pd.Series) -> np.ndarray:
+    """Used to look up the LEI codes of a column of LEIs. Each distinct LEI is looked up once, so the cost depends on the
+    number of institutions rather than the number of records.
+
+    Args:
+        lei_index: output of build_lei_index.
+        leis: column of LEIs.
+
+    Returns:
+        An int32 array of LEI codes, -1 for LEIs that are missing or not in the index.
+    """
+    positions, distinct_leis = pd.factorize(leis)
+    distinct_codes = np.append(lei_index['leis'].get_indexer(distinct_leis), -1).astype(np.int32)
+    # factorize gives missing LEIs position -1, which picks the -1 appended at the end
+    return distinct_codes[positions]
+
+
+def attach_lei_attributes(lar_df: pd.core.frame.DataFrame,
+                          lei_index: dict,
+                          columns: dict[str: str] = {'respondent_name': 'institution_name'},
+                          source: str = 'panel') -> pd.core.frame.DataFrame:
+    """Used to add institution attributes to LAR records by LEI code. Gives the same values as a left merge of the
+    records with the source table on 'lei'. Uses the records' 'lei_code' column if they have one, otherwise the codes
+    are looked up from 'lei'.
+
+    Args:
+        lar_df: a dataframe of LAR records.
+        lei_index: output of build_lei_index.
+        columns: source columns to add, mapped to the names they are added under.
+        source: attribute table to take the columns from ('panel' or 'ts').
+
+    Returns:
+        A copy of the LAR records with the attribute columns added. Records whose LEI is not in the source get missing
+        values.
+
+    Raises:
+        ValueError: if source is not one of the attribute tables in the index.
+    """
+    if source not in lei_index or source == 'leis':
+        raise ValueError('source must be one of ' + str([key for key in lei_index if key != 'leis']))
+    codes = lar_df['lei_code'].to_numpy() if 'lei_code' in lar_df.columns else lei_codes(lei_index, lar_df['lei'])
+    attribute_df = lei_index[source]
+    attributes = {new_column: pd.api.extensions.take(attribute_df[column].array, codes, allow_fill = True)
+                  for column, new_column in columns.items()}
+    return lar_df.assign(**{column: pd.Series(values, index = lar_df.index) for column, values in attributes.items()})
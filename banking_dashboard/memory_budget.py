@@ -0,0 +1,141 @@
+# helper functions to size the chunks large files are read in by so that reading and cleaning them stays under a memory
+# budget, and to report how much memory a run used
+
+import re
+import sys
+import pandas as pd
+
+# memory used while reading in and cleaning a chunk, as a multiple of the memory the raw chunk takes up. Covers the
+# parser's buffers and the copies made while codes are mapped
+chunk_working_set_factor = 4
+
+# fewest rows a chunk is shrunk to, however small the budget
+min_chunk_rows = 1000
+
+# rows read in to measure bytes per row before the chunk size is picked
+probe_chunk_rows = 10000
+
+memory_size_units = {'B': 1, 'KB': 1024, 'MB': 1024**2, 'GB': 1024**3, 'TB': 1024**4}
+
+
+def memory_size_bytes(memory_size) -> int:
+    """Used to convert a memory size to a number of bytes.
+
+    Args:
+        memory_size: number of bytes (ex: 4 * 1024**3) or a string with a unit (ex: '4GB', '512 MB').
+
+    Returns:
+        The memory size in bytes.
+
+    Raises:
+        ValueError: if memory_size is not a positive number of bytes or a size string with one of the units in
+            memory_size_units.
+    """
+    if isinstance(memory_size, str):
+        match = re.fullmatch(r'\s*([\d.]+)\s*([KMGT]?B)\s*', memory_size.upper())
+        if match is None:
+            raise ValueError('memory size must be a number of bytes or a string like "4GB", not ' + repr(memory_size))
+        memory_size = float(match.group(1)) * memory_size_units[match.group(2)]
+    if memory_size <= 0:
+        raise ValueError('memory size must be positive')
+    return int(memory_size)
+
+
+def frame_bytes_per_row(df: pd.core.frame.DataFrame) -> float:
+    """Used to measure the memory a dataframe takes up per row, counting the strings held in object columns.
+
+    Args:
+        df: a dataframe.
+
+    Returns:
+        Bytes per row (0 for an empty dataframe).
+    """
+    if len(df) == 0:
+        return 0
+    return df.memory_usage(deep = True).sum() / len(df)
+
+
+def budget_chunk_rows(memory_budget: int,
+                      bytes_per_row: float,
+                      held_bytes: int = 0,
+                      chunks_in_memory: int = 1,
+                      working_set_factor: float = chunk_working_set_factor) -> int:
+    """Used to pick the number of rows to read in at a time so the chunks being worked on fit in what is left of a
+    memory budget.
+
+    Args:
+        memory_budget: memory budget in bytes.
+        bytes_per_row: memory a raw row takes up once read in (see frame_bytes_per_row).
+        held_bytes: memory already taken up by results kept from earlier chunks.
+        chunks_in_memory: number of chunks worked on or waiting at the same time (ex: two per worker process).
+        working_set_factor: memory used while working on a chunk as a multiple of the raw chunk's size.
+
+    Returns:
+        The number of rows per chunk, never fewer than min_chunk_rows.
+    """
+    available_bytes = memory_budget - held_bytes
+    if bytes_per_row <= 0 or available_bytes <= 0:
+        return min_chunk_rows
+    return max(min_chunk_rows, int(available_bytes / (bytes_per_row * working_set_factor * chunks_in_memory)))
+
+
+def process_peak_memory_bytes() -> int:
+    """Used to get the peak resident set size (RSS) of the process this is run in. Only available on unix-like systems.
+
+    Returns:
+        The peak RSS in bytes, or None if the platform does not report it.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    unit = 1 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit
+
+
+def call_with_peak_memory(function, *args) -> tuple:
+    """Used to run a function in a worker process and send the worker's peak RSS back with its result, since the peak
+    RSS of finished children the operating system reports covers every child the parent ever had, not just this run's.
+
+    Args:
+        function: function to run.
+        *args: arguments passed to function.
+
+    Returns:
+        The function's result and the peak RSS in bytes of the process it ran in (see process_peak_memory_bytes).
+    """
+    return function(*args), process_peak_memory_bytes()
+
+
+def peak_memory_usage(worker_peak_bytes: int = None) -> dict:
+    """Used to get the peak resident set size (RSS) of this process and of the worker processes of this run.
+
+    Args:
+        worker_peak_bytes: largest peak RSS of the worker processes of this run (collected with call_with_peak_memory),
+            None if no workers were used.
+
+    Returns:
+        A dictionary with the peak RSS in bytes of this process ('process') and worker_peak_bytes ('workers'), or None
+        if the platform does not report it.
+    """
+    process_peak = process_peak_memory_bytes()
+    if process_peak is None:
+        return None
+    return {'process': process_peak, 'workers': worker_peak_bytes}
+
+
+def print_peak_memory_usage(worker_peak_bytes: int = None):
+    """Used to print the peak RSS of this process and, if workers were used, of the largest worker process in MB.
+
+    Args:
+        worker_peak_bytes: largest peak RSS of the worker processes of this run, None if no workers were used.
+    """
+    peak_memory = peak_memory_usage(worker_peak_bytes)
+    if peak_memory is None:
+        print('peak memory usage is not reported on this platform')
+        return
+    message = 'peak memory usage: ' + str(round(peak_memory['process'] / 1024**2)) + ' MB'
+    if peak_memory['workers']:
+        message += ' (largest worker process: ' + str(round(peak_memory['workers'] / 1024**2)) + ' MB)'
+    print(message)
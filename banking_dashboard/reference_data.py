@@ -0,0 +1,199 @@
+# helper functions to keep small reference tables (fcc state and county fips names, ssa state abbreviations) on disk so
+# ingestion does not have to download them on every run. A downloaded table is written to a versioned snapshot file and
+# reused until it is older than its time to live. When the table can not be downloaded (no network, or the page changed
+# and nothing could be parsed out of it) an older snapshot is used, and failing that the copy bundled with the repo in
+# reference_data/
+
+import os
+import json
+import copy
+import time
+
+# bumped when the layout of the snapshot files changes so old snapshots get downloaded again
+reference_data_version = 1
+
+# folder the downloaded snapshots are written to (relative to where ingestion is run, like the data folder)
+reference_cache_folder = os.path.join('data', 'reference')
+
+# folder of the fallback copies bundled with the repo
+reference_bundled_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'reference_data')
+
+# number of days a snapshot is used before the table is downloaded again
+reference_data_ttl_days = 30
+
+# set to '1' to never download reference tables (snapshots and the bundled copies are used)
+reference_offline_variable = 'REFERENCE_DATA_OFFLINE'
+
+# tables already loaded in this process, so a run only goes to disk (or the network) once per table
+_loaded_reference_data = {}
+
+
+def reference_snapshot_path(name: str, cache_folder: str = None) -> str:
+    """Used to get the path of the snapshot file of a reference table.
+
+    Args:
+        name: name of the reference table (ex: 'fcc_fips').
+        cache_folder: folder the snapshots are kept in. Defaults to reference_cache_folder.
+
+    Returns:
+        The path of the snapshot file.
+    """
+    return os.path.join(cache_folder or reference_cache_folder, name + '.snapshot.json')
+
+
+def reference_bundled_path(name: str) -> str:
+    """Used to get the path of the copy of a reference table bundled with the repo.
+
+    Args:
+        name: name of the reference table (ex: 'fcc_fips').
+
+    Returns:
+        The path of the bundled file.
+    """
+    return os.path.join(reference_bundled_folder, name + '.json')
+
+
+def read_reference_snapshot(name: str, cache_folder: str = None) -> dict:
+    """Used to read the snapshot of a reference table.
+
+    Args:
+        name: name of the reference table.
+        cache_folder: folder the snapshots are kept in. Defaults to reference_cache_folder.
+
+    Returns:
+        The snapshot, a dictionary with the url the table was downloaded from ('source_url'), when it was downloaded
+        ('fetched_at', seconds since the epoch) and the table ('data'). None if there is no readable snapshot of the
+        current version.
+    """
+    snapshot_path = reference_snapshot_path(name, cache_folder)
+    if not os.path.exists(snapshot_path):
+        return None
+    with open(snapshot_path) as snapshot_file:
+        try:
+            snapshot = json.load(snapshot_file)
+        except json.JSONDecodeError:
+            return None
+    if snapshot.get('snapshot_version') != reference_data_version or 'data' not in snapshot:
+        return None
+    return snapshot
+
+
+def write_reference_snapshot(name: str, url: str, data: dict, cache_folder: str = None) -> dict:
+    """Used to write a downloaded reference table to its snapshot file. The file is written to a temporary name first so
+    an interrupted run never leaves half a snapshot behind.
+
+    Args:
+        name: name of the reference table.
+        url: url the table was downloaded from.
+        data: the table.
+        cache_folder: folder the snapshots are kept in. Defaults to reference_cache_folder.
+
+    Returns:
+        The snapshot (see read_reference_snapshot).
+    """
+    snapshot = {'snapshot_version': reference_data_version,
+                'source_url': url,
+                'fetched_at': time.time(),
+                'data': data}
+    snapshot_path = reference_snapshot_path(name, cache_folder)
+    os.makedirs(os.path.dirname(snapshot_path), exist_ok = True)
+    with open(snapshot_path + '.tmp', 'w') as snapshot_file:
+        json.dump(snapshot, snapshot_file)
+    os.replace(snapshot_path + '.tmp', snapshot_path)
+    return snapshot
+
+
+def read_bundled_reference(name: str) -> dict:
+    """Used to read the copy of a reference table bundled with the repo.
+
+    Args:
+        name: name of the reference table.
+
+    Returns:
+        The table.
+
+    Raises:
+        FileNotFoundError: if there is no bundled copy of the table.
+    """
+    with open(reference_bundled_path(name)) as bundled_file:
+        return json.load(bundled_file)['data']
+
+
+def reference_data_is_offline(offline: bool = None) -> bool:
+    """Used to check whether reference tables should be downloaded.
+
+    Args:
+        offline: True to never download, False to download when needed. Defaults to the REFERENCE_DATA_OFFLINE
+            environment variable.
+
+    Returns:
+        True if nothing should be downloaded.
+    """
+    if offline is None:
+        return os.environ.get(reference_offline_variable, '') == '1'
+    return offline
+
+
+def cached_reference_data(name: str,
+                          url: str,
+                          fetcher,
+                          ttl_days: float = None,
+                          offline: bool = None,
+                          refresh: bool = False,
+                          cache_folder: str = None) -> dict:
+    """Used to get a reference table, downloading it only when there is no snapshot of it younger than ttl_days. In
+    order, the table comes from: this process (if it was already loaded), a current snapshot, a fresh download (which is
+    written to the snapshot), an out of date snapshot and finally the copy bundled with the repo.
+
+    Args:
+        name: name of the reference table (ex: 'fcc_fips').
+        url: url the table is downloaded from. A snapshot of another url is treated as out of date.
+        fetcher: function that takes the url and returns the table as a dictionary (ex: fcc_fips_mappings_getter). A
+            table that raises an error or comes back with an empty dictionary in it counts as a failed download.
+        ttl_days: number of days a snapshot is used before the table is downloaded again. Defaults to
+            reference_data_ttl_days.
+        offline: True to never download. Defaults to the REFERENCE_DATA_OFFLINE environment variable.
+        refresh: True to download the table again even if the snapshot is current.
+        cache_folder: folder the snapshots are kept in. Defaults to reference_cache_folder.
+
+    Returns:
+        A copy of the table, so callers can change it without changing the tables other callers get.
+
+    Raises:
+        FileNotFoundError: if the table could not be downloaded and there is neither a snapshot nor a bundled copy.
+    """
+    memo_key = (name, url, cache_folder or reference_cache_folder)
+    if memo_key in _loaded_reference_data and not refresh:
+        return copy.deepcopy(_loaded_reference_data[memo_key])
+
+    ttl_days = reference_data_ttl_days if ttl_days is None else ttl_days
+    snapshot = read_reference_snapshot(name, cache_folder)
+    snapshot_is_current = (snapshot is not None and snapshot.get('source_url') == url and
+                           time.time() - snapshot.get('fetched_at', 0) < ttl_days * 24 * 60 * 60)
+
+    data = None
+    if snapshot_is_current and not refresh:
+        data = snapshot['data']
+    elif not reference_data_is_offline(offline):
+        try:
+            fetched = fetcher(url)
+            if fetched and all(len(table) > 0 for table in fetched.values() if isinstance(table, dict)):
+                data = write_reference_snapshot(name, url, fetched, cache_folder)['data']
+            else:
+                print('nothing could be read from ' + url)
+        except Exception as error:
+            print('could not download ' + name + ' from ' + url + ': ' + str(error))
+    if data is None and snapshot is not None:
+        print('using the ' + name + ' snapshot from ' + time.strftime('%Y-%m-%d', time.localtime(snapshot.get('fetched_at', 0))))
+        data = snapshot['data']
+    if data is None:
+        print('using the bundled copy of ' + name)
+        data = read_bundled_reference(name)
+
+    _loaded_reference_data[memo_key] = data
+    return copy.deepcopy(data)
+
+
+def clear_loaded_reference_data():
+    """Used to forget the reference tables loaded in this process, so the next call goes back to the snapshots."""
+    _loaded_reference_data.clear()
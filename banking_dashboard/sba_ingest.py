@@ -0,0 +1,112 @@
+# helper function to download and read in the sba FOIA - 7(a) loan file. The geocoder is only imported once the loans are
+# ready to be geocoded
+
+import os
+import time
+import numpy as np
+import pandas as pd
+from code_tables import decode_column
+from geo_keys import format_census_tracts
+from zip_counties import zip_county_names
+from common_fcns import state_abbrevs, fcc_fips_mappings
+
+def sba_data_ingester(url: str,
+                      analysis_yr: str,
+                      data_folder: str) -> pd.core.frame.DataFrame:  
+    """Takes in url of sba FOIA - 7(a) csv file, downloads it, cleans it and retuns a pandas dataframe of the file.
+    
+    Args:
+        url: The url of the downloaded csv file from the census tract website.
+        
+    Returns:
+         A dataframe of the downloaded and cleaned csv file.    
+    """
+    import requests
+    file_name = url.split('/')[-1]
+    # way 2
+    # sba_file_year = '20' + re.findall('\d+',file.split('-')[-1])[0][0:2] # split file name, grab portion containing data, get year 
+    year_lower_bound = str(int(analysis_yr) - 1) + '-12-31'
+    year_upper_bound = str(int(year_lower_bound.split('-')[0]) + 2) + '-01-01'
+    r = requests.get(url, allow_redirects = True)
+    open(file_name,'wb').write(r.content)
+    foia_7a_df = pd.read_csv(file_name, encoding = 'latin-1')
+    # lower all column names and rename soldsecmr string containing column to SOLDSECMRTIND
+    foia_7a_df.columns = ['SOLDSECMRTIND' if 'soldsecmr' in column_name else column_name.lower() for column_name in foia_7a_df.columns]
+    # map in vales for intries in columns
+    foia_7a_df['deliverymethod'] = decode_column(foia_7a_df['deliverymethod'], 'sba_delivery_method')
+    
+    foia_7a_df['loanstatus'] = decode_column(foia_7a_df['loanstatus'], 'sba_loan_status')
+    
+    foia_7a_df['revolverstatus'] = decode_column(foia_7a_df['revolverstatus'], 'sba_revolver_status')
+    
+    foia_7a_df['SOLDSECMRTIND'] = decode_column(foia_7a_df['SOLDSECMRTIND'], 'sba_sold_secondary_market')
+    
+    test_dct = {'borrname':"Borrower name",
+    "borrstreet":"Borrower street address",
+    "borrcity":"Borrower city",
+    "borrstate":"Borrower state",
+    "borrzip":"Borrower zip code",
+    "grossapproval":"Total loan amount",
+    "subpgmdesc":"Subprogram description"}
+    
+    new_columns = [test_dct.get(column) if column in test_dct.keys() else column for column in foia_7a_df.columns]
+    foia_7a_df.columns = new_columns
+
+    # map in full state names
+    state_abbrev_map = state_abbrevs()
+    foia_7a_df['Borrower state'] = foia_7a_df['Borrower state'].map(state_abbrev_map)
+
+    # subset for entries that have an approval date in analysis year and remove leading and trailing whitespace from columns names
+    foia_7a_df['approvaldate'] = pd.to_datetime(foia_7a_df['approvaldate'], format = '%m/%d/%Y')
+    foia_7a_df = foia_7a_df[(foia_7a_df['approvaldate'] > year_lower_bound) & (foia_7a_df['approvaldate'] < year_upper_bound)]
+    foia_7a_df = foia_7a_df[foia_7a_df['Borrower state'] == 'TEXAS']
+    foia_7a_df = foia_7a_df.rename(columns = lambda x: x.strip())
+
+    # create county column based on zipcodes column 
+    foia_7a_df['County_from_Zipcode'] = zip_county_names(foia_7a_df['Borrower zip code'], counties = ["Dallas","Collin","Tarrant"])
+
+    # create columns for census tract and county  based on borrower address
+    #foia_7adf['Full Address'] = foia_7a_df['Borrower street address'] + ', ' + foia_7a_df['Borrower city'] + ', ' + foia_7a_df['Borrower state'] + ' ' + foia_7a_df['Borrower zip code'].apply(str)
+    # tqdm.pandas()
+    # foia_7a_df['data_from_adr_geocode'] = foia_7a_df['Full Address'].progress_apply(lambda x: get_census_geocode(x))
+    # foia_7a_df['county_from_address'] = foia_7a_df['data_from_adr_geocode'].apply(lambda x: x['county'])
+    # foia_7a_df['county_from_address'] = foia_7a_df['county_from_address'] + ' County'
+    # foia_7a_df['census_tract_from_address'] = foia_7a_df['data_from_adr_geocode'].apply(lambda x: x['census_tract'])
+    # foia_7a_df['census_tract_from_address'] = foia_7a_df['census_tract_from_address'].fillna(value = np.nan).apply(float)/100
+    # foia_7a_df['census_tract_from_address'] = foia_7a_df['census_tract_from_address'].apply(format_census_tract)
+    # foia_7a_df = foia_7a_df.drop(columns = ['Full Address'])
+
+    # create a subset dataset of the sba data that will be used to batch search for census and related geographic information 
+    foia_7a_df = foia_7a_df.reset_index()
+    foia_7a_df['index'] = foia_7a_df['index'].apply(str)
+    foia_7a_df['Borrower name'] = '(' + foia_7a_df['index'] +') '+  foia_7a_df['Borrower name'] 
+    foia_7a_df[['Borrower name','Borrower street address','Borrower city', 'Borrower state','Borrower zip code']].set_index('Borrower name').to_csv(os.path.join(data_folder,'sba_sample.csv'))
+
+    # lookup census codes for batch (loans to the same borrower address are geocoded once)
+    from geocoding import census_batch_lookup
+    start = time.time()
+    b = census_batch_lookup(os.path.join(data_folder,'sba_sample.csv'), 'borrower')
+    end = time.time()
+    print('process completed in',end - start, 'seconds')
+
+    # merge in new census codes to original dataset
+    b = b.reset_index()
+    b['index'] = b['borrower identifier'].str.split(')').replace('(','').apply(lambda x: x[0].replace('(',''))
+    foia_7a_df = pd.merge(foia_7a_df,b, left_on = ['index'], right_on = ['index'], how = 'left')
+    
+    # reformat census tract column
+    foia_7a_df['_tract'] = foia_7a_df['_tract'].apply(float)/100
+    foia_7a_df['_tract'] = format_census_tracts(foia_7a_df['_tract'])
+
+    # map in county names 
+    fips_dict = fcc_fips_mappings()
+    foia_7a_df['_county_fips_code'] = foia_7a_df['_state_fips_code'].apply(str) + foia_7a_df['_county_fips_code'].apply(str)
+    foia_7a_df['_county_fips_code'] = foia_7a_df['_county_fips_code'].map(fips_dict['fcc_counties'])
+    foia_7a_df['_state_fips_code'] = foia_7a_df['_state_fips_code'].map(fips_dict['fcc_states'])
+    foia_7a_df = foia_7a_df.rename(columns = {'_county_fips_code':'_fips_county_name', '_state_fips_code':'_fips_state_name'})
+
+    # create "county_final" column that will be based on address at default and zip codes county of NaN and then filter down to counties of focus using this new column
+    foia_7a_df['county_final'] = np.where(foia_7a_df['_fips_county_name'].apply(str) == 'nan', foia_7a_df['County_from_Zipcode'], foia_7a_df['_fips_county_name'])
+    foia_7a_df = foia_7a_df[(foia_7a_df['county_final'] == 'Tarrant County') | (foia_7a_df['county_final'] == 'Collin County') | (foia_7a_df['county_final'] == 'Dallas County')]
+
+    return foia_7a_df
@@ -0,0 +1,108 @@
+# helper functions to find the source data files in a data folder and open them, either as plain files or straight out
+# of the zip archives they are downloaded in, so the archives never have to be extracted to disk
+
+import os
+import zipfile
+
+
+def source_archives(data_folder: str) -> list[str]:
+    """Used to list the zip archives in a data folder.
+
+    Args:
+        data_folder: folder holding the source data files.
+
+    Returns:
+        A sorted list of zip archive paths.
+    """
+    if not os.path.isdir(data_folder):
+        return []
+    return [os.path.join(data_folder, file) for file in sorted(os.listdir(data_folder)) if file.lower().endswith('.zip')]
+
+
+def find_source_file(data_folder: str, file_name: str) -> tuple:
+    """Used to find a source data file in a data folder. A plain file with the name is used if there is one, otherwise
+    the zip archives in the folder are searched for a member with the name (ignoring the folders inside the archive,
+    and ignoring case if there is no exact match).
+
+    Args:
+        data_folder: folder holding the source data files.
+        file_name: name of the source data file (ex: '2022_public_lar_csv.csv').
+
+    Returns:
+        A tuple of the file path and the archive member name. The member name is None for plain files, otherwise the
+        path is the path of the zip archive.
+
+    Raises:
+        FileNotFoundError: if the file is not in the folder or any of its zip archives.
+    """
+    file_path = os.path.join(data_folder, file_name)
+    if os.path.isfile(file_path):
+        return file_path, None
+    case_matches = []
+    for archive_path in source_archives(data_folder):
+        with zipfile.ZipFile(archive_path) as archive:
+            for member in archive.namelist():
+                member_name = member.rsplit('/', 1)[-1]
+                if member_name == file_name:
+                    return archive_path, member
+                if member_name.lower() == file_name.lower():
+                    case_matches.append((archive_path, member))
+    if len(case_matches) > 0:
+        return case_matches[0]
+    raise FileNotFoundError(file_name + ' not found in ' + data_folder + ' or any of its zip archives')
+
+
+def source_file_names(data_folder: str) -> list[str]:
+    """Used to list the names of the source data files in a data folder, including the members of its zip archives.
+
+    Args:
+        data_folder: folder holding the source data files.
+
+    Returns:
+        A sorted list of file names. Archive members are listed without the folders inside the archive.
+    """
+    if not os.path.isdir(data_folder):
+        return []
+    file_names = {file for file in os.listdir(data_folder) if os.path.isfile(os.path.join(data_folder, file))}
+    for archive_path in source_archives(data_folder):
+        with zipfile.ZipFile(archive_path) as archive:
+            file_names.update(member.rsplit('/', 1)[-1] for member in archive.namelist() if not member.endswith('/'))
+    return sorted(file_names)
+
+
+def open_source_file(data_folder: str, file_name: str):
+    """Used to open a source data file for reading, streaming it out of its zip archive if it is not a plain file. The
+    archive member is decompressed as it is read, nothing is written to disk.
+
+    Args:
+        data_folder: folder holding the source data files.
+        file_name: name of the source data file.
+
+    Returns:
+        A binary file object. Use it in a with statement so the file (and its archive) are closed.
+    """
+    file_path, member = find_source_file(data_folder, file_name)
+    if member is None:
+        return open(file_path, 'rb')
+    # the member keeps the archive's file handle open until the member itself is closed
+    with zipfile.ZipFile(file_path) as archive:
+        return archive.open(member)
+
+
+
+def source_file_size(data_folder: str, file_name: str) -> int:
+    """Used to get the size of a source data file. For archive members this is the uncompressed size, which is what
+    is read in when the member is streamed out of its archive.
+
+    Args:
+        data_folder: folder holding the source data files.
+        file_name: name of the source data file.
+
+    Returns:
+        The size of the file in bytes.
+    """
+    file_path, member = find_source_file(data_folder, file_name)
+    if member is None:
+        return os.path.getsize(file_path)
+    with zipfile.ZipFile(file_path) as archive:
+        return archive.getinfo(member).file_size
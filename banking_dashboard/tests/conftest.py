@@ -0,0 +1,6 @@
+# the banking_dashboard modules are imported by name (ex: from code_tables import decode_column) the same way the
+# notebooks import them, so put the banking_dashboard folder on the import path for the tests
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,43 @@
+import pandas as pd
+from code_tables import decode_column, decode_columns, code_tables
+from hmda_ingest import hmda_lar_mapper
+
+
+def test_decode_column_matches_map():
+    column = pd.Series([1, 2, 2, None, 7, 1], index = [5, 4, 3, 2, 1, 0], name = 'loan_type')
+    table = code_tables['hmda_lar_loan_type']
+    expected = column.map(table)
+    decoded = decode_column(column, table)
+    assert decoded.dtype == object
+    pd.testing.assert_series_equal(decoded, expected)
+
+
+def test_decode_column_fill_value():
+    column = pd.Series([1, 7, None])
+    decoded = decode_column(column, 'hmda_lar_loan_type', fill_value = 'unknown')
+    assert list(decoded) == [code_tables['hmda_lar_loan_type'][1], 'unknown', 'unknown']
+
+
+def test_decode_column_categorical():
+    column = pd.Series([1, 2, 2, 7], name = 'loan_type')
+    table = code_tables['hmda_lar_loan_type']
+    decoded = decode_column(column, table, categorical = True)
+    assert isinstance(decoded.dtype, pd.CategoricalDtype)
+    assert list(decoded.cat.categories) == list(dict.fromkeys(table.values()))
+    pd.testing.assert_series_equal(decoded.astype(object), column.map(table))
+
+
+def test_decode_columns_categorical_skips_missing_columns():
+    df = pd.DataFrame({'loan_type': [1, 2], 'other': [1, 2]})
+    df = decode_columns(df, {'loan_type': 'hmda_lar_loan_type', 'lien_status': 'hmda_lar_lien_status'},
+                        categorical = True)
+    assert isinstance(df['loan_type'].dtype, pd.CategoricalDtype)
+    assert list(df['other']) == [1, 2]
+
+
+def test_hmda_lar_mapper_decodes_to_categoricals():
+    lar_df_chunk = pd.DataFrame({'loan_type': [1, 2], 'aus_4': [1, 2], 'lei': ['a', 'b']})
+    lar_df_chunk = hmda_lar_mapper(lar_df_chunk)
+    assert isinstance(lar_df_chunk['loan_type'].dtype, pd.CategoricalDtype)
+    assert isinstance(lar_df_chunk['aus-4'].dtype, pd.CategoricalDtype)
+    assert lar_df_chunk['lei'].dtype == object
@@ -0,0 +1,61 @@
+import io
+import os
+import zipfile
+import numpy as np
+import pandas as pd
+import pytest
+from cra_index import read_cra_counties, cra_index_path
+from cra_layouts import cra_fwf_dimensions
+
+dat_file = 'cra2022_Aggr_A11.dat'
+
+
+def write_aggregate_file(folder, rows: int = 3000, newline: str = '\n', seed: int = 0) -> pd.core.frame.DataFrame:
+    """Used to write a synthetic A1-1 aggregate file, mostly sorted by state and county like the published files but with
+    a few records out of order, and to read the whole file back in with pd.read_fwf."""
+    rng = np.random.default_rng(seed)
+    widths, names = cra_fwf_dimensions['a11']
+    states = np.sort(rng.choice(['48', '01', '06', '  '], rows))
+    counties = rng.choice(['113', '085', '439', ' 85', '   ', '001'], rows)
+    order = np.lexsort((counties, states))
+    states, counties = states[order], counties[order]
+    swapped = rng.choice(rows, 20, replace = False)
+    states[swapped], counties[swapped] = states[swapped[::-1]], counties[swapped[::-1]]
+    lines = ['A1-1 2022' + str(1 + row % 2) + '4' + states[row] + counties[row] + '%05d' % (row % 99999) +
+             '%07d' % row + ''.join(rng.choice(list('0123456789 '), sum(widths) - 28)) for row in range(rows)]
+    content = (newline.join(lines) + newline).encode()
+    (folder / dat_file).write_bytes(content)
+    return pd.read_fwf(io.BytesIO(content), widths = widths, header = None, names = names)
+
+
+def county_keys(full: pd.core.frame.DataFrame) -> pd.Series:
+    states = full['State'].map(lambda state: '' if pd.isna(state) else str(int(state)).zfill(2))
+    counties = full['County'].map(lambda county: '' if pd.isna(county) else str(int(county)).zfill(3))
+    return states + counties
+
+
+@pytest.mark.parametrize('newline', ['\n', '\r\n'])
+@pytest.mark.parametrize('county_codes', [['48113', '48085'], ['06'], ['01001', '99999'], []])
+def test_read_cra_counties_matches_full_read(tmp_path, newline, county_codes):
+    full = write_aggregate_file(tmp_path, newline = newline)
+    expected = full[county_keys(full).isin(county_codes).to_numpy()].reset_index(drop = True)
+    got = read_cra_counties(str(tmp_path), dat_file, county_codes)
+    assert len(got) == len(expected)
+    pd.testing.assert_frame_equal(got, expected, check_dtype = False)
+
+
+def test_read_cra_counties_rebuilds_stale_index(tmp_path):
+    write_aggregate_file(tmp_path, seed = 1)
+    read_cra_counties(str(tmp_path), dat_file, ['48113'])
+    assert os.path.exists(cra_index_path(str(tmp_path / dat_file)))
+    full = write_aggregate_file(tmp_path, rows = 1000, seed = 2)
+    expected = full[county_keys(full).isin(['48113']).to_numpy()].reset_index(drop = True)
+    pd.testing.assert_frame_equal(read_cra_counties(str(tmp_path), dat_file, ['48113']), expected, check_dtype = False)
+
+
+def test_read_cra_counties_rejects_zip_members(tmp_path):
+    write_aggregate_file(tmp_path)
+    with zipfile.ZipFile(tmp_path / '22exp_aggr.zip', 'w') as archive:
+        archive.write(tmp_path / dat_file, 'cra2022_Aggr_A12.dat')
+    with pytest.raises(ValueError):
+        read_cra_counties(str(tmp_path), 'cra2022_Aggr_A12.dat', ['48113'])
@@ -0,0 +1,46 @@
+import io
+import numpy as np
+import pandas as pd
+import pytest
+from fixed_width import read_fixed_width
+
+field_values = {'digits': ['0012', '4800', '0000', '9999'],
+                'padded': ['  12', '   1', '  85', '1234'],
+                'blanks': ['0012', '    ', '0085', '    '],
+                'text': ['BANK', 'A   ', '  NA', 'a,b '],
+                'decimal': ['1.50', ' 3.2', '   0', '.5  '],
+                'mixed': ['01  ', 'A1  ', '    ', '-3  ']}
+
+
+def fixed_width_bytes(rows: int, kinds: list[str], newline: str = '\n', seed: int = 0) -> bytes:
+    rng = np.random.default_rng(seed)
+    lines = [''.join(rng.choice(field_values[kind]) for kind in kinds) for _ in range(rows)]
+    return (newline.join(lines) + newline).encode()
+
+
+@pytest.mark.parametrize('kinds', [['digits', 'padded', 'text'],
+                                   ['blanks', 'decimal', 'mixed'],
+                                   ['text', 'digits', 'blanks', 'decimal']])
+@pytest.mark.parametrize('newline', ['\n', '\r\n'])
+def test_read_fixed_width_matches_read_fwf(kinds, newline):
+    buffer = fixed_width_bytes(200, kinds, newline)
+    widths = [4] * len(kinds)
+    names = ['field_' + str(position) for position in range(len(kinds))]
+    expected = pd.read_fwf(io.BytesIO(buffer), widths = widths, header = None, names = names)
+    pd.testing.assert_frame_equal(read_fixed_width(io.BytesIO(buffer), widths, names), expected)
+
+
+def test_read_fixed_width_without_trailing_newline(tmp_path):
+    buffer = fixed_width_bytes(50, ['digits', 'text'])[:-1]
+    (tmp_path / 'records.dat').write_bytes(buffer)
+    expected = pd.read_fwf(io.BytesIO(buffer), widths = [4, 4], header = None, names = ['a', 'b'])
+    pd.testing.assert_frame_equal(read_fixed_width(str(tmp_path / 'records.dat'), [4, 4], ['a', 'b']), expected)
+
+
+def test_read_fixed_width_record_filter():
+    buffer = fixed_width_bytes(300, ['padded', 'digits', 'text'], seed = 1)
+    names = ['State', 'County', 'Name']
+    full = pd.read_fwf(io.BytesIO(buffer), widths = [4, 4, 4], header = None, names = names)
+    expected = full[full['State'].isin([12, 85]) & full['County'].isin([4800])]
+    got = read_fixed_width(io.BytesIO(buffer), [4, 4, 4], names, record_filter = {'State': ['12', '85'], 'County': ['4800']})
+    pd.testing.assert_frame_equal(got, expected, check_dtype = False)
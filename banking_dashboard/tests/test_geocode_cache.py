@@ -0,0 +1,37 @@
+import time
+from geocode_cache import (open_geocode_cache, read_geocode_cache, write_geocode_cache, normalize_geocode_address,
+                           geocode_no_match_max_age_days)
+
+
+def age_records(connection, days: float):
+    with connection:
+        connection.execute('update geocodes set geocoded_at = ?', [time.time() - days * 24 * 60 * 60])
+
+
+def test_no_match_answers_expire(tmp_path):
+    connection = open_geocode_cache(str(tmp_path / 'geocode_cache.sqlite'))
+    records = {'match': ['1 MAIN ST', 'Match', 'Exact'], 'no match': ['2 MAIN ST', 'No_Match'], 'tie': ['3 MAIN ST', 'Tie']}
+    write_geocode_cache(connection, records, 'Current', 'Current', 'All')
+    assert read_geocode_cache(connection, list(records), 'CURRENT', 'CURRENT', 'all') == records
+
+    age_records(connection, geocode_no_match_max_age_days - 1)
+    assert read_geocode_cache(connection, list(records), 'CURRENT', 'CURRENT', 'all') == records
+
+    age_records(connection, geocode_no_match_max_age_days + 1)
+    assert read_geocode_cache(connection, list(records), 'CURRENT', 'CURRENT', 'all') == {'match': records['match']}
+    assert read_geocode_cache(connection, list(records), 'CURRENT', 'CURRENT', 'all',
+                              no_match_max_age_days = None) == records
+    assert read_geocode_cache(connection, list(records), 'CURRENT', 'CURRENT', 'all', max_age_days = 1) == {}
+    connection.close()
+
+
+def test_cache_is_keyed_by_benchmark_and_vintage(tmp_path):
+    connection = open_geocode_cache(str(tmp_path / 'geocode_cache.sqlite'))
+    write_geocode_cache(connection, {'match': ['1 MAIN ST', 'Match']}, 'Current', 'Current', 'all')
+    assert read_geocode_cache(connection, ['match'], 'Public_AR_Current', 'Current', 'all') == {}
+    connection.close()
+
+
+def test_normalize_geocode_address():
+    assert (normalize_geocode_address('123 North Main Street, Suite 400', 'Dallas', 'tx', '75201-1234') ==
+            normalize_geocode_address('123 N. MAIN ST', ' DALLAS ', 'TX', 75201))
@@ -0,0 +1,75 @@
+import threading
+import time
+import pytest
+import geocoding
+from geocoding import geocode_batches
+
+
+@pytest.fixture
+def sent_batches(monkeypatch):
+    """Used to stand in for geocode_batch. Records each request and fails the requests whose numbers are in
+    sent['fail']."""
+    sent = {'timeouts': [], 'times': [], 'first_ids': [], 'fail': set()}
+    lock = threading.Lock()
+
+    def fake_geocode_batch(rows, benchmark, vintage, layers, geocoder_url = None, timeout = 600):
+        with lock:
+            request_number = len(sent['times'])
+            sent['timeouts'].append(timeout)
+            sent['times'].append(time.monotonic())
+            sent['first_ids'].append(rows[0][0])
+        time.sleep(0.02)
+        if request_number in sent['fail']:
+            raise RuntimeError('the census geocoder returned status code 503')
+        return [[row[0], row[1], 'Match'] for row in reversed(rows)]
+
+    monkeypatch.setattr(geocoding, 'geocode_batch', fake_geocode_batch)
+    return sent
+
+
+def address_rows(count: int) -> list[list[str]]:
+    return [[str(number), str(number) + ' MAIN ST', 'DALLAS', 'TX', '75201'] for number in range(count)]
+
+
+def test_geocode_batches_keeps_row_order(sent_batches):
+    records = geocode_batches(address_rows(55), 'Current', 'Current', 'all', batch_rows = 10, max_workers = 3)
+    assert [record[0] for record in records] == [str(number) for number in range(55)]
+    assert len(sent_batches['times']) == 6
+
+
+def test_geocode_batches_passes_timeout_to_every_request(sent_batches):
+    sent_batches['fail'] = {1, 2}
+    geocode_batches(address_rows(60), 'Current', 'Current', 'all', batch_rows = 10, max_workers = 3, timeout = 42)
+    assert len(sent_batches['timeouts']) == 8
+    assert set(sent_batches['timeouts']) == {42}
+
+
+def test_geocode_batches_waits_before_retrying(sent_batches, monkeypatch):
+    waits = []
+
+    def fake_uniform(low, high):
+        waits.append((low, high))
+        return 0.1
+
+    monkeypatch.setattr(geocoding.random, 'uniform', fake_uniform)
+    sent_batches['fail'] = {0, 1}
+    records = geocode_batches(address_rows(5), 'Current', 'Current', 'all', batch_rows = 10)
+    assert len(records) == 5
+    assert waits == [(0.5, 1), (0.5, 1)]
+    # the wait grows with the number of tries: 0.1 * 2 seconds after the first failure, 0.1 * 4 after the second
+    gaps = [later - earlier for earlier, later in zip(sent_batches['times'], sent_batches['times'][1:])]
+    assert gaps[0] >= 0.2 and gaps[1] >= 0.4
+    assert gaps[1] < 2
+
+
+def test_geocode_batches_gives_up(sent_batches, monkeypatch):
+    monkeypatch.setattr(geocoding.random, 'uniform', lambda low, high: 0.01)
+    sent_batches['fail'] = set(range(10))
+    with pytest.raises(RuntimeError):
+        geocode_batches(address_rows(5), 'Current', 'Current', 'all', max_tries = 3)
+    assert len(sent_batches['times']) == 3
+
+
+def test_geocode_batches_batch_size_limit():
+    with pytest.raises(ValueError):
+        geocode_batches(address_rows(5), 'Current', 'Current', 'all', batch_rows = geocoding.geocoder_max_batch_rows + 1)
@@ -0,0 +1,130 @@
+import os
+import struct
+import zipfile
+import numpy as np
+import pandas as pd
+import pytest
+import tract_assigner
+from tract_assigner import assign_polygons, assign_tracts, load_tract_index, tract_index_path
+
+
+def write_shapefile(path, polygons: list[list[np.ndarray]]):
+    """Used to write polygons (lists of closed rings of x, y points) to a polygon .shp file."""
+    records = b''
+    for number, rings in enumerate(polygons):
+        points = np.vstack(rings)
+        parts = np.cumsum([0] + [len(ring) for ring in rings[:-1]])
+        content = struct.pack('<i', 5) + struct.pack('<4d', *points.min(axis = 0), *points.max(axis = 0))
+        content += struct.pack('<ii', len(rings), len(points))
+        content += np.asarray(parts, dtype = '<i4').tobytes() + np.asarray(points, dtype = '<f8').tobytes()
+        records += struct.pack('>ii', number + 1, len(content) // 2) + content
+    header = struct.pack('>i', 9994) + b'\0' * 20 + struct.pack('>i', (100 + len(records)) // 2)
+    header += struct.pack('<ii', 1000, 5) + b'\0' * 64
+    path.write_bytes(header + records)
+
+
+def write_dbf(path, df: pd.core.frame.DataFrame):
+    """Used to write a dataframe of text columns to a .dbf file."""
+    fields = [(column, int(df[column].str.len().max())) for column in df.columns]
+    record_length = 1 + sum(width for _, width in fields)
+    header = bytes([3, 24, 1, 1]) + struct.pack('<ihh', len(df), 32 + 32 * len(fields) + 1, record_length) + b'\0' * 20
+    for name, width in fields:
+        header += name.encode().ljust(11, b'\0') + b'C' + b'\0' * 4 + bytes([width, 0]) + b'\0' * 14
+    body = b''.join(b' ' + b''.join(str(value).encode().ljust(width) for value, (_, width) in zip(row, fields))
+                    for row in df.itertuples(index = False))
+    path.write_bytes(header + b'\r' + body + b'\x1a')
+
+
+def tract_polygons(cells: int = 8, seed: int = 0) -> list[list[np.ndarray]]:
+    """Used to make a grid of jittered, clockwise quadrilateral tracts with shared edges, with a hole in the first tract
+    filled by an extra tract and a second part far away for the second tract."""
+    rng = np.random.default_rng(seed)
+    grid = np.linspace(0, cells * 0.05, cells + 1)
+    x, y = np.meshgrid(grid - 97.5, grid + 32.5)
+    x[1:-1, 1:-1] += rng.uniform(-0.015, 0.015, (cells - 1, cells - 1))
+    y[1:-1, 1:-1] += rng.uniform(-0.015, 0.015, (cells - 1, cells - 1))
+    polygons = []
+    for row in range(cells):
+        for column in range(cells):
+            corners = [(row, column), (row + 1, column), (row + 1, column + 1), (row, column + 1), (row, column)]
+            polygons.append([np.array([[x[corner], y[corner]] for corner in corners])])
+    center_x, center_y = polygons[0][0][:-1].mean(axis = 0)
+    hole = np.array([[center_x - 0.005, center_y - 0.005], [center_x + 0.005, center_y - 0.005],
+                     [center_x + 0.005, center_y + 0.005], [center_x - 0.005, center_y + 0.005],
+                     [center_x - 0.005, center_y - 0.005]])
+    polygons[0].append(hole)
+    polygons.append([hole[::-1].copy()])
+    polygons[1].append(np.array([[-95.0, 30.0], [-94.9, 30.1], [-94.8, 30.0], [-95.0, 30.0]]))
+    return polygons
+
+
+def brute_force_polygons(x: np.ndarray, y: np.ndarray, polygons: list[list[np.ndarray]]) -> np.ndarray:
+    """Used to find the polygon of each point with an even-odd ray casting test against every edge of every polygon."""
+    polygon_numbers = np.full(len(x), -1)
+    for number, rings in enumerate(polygons):
+        inside = np.zeros(len(x), dtype = bool)
+        for ring in rings:
+            for (x1, y1), (x2, y2) in zip(ring[:-1], ring[1:]):
+                crossing_x = x1 + (y - y1) * (x2 - x1) / (y2 - y1 if y2 != y1 else 1)
+                inside ^= ((y1 > y) != (y2 > y)) & (x < crossing_x)
+        polygon_numbers[inside] = number
+    return polygon_numbers
+
+
+@pytest.fixture
+def tract_folder(tmp_path):
+    polygons = tract_polygons()
+    tract_count = len(polygons)
+    tracts = pd.DataFrame({'STATEFP': ['48'] * tract_count,
+                           'COUNTYFP': ['%03d' % (number % 254 + 1) for number in range(tract_count)],
+                           'TRACTCE': ['%06d' % (number * 100) for number in range(tract_count)]})
+    write_shapefile(tmp_path / 'tl_test_tract.shp', polygons)
+    write_dbf(tmp_path / 'tl_test_tract.dbf', tracts)
+    tract_assigner._loaded_tract_indexes.clear()
+    yield tmp_path, polygons, tracts
+    tract_assigner._loaded_tract_indexes.clear()
+
+
+def random_points(polygons: list[list[np.ndarray]], count: int = 5000, seed: int = 1) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    # spread the points over the grid of tracts (the first ring of each tract) and a little past its edges
+    points = np.vstack([rings[0] for rings in polygons])
+    x = rng.uniform(points[:, 0].min() - 0.05, points[:, 0].max() + 0.05, count)
+    y = rng.uniform(points[:, 1].min() - 0.05, points[:, 1].max() + 0.05, count)
+    hole_x, hole_y = polygons[0][1][:-1].mean(axis = 0)
+    return np.r_[x, hole_x, -94.9, np.nan], np.r_[y, hole_y, 30.03, 32.6]
+
+
+def test_assign_polygons_matches_brute_force(tract_folder):
+    folder, polygons, _ = tract_folder
+    x, y = random_points(polygons)
+    expected = brute_force_polygons(x, y, polygons)
+    got = assign_polygons(load_tract_index(str(folder), 'tl_test_tract.shp'), x, y)
+    np.testing.assert_array_equal(got, expected)
+    # the point in the hole belongs to the tract filling it and the far away point to the second part of tract 1
+    assert list(got[-3:]) == [len(polygons) - 1, 1, -1]
+
+
+def test_assign_tracts_codes(tract_folder):
+    folder, polygons, tracts = tract_folder
+    x, y = random_points(polygons, count = 500)
+    longitude = pd.Series(x, index = np.arange(len(x)) + 10)
+    tract_df = assign_tracts(longitude, pd.Series(y), str(folder), 'tl_test_tract.shp')
+    expected = brute_force_polygons(x, y, polygons)
+    assert list(tract_df.index) == list(longitude.index)
+    found = expected >= 0
+    assert list(tract_df['_tract'][found]) == list(tracts['TRACTCE'].to_numpy()[expected[found]])
+    assert list(tract_df['_county_fips_code'][found]) == list(tracts['COUNTYFP'].to_numpy()[expected[found]])
+    assert tract_df[~found].isna().all().all()
+
+
+def test_tract_index_is_saved_and_reused(tract_folder):
+    folder, polygons, _ = tract_folder
+    x, y = random_points(polygons, count = 500)
+    with zipfile.ZipFile(folder / 'tl_zipped_tract.zip', 'w') as archive:
+        archive.write(folder / 'tl_test_tract.shp', 'tl_zipped_tract.shp')
+        archive.write(folder / 'tl_test_tract.dbf', 'tl_zipped_tract.dbf')
+    first = assign_tracts(x, y, str(folder), 'tl_zipped_tract.shp')
+    assert os.path.exists(tract_index_path(str(folder), 'tl_zipped_tract.shp'))
+    tract_assigner._loaded_tract_indexes.clear()
+    pd.testing.assert_frame_equal(assign_tracts(x, y, str(folder), 'tl_zipped_tract.shp'), first)
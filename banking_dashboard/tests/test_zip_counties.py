@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+from common_fcns import county_to_countyzip_dict, zip_to_county_name
+from zip_counties import zip_county_names, zip_county_other
+
+
+def test_zip_county_names_matches_zip_sets():
+    rng = np.random.default_rng(0)
+    zip_codes = pd.Series(np.r_[rng.integers(75000, 76500, 2000), rng.integers(0, 99999, 200), [75201]])
+    county_zips = county_to_countyzip_dict(['Dallas', 'Collin', 'Tarrant'])
+    expected = zip_codes.apply(str).apply(lambda zip_code: zip_to_county_name(zip_code, county_zips))
+    got = zip_county_names(zip_codes, counties = ['Dallas', 'Collin', 'Tarrant'])
+    assert (got == expected).all()
+    assert got.iloc[-1] == 'Dallas County'
+
+
+def test_zip_county_names_text_zip_codes():
+    zip_codes = pd.Series(['75201-1234', ' 75201', 'x', None, '7520.5', '90210'], index = list('abcdef'))
+    got = zip_county_names(zip_codes, counties = ['Dallas County'])
+    assert list(got.index) == list('abcdef')
+    assert list(got) == ['Dallas County', 'Dallas County'] + [zip_county_other] * 4
+
+
+def test_zip_county_names_all_counties():
+    got = zip_county_names(pd.Series([75201.0, 76102.0, np.nan]))
+    assert list(got) == ['Dallas County', 'Tarrant County', zip_county_other]
@@ -0,0 +1,350 @@
+# helper functions to find the census tract of points (ex: fdic branch latitudes and longitudes) offline, from the census
+# TIGER/Line tract shapefiles (ex: tl_2022_48_tract.zip for Texas), instead of sending addresses to the census geocoder.
+# The tract polygons are put on a grid. Each grid cell keeps the tracts that cover it completely and the tract edges
+# that cross it, along with whether the cell's center is inside each of those tracts, so a point is placed by counting
+# the edges between it and its cell's center. All points are placed at once with numpy. The grid is saved next to the
+# shapefile (<shapefile>.index.npz) and rebuilt when the shapefile changes
+
+import os
+import numpy as np
+import pandas as pd
+from source_files import find_source_file, open_source_file
+
+# bumped when the layout of the saved grids changes so old ones get rebuilt
+tract_index_version = 1
+
+# average number of tract edges per grid cell the grid is sized for, and the most cells a grid can have
+tract_index_edges_per_cell = 8
+tract_index_max_cells = 4000000
+
+# points placed at a time, to bound the memory used
+tract_assign_chunk_points = 250000
+
+# grids already loaded in this process, by shapefile path
+_loaded_tract_indexes = {}
+
+
+def read_shapefile_polygons(shp_bytes: bytes) -> list[list[np.ndarray]]:
+    """Used to read the polygons of an ESRI shapefile (.shp). Only polygon shapefiles, like the TIGER/Line tract files,
+    are read.
+
+    Args:
+        shp_bytes: contents of the .shp file.
+
+    Returns:
+        A list with, for each record, a list of its rings as (n, 2) float64 arrays of x (longitude) and y (latitude).
+
+    Raises:
+        ValueError: if the file is not a polygon shapefile.
+    """
+    header = np.frombuffer(shp_bytes, dtype = '<i4', count = 9, offset = 24)
+    if int.from_bytes(shp_bytes[0:4], 'big') != 9994 or header[2] not in (5, 15, 25):
+        raise ValueError('not a polygon shapefile')
+    file_length = int.from_bytes(shp_bytes[24:28], 'big') * 2
+    polygons = []
+    position = 100
+    while position < file_length:
+        content_length = int.from_bytes(shp_bytes[position + 4:position + 8], 'big') * 2
+        content = position + 8
+        shape_type = int.from_bytes(shp_bytes[content:content + 4], 'little')
+        rings = []
+        if shape_type != 0:
+            part_count, point_count = np.frombuffer(shp_bytes, dtype = '<i4', count = 2, offset = content + 36)
+            parts = np.frombuffer(shp_bytes, dtype = '<i4', count = part_count, offset = content + 44)
+            points = np.frombuffer(shp_bytes, dtype = '<f8', count = point_count * 2,
+                                   offset = content + 44 + 4 * part_count).reshape(point_count, 2)
+            rings = np.split(points, parts[1:])
+        polygons.append(rings)
+        position = content + content_length
+    return polygons
+
+
+def read_dbf(dbf_bytes: bytes) -> pd.core.frame.DataFrame:
+    """Used to read the attribute table (.dbf) of a shapefile. Fields are read in as stripped text.
+
+    Args:
+        dbf_bytes: contents of the .dbf file.
+
+    Returns:
+        A dataframe with a row per record and a column per field.
+    """
+    record_count = int.from_bytes(dbf_bytes[4:8], 'little')
+    header_length = int.from_bytes(dbf_bytes[8:10], 'little')
+    record_length = int.from_bytes(dbf_bytes[10:12], 'little')
+    fields = []
+    position = 32
+    while dbf_bytes[position] != 0x0D:
+        fields.append((dbf_bytes[position:position + 11].split(b'\x00')[0].decode('ascii'), dbf_bytes[position + 16]))
+        position += 32
+    records = np.frombuffer(dbf_bytes, dtype = np.uint8, count = record_count * record_length,
+                            offset = header_length).reshape(record_count, record_length)
+    columns = {}
+    field_start = 1  # the first byte of each record is its deletion flag
+    for name, width in fields:
+        values = np.ascontiguousarray(records[:, field_start:field_start + width]).view('S' + str(width)).ravel()
+        columns[name] = pd.Series(values).str.decode('latin-1').str.strip()
+        field_start += width
+    return pd.DataFrame(columns)
+
+
+def read_tiger_tracts(data_folder: str, tract_file: str) -> dict:
+    """Used to read in a TIGER/Line tract shapefile.
+
+    Args:
+        data_folder: folder holding the shapefile, or the zip archive it was downloaded in.
+        tract_file: name of the .shp file (ex: 'tl_2022_48_tract.shp'). The .dbf file next to it is read too.
+
+    Returns:
+        A dictionary with the attribute table ('tracts', with the STATEFP, COUNTYFP, TRACTCE and GEOID fields) and the
+        rings of each tract ('polygons', see read_shapefile_polygons).
+    """
+    with open_source_file(data_folder, tract_file) as shp_file:
+        polygons = read_shapefile_polygons(shp_file.read())
+    with open_source_file(data_folder, os.path.splitext(tract_file)[0] + '.dbf') as dbf_file:
+        tracts = read_dbf(dbf_file.read())
+    return {'tracts': tracts, 'polygons': polygons}
+
+
+def _expand_ranges(starts: np.ndarray, counts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Used to list, for each of a set of ranges, its members. Returns the range of each member and the member."""
+    owners = np.repeat(np.arange(len(counts)), counts)
+    members = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(starts, counts)
+    return owners, members
+
+
+def _expand_cells(index: dict, x_min, y_min, x_max, y_max) -> tuple[np.ndarray, np.ndarray]:
+    """Used to list the grid cells each box overlaps. Returns the box of each (box, cell) pair and the cell."""
+    column_low = np.clip(((x_min - index['x0']) / index['dx']).astype(np.int64), 0, index['nx'] - 1)
+    column_high = np.clip(((x_max - index['x0']) / index['dx']).astype(np.int64), 0, index['nx'] - 1)
+    row_low = np.clip(((y_min - index['y0']) / index['dy']).astype(np.int64), 0, index['ny'] - 1)
+    row_high = np.clip(((y_max - index['y0']) / index['dy']).astype(np.int64), 0, index['ny'] - 1)
+    widths = column_high - column_low + 1
+    boxes, offsets = _expand_ranges(np.zeros(len(widths), dtype = np.int64), widths * (row_high - row_low + 1))
+    cells = (row_low[boxes] + offsets // widths[boxes]) * index['nx'] + column_low[boxes] + offsets % widths[boxes]
+    return boxes, cells
+
+
+def build_tract_index(polygons: list[list[np.ndarray]]) -> dict:
+    """Used to build the grid used to place points in polygons.
+
+    Args:
+        polygons: rings of each polygon (see read_shapefile_polygons). Holes are handled since points are placed by
+            counting edge crossings.
+
+    Returns:
+        A dictionary of numpy arrays: the grid's origin, cell size and shape, the (cell, polygon) pairs sorted by cell
+        ('pair_cell', 'pair_polygon', whether the cell is on the polygon's boundary, whether the cell's center is inside
+        the polygon and the range of the pair's edges) and the edges of the boundary pairs ('edges', x1, y1, x2, y2).
+    """
+    # every edge of every ring, closing rings that do not end on their first point
+    edge_lists = []
+    edge_polygons = []
+    for polygon_number, rings in enumerate(polygons):
+        for ring in rings:
+            if len(ring) < 3:
+                continue
+            if (ring[0] != ring[-1]).any():
+                ring = np.vstack([ring, ring[:1]])
+            edge_lists.append(np.hstack([ring[:-1], ring[1:]]))
+            edge_polygons.append(np.full(len(ring) - 1, polygon_number, dtype = np.int64))
+    edges = np.vstack(edge_lists) if edge_lists else np.zeros((0, 4))
+    edge_polygons = np.concatenate(edge_polygons) if edge_polygons else np.zeros(0, dtype = np.int64)
+    polygon_count = len(polygons)
+
+    # grid sized for a few edges per cell, with cells about as wide as they are tall
+    x0, y0 = edges[:, [0, 2]].min(), edges[:, [1, 3]].min()
+    width = max(edges[:, [0, 2]].max() - x0, 1e-9)
+    height = max(edges[:, [1, 3]].max() - y0, 1e-9)
+    cell_count = int(np.clip(len(edges) / tract_index_edges_per_cell, 1, tract_index_max_cells))
+    nx = int(np.clip(np.ceil(np.sqrt(cell_count * width / height)), 1, cell_count))
+    ny = int(max(np.ceil(cell_count / nx), 1))
+    index = {'index_version': tract_index_version, 'x0': x0, 'y0': y0, 'dx': width / nx * (1 + 1e-12),
+             'dy': height / ny * (1 + 1e-12), 'nx': nx, 'ny': ny}
+
+    # edges of each (cell, polygon) pair, for the cells each edge's bounding box overlaps
+    edge_numbers, edge_cells = _expand_cells(index, np.minimum(edges[:, 0], edges[:, 2]), np.minimum(edges[:, 1], edges[:, 3]),
+                                             np.maximum(edges[:, 0], edges[:, 2]), np.maximum(edges[:, 1], edges[:, 3]))
+    edge_keys = edge_cells * polygon_count + edge_polygons[edge_numbers]
+    order = np.argsort(edge_keys, kind = 'stable')
+    edge_keys, edge_numbers = edge_keys[order], edge_numbers[order]
+    boundary_keys, edge_starts, edge_counts = np.unique(edge_keys, return_index = True, return_counts = True)
+
+    # (cell, polygon) pairs for the cells each polygon's bounding box overlaps
+    polygon_numbers = np.unique(edge_polygons)
+    polygon_x_min = np.full(polygon_count, np.inf)
+    polygon_y_min = np.full(polygon_count, np.inf)
+    polygon_x_max = np.full(polygon_count, -np.inf)
+    polygon_y_max = np.full(polygon_count, -np.inf)
+    np.minimum.at(polygon_x_min, edge_polygons, np.minimum(edges[:, 0], edges[:, 2]))
+    np.minimum.at(polygon_y_min, edge_polygons, np.minimum(edges[:, 1], edges[:, 3]))
+    np.maximum.at(polygon_x_max, edge_polygons, np.maximum(edges[:, 0], edges[:, 2]))
+    np.maximum.at(polygon_y_max, edge_polygons, np.maximum(edges[:, 1], edges[:, 3]))
+    pair_polygons, pair_cells = _expand_cells(index, polygon_x_min[polygon_numbers], polygon_y_min[polygon_numbers],
+                                              polygon_x_max[polygon_numbers], polygon_y_max[polygon_numbers])
+    pair_polygons = polygon_numbers[pair_polygons]
+    pair_keys = pair_cells * polygon_count + pair_polygons
+
+    # whether each cell's center is inside each polygon, from the edges a ray from the left of the grid to the center
+    # crosses (edges cross the ray if one end is above the center's row and the other is not)
+    # (horizontal edges never cross the ray)
+    row_low = np.ceil((np.minimum(edges[:, 1], edges[:, 3]) - y0) / index['dy'] - 0.5).astype(np.int64)
+    row_high = np.floor((np.maximum(edges[:, 1], edges[:, 3]) - y0) / index['dy'] - 0.5).astype(np.int64)
+    row_counts = np.where(edges[:, 1] != edges[:, 3], np.maximum(np.minimum(row_high, ny - 1) - np.maximum(row_low, 0) + 1, 0), 0)
+    crossing_edges, crossing_rows = _expand_ranges(np.maximum(row_low, 0), row_counts)
+    row_y = y0 + (crossing_rows + 0.5) * index['dy']
+    x1, y1, x2, y2 = edges[crossing_edges].T
+    crosses = (y1 > row_y) != (y2 > row_y)
+    crossing_x = x1 + (row_y - y1) * (x2 - x1) / (y2 - y1)
+    span = width + 1.0
+    crossing_keys = np.sort(((edge_polygons[crossing_edges] * ny + crossing_rows) * span + (crossing_x - x0))[crosses])
+    pair_rows, pair_columns = pair_cells // nx, pair_cells % nx
+    group_keys = (pair_polygons * ny + pair_rows) * span
+    center_inside = (np.searchsorted(crossing_keys, group_keys + (pair_columns + 0.5) * index['dx']) -
+                     np.searchsorted(crossing_keys, group_keys)) % 2 == 1
+
+    # keep the boundary pairs and the pairs whose cell is inside the polygon
+    boundary_position = np.searchsorted(boundary_keys, pair_keys)
+    on_boundary = (boundary_position < len(boundary_keys)) & (boundary_keys[np.minimum(boundary_position, len(boundary_keys) - 1)] == pair_keys)
+    keep = on_boundary | center_inside
+    order = np.argsort(pair_keys[keep], kind = 'stable')
+    index.update({'pair_cell': pair_cells[keep][order],
+                  'pair_polygon': pair_polygons[keep][order],
+                  'pair_boundary': on_boundary[keep][order],
+                  'pair_center_inside': center_inside[keep][order],
+                  'pair_edge_start': np.where(on_boundary, edge_starts[np.minimum(boundary_position, len(boundary_keys) - 1)], 0)[keep][order],
+                  'pair_edge_count': np.where(on_boundary, edge_counts[np.minimum(boundary_position, len(boundary_keys) - 1)], 0)[keep][order],
+                  'edges': edges[edge_numbers]})
+    return index
+
+
+def _orientation(ax, ay, bx, by, cx, cy) -> np.ndarray:
+    """Used to find which side of the line from a to b the point c is on (positive on the left)."""
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+
+def assign_polygons(index: dict, longitude: np.ndarray, latitude: np.ndarray) -> np.ndarray:
+    """Used to find the polygon each point is in.
+
+    Args:
+        index: output of build_tract_index.
+        longitude: x of each point.
+        latitude: y of each point.
+
+    Returns:
+        The number of the polygon each point is in, -1 for points outside all of the polygons or with no coordinates.
+    """
+    longitude = np.asarray(longitude, dtype = np.float64)
+    latitude = np.asarray(latitude, dtype = np.float64)
+    polygon_numbers = np.full(len(longitude), -1, dtype = np.int64)
+    for start in range(0, len(longitude), tract_assign_chunk_points):
+        x = longitude[start:start + tract_assign_chunk_points]
+        y = latitude[start:start + tract_assign_chunk_points]
+        column = np.floor((x - index['x0']) / index['dx'])
+        row = np.floor((y - index['y0']) / index['dy'])
+        on_grid = (column >= 0) & (column < index['nx']) & (row >= 0) & (row < index['ny'])
+        cells = np.where(on_grid, row * index['nx'] + column, -1).astype(np.int64)
+
+        # every (point, pair) for the pairs of each point's cell
+        pair_low = np.searchsorted(index['pair_cell'], cells, 'left')
+        pair_high = np.searchsorted(index['pair_cell'], cells, 'right')
+        points, pairs = _expand_ranges(pair_low, pair_high - pair_low)
+        inside = ~index['pair_boundary'][pairs]
+
+        # boundary pairs: inside if the center is inside and an even number of edges cross the segment from the center
+        # to the point, or the other way around
+        boundary = np.flatnonzero(index['pair_boundary'][pairs])
+        tested, edge_numbers = _expand_ranges(index['pair_edge_start'][pairs[boundary]], index['pair_edge_count'][pairs[boundary]])
+        tested_points = points[boundary][tested]
+        center_x = index['x0'] + ((cells[tested_points] % index['nx']) + 0.5) * index['dx']
+        center_y = index['y0'] + ((cells[tested_points] // index['nx']) + 0.5) * index['dy']
+        point_x, point_y = x[tested_points], y[tested_points]
+        x1, y1, x2, y2 = index['edges'][edge_numbers].T
+        crosses = (((_orientation(center_x, center_y, point_x, point_y, x1, y1) > 0) !=
+                    (_orientation(center_x, center_y, point_x, point_y, x2, y2) > 0)) &
+                   ((_orientation(x1, y1, x2, y2, center_x, center_y) > 0) !=
+                    (_orientation(x1, y1, x2, y2, point_x, point_y) > 0)))
+        crossing_counts = np.bincount(tested, weights = crosses, minlength = len(boundary)).astype(np.int64)
+        inside[boundary] = index['pair_center_inside'][pairs[boundary]] != (crossing_counts % 2 == 1)
+
+        polygon_numbers[start + points[inside]] = index['pair_polygon'][pairs[inside]]
+    return polygon_numbers
+
+
+def tract_index_path(data_folder: str, tract_file: str) -> str:
+    """Used to get the path the grid of a tract shapefile is saved to.
+
+    Args:
+        data_folder: folder holding the shapefile, or the zip archive it was downloaded in.
+        tract_file: name of the .shp file.
+
+    Returns:
+        The path of the saved grid.
+    """
+    return os.path.join(data_folder, tract_file + '.index.npz')
+
+
+def load_tract_index(data_folder: str, tract_file: str) -> dict:
+    """Used to load the grid and tract codes of a TIGER/Line tract shapefile, building the grid first if it has not been
+    saved yet or the shapefile (or its zip archive) changed. Loaded once per process.
+
+    Args:
+        data_folder: folder holding the shapefile, or the zip archive it was downloaded in.
+        tract_file: name of the .shp file (ex: 'tl_2022_48_tract.shp').
+
+    Returns:
+        The grid (see build_tract_index) with the state, county and tract codes of each polygon ('state_fips_code',
+        'county_fips_code', 'tract').
+    """
+    source_path, _ = find_source_file(data_folder, tract_file)
+    source_stat = os.stat(source_path)
+    source_version = np.array([tract_index_version, source_stat.st_size, source_stat.st_mtime_ns], dtype = np.int64)
+    index_path = tract_index_path(data_folder, tract_file)
+    loaded = _loaded_tract_indexes.get(index_path)
+    if loaded is not None and (loaded['source_version'] == source_version).all():
+        return loaded
+
+    index = None
+    if os.path.exists(index_path):
+        with np.load(index_path, allow_pickle = False) as saved:
+            if 'source_version' in saved and (saved['source_version'] == source_version).all():
+                index = {key: saved[key] for key in saved.files}
+                for key in ['x0', 'y0', 'dx', 'dy']:
+                    index[key] = float(index[key])
+                for key in ['nx', 'ny']:
+                    index[key] = int(index[key])
+    if index is None:
+        print('building tract index for ' + tract_file)
+        tiger_tracts = read_tiger_tracts(data_folder, tract_file)
+        index = build_tract_index(tiger_tracts['polygons'])
+        index['state_fips_code'] = tiger_tracts['tracts']['STATEFP'].to_numpy(dtype = str)
+        index['county_fips_code'] = tiger_tracts['tracts']['COUNTYFP'].to_numpy(dtype = str)
+        index['tract'] = tiger_tracts['tracts']['TRACTCE'].to_numpy(dtype = str)
+        index['source_version'] = source_version
+        np.savez(index_path, **index)
+    _loaded_tract_indexes[index_path] = index
+    return index
+
+
+def assign_tracts(longitude, latitude, data_folder: str, tract_file: str) -> pd.core.frame.DataFrame:
+    """Used to find the census tract of each point offline, in the same columns census_batch_lookup gives.
+
+    Args:
+        longitude: longitude of each point.
+        latitude: latitude of each point.
+        data_folder: folder holding the tract shapefile, or the zip archive it was downloaded in.
+        tract_file: name of the TIGER/Line tract .shp file (ex: 'tl_2022_48_tract.shp').
+
+    Returns:
+        A dataframe with the two digit state code ('_state_fips_code'), three digit county code ('_county_fips_code')
+        and six digit tract code ('_tract') of each point, missing for points outside all of the tracts. Has the index
+        of longitude if it is a series.
+    """
+    index = load_tract_index(data_folder, tract_file)
+    polygon_numbers = assign_polygons(index, longitude, latitude)
+    found = polygon_numbers >= 0
+    columns = {}
+    for column, codes in [('_state_fips_code', 'state_fips_code'), ('_county_fips_code', 'county_fips_code'), ('_tract', 'tract')]:
+        values = np.full(len(polygon_numbers), np.nan, dtype = object)
+        values[found] = index[codes][polygon_numbers[found]]
+        columns[column] = values
+    return pd.DataFrame(columns, index = longitude.index if isinstance(longitude, pd.Series) else None)
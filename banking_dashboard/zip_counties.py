@@ -0,0 +1,96 @@
+# helper functions to look up the county of a zip code with one array lookup. The zipcodes database is scanned once per
+# state to build an array with an entry for every five digit zip code (100,000 entries) holding the position of the
+# zip code's county in a list of county names, so a whole column of zip codes is mapped to counties with a single
+# numpy gather instead of checking each zip code against sets of zip codes
+
+import numpy as np
+import pandas as pd
+
+# number of five digit zip codes, and so the length of the lookup arrays
+zip_code_count = 100000
+
+# value returned for zip codes outside of the counties looked up
+zip_county_other = 'Other'
+
+# lookups already built in this process, by state
+_zip_county_lookups = {}
+
+
+def build_zip_county_lookup(abbrev_state: str = 'TX') -> dict:
+    """Used to build the zip code to county lookup of a state from the zipcodes database.
+
+    Args:
+        abbrev_state: abbreviation of the state whose zip codes are looked up.
+
+    Returns:
+        A dictionary with the names of the state's counties ('counties', ex: 'Dallas County') and an int16 array with an
+        entry per five digit zip code holding the position of its county in 'counties' (-1 for zip codes that are not
+        in the state) ('county_positions').
+    """
+    # zipcodes loads its whole database when it is imported, so it is only imported once a lookup is built
+    import zipcodes
+    zip_records = [record for record in zipcodes.filter_by(state = abbrev_state) if record.get('county')]
+    counties = sorted({record['county'] for record in zip_records})
+    county_positions = np.full(zip_code_count, -1, dtype = np.int16)
+    zip_numbers = np.array([int(record['zip_code']) for record in zip_records], dtype = np.int64)
+    county_numbers = pd.Index(counties).get_indexer([record['county'] for record in zip_records])
+    county_positions[zip_numbers] = county_numbers
+    return {'counties': counties, 'county_positions': county_positions}
+
+
+def zip_county_lookup(abbrev_state: str = 'TX') -> dict:
+    """Used to get the zip code to county lookup of a state, building it the first time it is used in this process.
+
+    Args:
+        abbrev_state: abbreviation of the state whose zip codes are looked up.
+
+    Returns:
+        The lookup (see build_zip_county_lookup).
+    """
+    if abbrev_state not in _zip_county_lookups:
+        _zip_county_lookups[abbrev_state] = build_zip_county_lookup(abbrev_state)
+    return _zip_county_lookups[abbrev_state]
+
+
+def zip_numbers(zip_codes: pd.Series) -> np.ndarray:
+    """Used to turn a column of zip codes (numbers or text, with or without leading zeros or a +4 part like
+    '75201-1234') into integers that can index a lookup array.
+
+    Args:
+        zip_codes: column of zip codes.
+
+    Returns:
+        An int64 array with the five digit zip code of each row as an integer, -1 where the value is not a zip code.
+    """
+    if pd.api.types.is_numeric_dtype(zip_codes):
+        numbers = zip_codes.to_numpy(dtype = np.float64, na_value = np.nan)
+    else:
+        numbers = pd.to_numeric(zip_codes.astype(str).str.strip().str.split('-', n = 1).str[0],
+                                errors = 'coerce').to_numpy(dtype = np.float64, na_value = np.nan)
+    is_zip = (numbers >= 0) & (numbers < zip_code_count) & (numbers == np.floor(numbers))
+    return np.where(is_zip, numbers, -1).astype(np.int64)
+
+
+def zip_county_names(zip_codes: pd.Series, counties: list[str] = None, abbrev_state: str = 'TX') -> pd.Series:
+    """Used to get the county name of each zip code in a column.
+
+    Args:
+        zip_codes: column of zip codes (see zip_numbers).
+        counties: county names to return (ex: ['Dallas County', 'Collin County'], ' County' is added to names without
+            it like get_zip_codes does). Zip codes in any other county get zip_county_other. All of the state's counties
+            by default.
+        abbrev_state: abbreviation of the state whose zip codes are looked up.
+
+    Returns:
+        A series of county names with the index of zip_codes. Zip codes that are not in the state, or not in one of
+        counties, get zip_county_other.
+    """
+    lookup = zip_county_lookup(abbrev_state)
+    county_names = np.array(lookup['counties'] + [zip_county_other], dtype = object)
+    if counties is not None:
+        # counties that were not asked for are named as other zip codes
+        counties = [county if ' County' in county else county + ' County' for county in counties]
+        county_names[~np.isin(county_names, counties)] = zip_county_other
+    numbers = zip_numbers(zip_codes)
+    positions = np.where(numbers >= 0, lookup['county_positions'][np.maximum(numbers, 0)], -1)
+    return pd.Series(county_names[positions], index = zip_codes.index)